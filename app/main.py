@@ -12,6 +12,13 @@ import os
 import sys
 import atexit
 import glob
+import queue
+import shutil
+import threading
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from PIL import Image
 
 # 상위 디렉토리의 모듈들을 import하기 위한 경로 추가
@@ -21,7 +28,15 @@ sys.path.insert(0, parent_dir)
 
 try:
     from crawler.daum_crawler import DaumNewsCrawler
+    from crawler.http_cache import HttpCache
+    from crawler.seen_store import SeenArticleStore
+    from crawler.watermarks import KeywordWatermarks
+    from crawler.archive import HtmlArchive
+    from crawler.feed_crawler import FeedNewsCrawler
+    from crawler.cancellation import CancellationToken, CrawlCancelled
+    from crawler.blob_store import ArticleBlobStore
     from summarizer.text_summarizer import TextSummarizer
+    from summarizer.summary_cache import SummaryCache
     from sentiment_analysis.sentiment import SentimentAnalyzer
     from report.report_generator import NewsReportGenerator
     from report.email_sender import EmailSender
@@ -36,6 +51,13 @@ try:
     spec.loader.exec_module(keyword_extractor_module)
     KeywordExtractor = keyword_extractor_module.KeywordExtractor
     
+    # df_index 직접 로드
+    spec = importlib.util.spec_from_file_location("df_index", 
+                                                  os.path.join(parent_dir, "keyword", "df_index.py"))
+    df_index_module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(df_index_module)
+    DocumentFrequencyIndex = df_index_module.DocumentFrequencyIndex
+    
     # wordcloud_gen 직접 로드
     spec = importlib.util.spec_from_file_location("wordcloud_gen", 
                                                   os.path.join(parent_dir, "keyword", "wordcloud_gen.py"))
@@ -47,15 +69,20 @@ except ImportError as e:
     st.error(f"모듈 import 오류: {e}")
     st.stop()
 
+# 실행 중인 파이프라인의 결과를 모아 두는 임시 폴더 (완료된 실행만 data로 옮김)
+STAGING_DIR = os.path.join('data', '.staging')
+
 def cleanup_temp_data():
-    """임시 데이터 파일들 삭제"""
+    """임시 데이터 파일들 삭제 (본문 저장소는 다음 실행에서 수집한 기사 본문을 재사용하도록 유지)"""
     try:
         # 삭제할 파일 패턴들
         temp_files = [
             'data/articles.json',
             'data/summarized_articles.json', 
+            'data/corpus_summary.json',
             'data/keywords.json',
             'data/sentiment_analysis.json',
+            'data/search_info.json',
             'data/news_report_*.pdf',
             'data/sentiment_chart.png',
             'data/email_config.json',
@@ -76,6 +103,9 @@ def cleanup_temp_data():
                     os.remove(pattern)
                     deleted_count += 1
         
+        # 중단된 실행이 남긴 임시 결과 폴더
+        shutil.rmtree(STAGING_DIR, ignore_errors=True)
+        
         if deleted_count > 0:
             print(f"🧹 임시 데이터 {deleted_count}개 파일 삭제 완료")
         
@@ -89,8 +119,11 @@ def clear_search_results():
         search_files = [
             'data/articles.json',
             'data/summarized_articles.json', 
+            'data/corpus_summary.json',
             'data/keywords.json',
             'data/sentiment_analysis.json',
+            'data/search_info.json',
+            'data/article_bodies.sqlite3',
             'data/wordcloud*.png'
         ]
         
@@ -142,84 +175,346 @@ def load_data():
     except FileNotFoundError:
         data['keywords'] = {'keywords': [], 'total_keywords': 0}
     
+    # 종합 요약 로드
+    try:
+        with open('data/corpus_summary.json', 'r', encoding='utf-8') as f:
+            data['corpus_summary'] = json.load(f)
+    except FileNotFoundError:
+        data['corpus_summary'] = None
+    
     return data
 
-def run_full_pipeline(keyword, max_articles=10):
-    """전체 파이프라인 실행"""
+def load_previous_results(keyword):
+    """같은 키워드로 저장된 이전 분석 결과 로드 (없으면 None)"""
+    try:
+        with open('data/search_info.json', 'r', encoding='utf-8') as f:
+            search_info = json.load(f)
+        if search_info.get('keyword') != keyword:
+            return None
+        
+        with open('data/articles.json', 'r', encoding='utf-8') as f:
+            articles = json.load(f)
+        with open('data/summarized_articles.json', 'r', encoding='utf-8') as f:
+            summarized_articles = json.load(f)
+        with open('data/sentiment_analysis.json', 'r', encoding='utf-8') as f:
+            analyzed_articles = json.load(f)['articles']
+    except (FileNotFoundError, ValueError, KeyError):
+        return None
+    
+    return {
+        'articles': articles,
+        'summarized_articles': summarized_articles,
+        'analyzed_articles': analyzed_articles
+    }
+
+def save_search_info(keyword, total_articles, filepath='data/search_info.json'):
+    """마지막으로 분석한 키워드 기록 (증분 검색 시 이전 결과와 병합하는 기준)"""
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump({'keyword': keyword, 'total_articles': total_articles}, f, ensure_ascii=False, indent=2)
+
+@st.cache_resource
+def get_run_registry():
+    """프로세스 전체에서 공유하는 실행 상태 (모든 세션이 같은 data 폴더를 쓰므로 실행은 하나만 유지)"""
+    return {'token': None, 'lock': threading.Lock()}
+
+def start_cancellable_run():
+    """이전 실행을 취소하고 새 실행의 취소 토큰 등록"""
+    registry = get_run_registry()
+    token = CancellationToken()
+    with registry['lock']:
+        if registry['token'] is not None:
+            registry['token'].cancel("새 검색이 시작되어 이전 작업을 취소했습니다.")
+        registry['token'] = token
+    return token
+
+class StagedOutputs:
+    """실행 중 결과는 임시 폴더에 저장하고, 취소되지 않고 끝난 실행만 data 폴더로 옮김"""
+    
+    def __init__(self):
+        self.name = os.path.join('.staging', uuid.uuid4().hex[:12])  # data 폴더 기준 경로 (저장 함수의 filename 인자용)
+        self.directory = os.path.join('data', self.name)
+        os.makedirs(self.directory)
+    
+    def filename(self, name):
+        return os.path.join(self.name, name)
+    
+    def path(self, name):
+        return os.path.join(self.directory, name)
+    
+    def commit(self, token):
+        """취소되지 않았으면 결과 파일을 한꺼번에 교체"""
+        registry = get_run_registry()
+        with registry['lock']:
+            token.raise_if_cancelled()
+            for name in os.listdir(self.directory):
+                os.replace(self.path(name), os.path.join('data', name))
+        self.discard()
+    
+    def discard(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+def run_stage(token, status_text, message, func, *args, **kwargs):
+    """단계를 작업 스레드에서 실행하며 화면을 계속 갱신
+    (Streamlit은 화면을 갱신할 때 새 검색 요청을 전달하므로, 그때 토큰을 취소해 작업 스레드도 멈춤)
+    message가 함수면 갱신할 때마다 호출해 진행 상황을 표시"""
+    token.raise_if_cancelled()
+    render = message if callable(message) else (lambda: message)
+    status_text.text(render())
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(func, *args, **kwargs)
+    try:
+        while True:
+            try:
+                return future.result(timeout=0.25)
+            except FutureTimeoutError:
+                status_text.text(render())
+    except BaseException:
+        token.cancel("새 검색이 시작되어 이전 작업을 취소했습니다.")
+        raise
+    finally:
+        executor.shutdown(wait=False)
+
+def stream_stage(token, status_text, message, iterator):
+    """제너레이터 단계를 작업 스레드에서 돌리며 나오는 항목을 바로 반환 (기다리는 동안에도 화면 계속 갱신)
+    run_stage와 같이 화면을 갱신하다 중단되면 토큰을 취소해 작업 스레드도 멈춤"""
+    token.raise_if_cancelled()
+    render = message if callable(message) else (lambda: message)
+    status_text.text(render())
+    items = queue.Queue()
+    finished = object()
+    
+    def pump():
+        try:
+            for item in iterator:
+                items.put(item)
+                if token.cancelled:
+                    break
+        except BaseException as e:
+            items.put(e)
+        finally:
+            items.put(finished)
+    
+    threading.Thread(target=pump, daemon=True).start()
+    try:
+        while True:
+            try:
+                item = items.get(timeout=0.25)
+            except queue.Empty:
+                status_text.text(render())
+                continue
+            if item is finished:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    except BaseException:
+        token.cancel("새 검색이 시작되어 이전 작업을 취소했습니다.")
+        raise
+
+def without_keys(article, *keys):
+    """지정한 항목을 뺀 기사 사본"""
+    return {key: value for key, value in article.items() if key not in keys}
+
+def display_live_results(placeholder, processed, arrived, keyword_tally, extractor, ranking='count', df_index=None):
+    """분석 중간 결과 표시 (처리된 기사 수, 감성 분포, 현재 주요 키워드, 최근 도착한 기사)"""
+    with placeholder.container():
+        done = [processed[index] for index in arrived]
+        counts = Counter(article['sentiment']['sentiment'] for article in done)
+        
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("처리된 기사", f"{len(done)}/{len(processed)}")
+        col2.metric("😊 긍정", counts['positive'])
+        col3.metric("😞 부정", counts['negative'])
+        col4.metric("😐 중립", counts['neutral'])
+        
+        # 중간 결과는 색인을 바꾸지 않고 지금까지의 색인 통계로만 순위 계산
+        top = extractor.top_keywords(list(keyword_tally.values()), top_n=10, ranking=ranking, df_index=df_index)
+        if top:
+            st.write("**현재 주요 키워드:** " + ", ".join(f"{word}({count})" for word, count in top))
+        
+        for article in reversed(done[-5:]):
+            st.markdown(f"- **{article['title']}** ({article.get('source', 'N/A')}): {article.get('ai_summary', '')[:100]}")
+
+def run_full_pipeline(keyword, max_articles=10, incremental=False, source='daum', ranking='count', archive=False):
+    """전체 파이프라인 실행 (incremental=True면 지난 검색 이후의 새 기사만 처리, source='feed'면 언론사 RSS 피드 사용)
+    ranking: 키워드 순위 방식 ('count' 빈도순, 'tfidf'/'bm25'는 지금까지 수집한 기사의 문서 빈도 색인 기준)
+    archive=True면 다음 뉴스 원본 응답을 data/archive에 보관 (reprocess_archive.py 재처리용)
+    새 검색이 시작되면 취소되며, 취소된 실행의 결과는 data 폴더에 반영하지 않음"""
     progress_bar = st.progress(0)
     status_text = st.empty()
     
+    token = start_cancellable_run()
+    outputs = StagedOutputs()
+    watermarks = KeywordWatermarks()
+    saved_watermark = watermarks.get(keyword)
+    crawler = None
+    blob_store = None
+    summary_cache = None
+    summarizer = None
+    committed = False
+    
     try:
+        # 이전 결과가 남아 있을 때만 증분 검색 (없으면 전체 검색)
+        previous = load_previous_results(keyword) if incremental else None
+        
         # 1. 크롤링
         if max_articles >= 15:
-            status_text.text(f"🔍 뉴스 크롤링 중... ({max_articles}개 기사, 2-3분 소요 예상)")
+            message = f"🔍 뉴스 크롤링 중... ({max_articles}개 기사, 2-3분 소요 예상)"
         else:
-            status_text.text(f"🔍 뉴스 크롤링 중... ({max_articles}개 기사)")
+            message = f"🔍 뉴스 크롤링 중... ({max_articles}개 기사)"
         progress_bar.progress(10)
         
-        crawler = DaumNewsCrawler()
-        articles = crawler.search_news(keyword, max_articles)
+        # 전체 본문 저장소 (수집 기록의 본문 재사용과 결과 파일의 본문 ID가 같은 저장소를 사용)
+        blob_store = ArticleBlobStore()
+        if source == 'feed':
+            crawler = FeedNewsCrawler(cache=HttpCache(), watermarks=watermarks, cancel_token=token)
+        else:
+            crawler = DaumNewsCrawler(cache=HttpCache(), stream=True, seen_store=SeenArticleStore(blob_store=blob_store),
+                                      watermarks=watermarks, archive=HtmlArchive() if archive else None,
+                                      cancel_token=token)
+        articles = run_stage(token, status_text, message, crawler.search_news, keyword, max_articles,
+                             parallel=True, incremental=previous is not None)
         
         if not articles:
+            if previous is not None:
+                progress_bar.progress(100)
+                status_text.text("✅ 새 기사가 없습니다. 이전 분석 결과를 유지합니다.")
+                return True
             st.error("❌ 크롤링된 기사가 없습니다.")
             return False
         
-        status_text.text(f"📄 {len(articles)}개 기사 수집 완료! 본문 내용 추출 중...")
         progress_bar.progress(30)
         
-        # 본문 수집
-        for i, article in enumerate(articles):
-            if i % 5 == 0:  # 5개마다 진행 상황 업데이트
-                status_text.text(f"📖 본문 수집 중... ({i+1}/{len(articles)})")
-            content = crawler.get_article_content(article['link'])
-            article['content'] = content
-        
-        crawler.save_articles(articles)
+        # 2. 본문 수집 → 키워드 집계 → 요약 → 감성 분석을 기사마다 이어서 처리
+        # (본문이 도착하는 대로 다음 단계로 넘기고 중간 결과를 화면에 바로 표시)
+        summary_cache = SummaryCache()
+        summarizer = TextSummarizer(cache=summary_cache)
+        extractor = KeywordExtractor()
+        df_index = DocumentFrequencyIndex() if ranking != 'count' else None
+        analyzer = SentimentAnalyzer()
+        keyword_tally = {}
+        arrival = []  # 도착 순서별 기사 위치 (각 단계는 받은 순서대로 하나씩 넘김)
         
-        # 2. 요약
-        status_text.text("📝 기사 요약 중...")
-        progress_bar.progress(50)
+        def landed_articles():
+            for index, content in crawler.iter_article_contents([article['link'] for article in articles]):
+                arrival.append(index)
+                # 전체 본문은 압축 저장소로 옮기고 결과 파일에는 미리보기만 저장
+                yield blob_store.detach([dict(articles[index], content=content)])[0]
         
-        summarizer = TextSummarizer()
-        summarized_articles = summarizer.summarize_articles(articles, method='simple')
+        stream = extractor.count_keywords_stream(landed_articles(), keyword_tally, blob_store=blob_store)
+        stream = summarizer.summarize_stream(stream, method='simple', blob_store=blob_store)
+        stream = analyzer.analyze_stream(stream, blob_store=blob_store)
         
-        with open('data/summarized_articles.json', 'w', encoding='utf-8') as f:
-            json.dump(summarized_articles, f, ensure_ascii=False, indent=2)
+        processed = [None] * len(articles)
+        live_results = st.empty()
+        last_render = 0.0
+        stream = stream_stage(token, status_text,
+                              lambda: f"📖 본문 수집 및 분석 중... ({len(arrival)}/{len(articles)}개 기사 도착)", stream)
+        try:
+            for done, article in enumerate(stream, 1):
+                processed[arrival[done - 1]] = article
+                progress_bar.progress(30 + 40 * done // len(articles))
+                if done == 1 or done == len(articles) or time.monotonic() - last_render >= 0.5:
+                    display_live_results(live_results, processed, arrival[:done], keyword_tally, extractor,
+                                         ranking, df_index)
+                    last_render = time.monotonic()
+        finally:
+            stream.close()  # 화면 갱신 중 중단되면 작업 스레드도 멈춤
+        live_results.empty()
         
-        # 3. 키워드 추출
-        status_text.text("🔍 키워드 추출 및 분석 중...")
-        progress_bar.progress(70)
+        # 단계별 결과 파일 형식은 그대로 (기사 / 기사 + AI 요약 / 기사 + 감성)
+        new_articles = articles = [without_keys(article, 'ai_summary', 'sentiment') for article in processed]
+        summarized_articles = [without_keys(article, 'sentiment') for article in processed]
+        analyzed_articles = [without_keys(article, 'ai_summary') for article in processed]
         
-        extractor = KeywordExtractor()
-        keywords = extractor.extract_keywords_from_articles(articles, top_n=30)
-        extractor.save_keywords(keywords)
+        # 새 기사를 이전 결과 앞에 붙여 저장 (분석은 새 기사만 수행)
+        if previous is not None:
+            articles = new_articles + previous['articles']
+            summarized_articles = summarized_articles + previous['summarized_articles']
+            analyzed_articles = analyzed_articles + previous['analyzed_articles']
+            for _ in extractor.count_keywords_stream(previous['articles'], keyword_tally, blob_store=blob_store):
+                pass
+        crawler.save_articles(articles, outputs.filename('articles.json'))
+        print(f"📦 HTTP 캐시 통계: {crawler.get_cache_stats()}")
+        crawl_stats = crawler.get_crawl_stats()
+        print(f"♻️ 중복 제외 {crawl_stats['duplicates_skipped']}건, 재수집 생략 {crawl_stats['fetches_avoided']}건")
         
-        # 4. 감성 분석
-        status_text.text("😊 감성 분석 중...")
-        progress_bar.progress(75)
+        with open(outputs.path('summarized_articles.json'), 'w', encoding='utf-8') as f:
+            json.dump(summarized_articles, f, ensure_ascii=False, indent=2)
         
-        analyzer = SentimentAnalyzer()
-        analyzed_articles, sentiment_summary = analyzer.analyze_articles(articles)
-        sentiment_stats = analyzer.get_sentiment_statistics(analyzed_articles)
+        # 3. 전체 기사(증분 검색이면 이전 기사 포함)를 하나의 문장 그래프로 묶은 종합 요약
+        progress_bar.progress(70)
+        corpus_summary = run_stage(token, status_text, f"🧾 {len(articles)}개 기사 종합 요약 중...",
+                                   summarizer.summarize_corpus, articles, blob_store=blob_store)
+        with open(outputs.path('corpus_summary.json'), 'w', encoding='utf-8') as f:
+            json.dump({'keyword': keyword, 'total_articles': len(articles), 'sentences': corpus_summary},
+                      f, ensure_ascii=False, indent=2)
         
-        # 감성 분석 결과 저장
-        analyzer.save_sentiment_analysis(analyzed_articles)
+        # 4. 키워드 (기사 순서대로 합쳐 일괄 처리와 같은 순위) 및 감성 통계 저장
+        progress_bar.progress(80)
+        counters = [keyword_tally[article.get('link', '')] for article in articles]
+        if df_index is not None:
+            # 처음 본 기사만 문서 빈도 색인에 추가한 뒤 순위 계산 (색인 파일은 실행이 완료되어야 저장)
+            extractor.index_keywords(df_index, counters, [article.get('link', '') for article in articles])
+        keywords = extractor.top_keywords(counters, top_n=30, ranking=ranking, df_index=df_index, with_scores=True)
+        extractor.print_keywords(keywords)
+        extractor.save_keywords(keywords, outputs.filename('keywords.json'))
+        analyzer.save_sentiment_analysis(analyzed_articles, outputs.filename('sentiment_analysis.json'))
         
         # 5. 워드클라우드 생성
-        status_text.text("☁️ 3가지 스타일 워드클라우드 생성 중...")
         progress_bar.progress(90)
         
         generator = WordCloudGenerator()
-        generator.create_multiple_styles()
+        run_stage(token, status_text, "☁️ 3가지 스타일 워드클라우드 생성 중...",
+                  generator.create_multiple_styles, outputs.path('keywords.json'), outputs.name)
+        
+        save_search_info(keyword, len(articles), outputs.path('search_info.json'))
+        
+        # 끝까지 완료된 경우에만 결과 파일 교체
+        outputs.commit(token)
+        committed = True
+        if df_index is not None:
+            # 문서 빈도 색인도 완료된 실행의 기사만 반영
+            df_index.save()
+            print(f"📚 키워드 색인 통계: {df_index.get_stats()}")
         
         progress_bar.progress(100)
-        status_text.text(f"✅ 분석 완료! {len(articles)}개 기사, {len(keywords)}개 키워드, 감성분석 완료")
+        if previous is not None:
+            status_text.text(f"✅ 분석 완료! 새 기사 {len(new_articles)}개 추가 (총 {len(articles)}개), {len(keywords)}개 키워드")
+        else:
+            status_text.text(f"✅ 분석 완료! {len(articles)}개 기사, {len(keywords)}개 키워드, 감성분석 완료")
         
         return True
         
+    except CrawlCancelled:
+        status_text.text("⏹️ 새 검색이 시작되어 이전 작업을 취소했습니다.")
+        return False
     except Exception as e:
         st.error(f"❌ 오류 발생: {e}")
         return False
+    finally:
+        outputs.discard()
+        if crawler is not None:
+            crawler.close()
+        if blob_store is not None:
+            blob_store.close()
+        if summarizer is not None:
+            summarizer.close()
+        if summary_cache is not None:
+            summary_cache.close()
+        if not committed:
+            # 결과를 버린 실행의 워터마크는 되돌려 다음 증분 검색에서 다시 수집
+            # (이 실행이 쓴 워터마크가 그대로일 때만, 이후 남은 작업 스레드의 갱신도 무시)
+            watermarks.restore(keyword, saved_watermark)
+
+@st.cache_data(max_entries=50, show_spinner=False)
+def load_article_body(content_id):
+    """본문 보기를 선택한 기사의 전체 본문만 저장소에서 불러옴"""
+    store = ArticleBlobStore()
+    try:
+        return store.get(content_id)
+    finally:
+        store.close()
 
 def display_articles(articles):
     """기사 목록 표시"""
@@ -242,6 +537,12 @@ def display_articles(articles):
                 else:
                     st.write("**요약:**")
                     st.write(article.get('summary', 'N/A')[:200] + "...")
+                
+                # 전체 본문은 선택한 경우에만 불러옴
+                if article.get('content_id'):
+                    label = f"📄 본문 보기 ({article.get('content_length', 0):,}자)"
+                    if st.checkbox(label, key=f"body_{i}_{article['content_id']}"):
+                        st.write(load_article_body(article['content_id']) or article.get('content_preview', ''))
             
             with col2:
                 link_url = article.get('link', '#')
@@ -250,6 +551,20 @@ def display_articles(articles):
                 else:
                     st.write("링크 없음")
 
+def display_corpus_summary(corpus_summary):
+    """기사 전체 종합 요약 표시 (문장마다 출처 기사 링크)"""
+    if not corpus_summary or not corpus_summary.get('sentences'):
+        return
+    
+    st.subheader(f"🧾 종합 요약 ({corpus_summary.get('total_articles', 0)}개 기사)")
+    for item in corpus_summary['sentences']:
+        source = item.get('source') or '출처 없음'
+        if item.get('link'):
+            st.markdown(f"- {item['sentence']} ([{source}]({item['link']}))")
+        else:
+            st.markdown(f"- {item['sentence']} ({source})")
+    st.markdown("---")
+
 def display_keywords(keywords_data):
     """키워드 표시"""
     if not keywords_data or not keywords_data.get('keywords'):
@@ -321,6 +636,16 @@ def main():
                                    value=keyword_from_session, 
                                    placeholder="예: 부동산, 주식, 정치")
     max_articles = st.sidebar.slider("수집할 기사 수", 5, 20, 10)
+    source_label = st.sidebar.radio("뉴스 소스", ["다음 뉴스 검색", "언론사 RSS 피드"],
+                                    help="RSS 피드는 기사 페이지를 따로 요청하지 않아 빠르지만, 피드에 올라온 최신 기사 중에서만 검색합니다.")
+    source = 'feed' if source_label == "언론사 RSS 피드" else 'daum'
+    incremental = st.sidebar.checkbox("🔁 새 기사만 수집 (증분)", value=False,
+                                      help="같은 키워드의 이전 결과가 있으면 그 이후에 올라온 기사만 수집해 기존 결과에 추가합니다.")
+    ranking_label = st.sidebar.selectbox("키워드 순위 방식", ["빈도", "TF-IDF", "BM25"],
+                                         help="TF-IDF/BM25는 지금까지 수집한 기사에 흔히 나오는 단어의 순위를 낮춰 이번 검색에 특징적인 키워드를 앞에 보여줍니다.")
+    ranking = {"TF-IDF": 'tfidf', "BM25": 'bm25', "빈도": 'count'}[ranking_label]
+    archive = st.sidebar.checkbox("🗄️ 원본 응답 보관", value=False,
+                                  help="다음 뉴스 검색/기사 원본 응답을 data/archive에 보관해 나중에 reprocess_archive.py로 재처리할 수 있게 합니다. (보관소 크기는 제한되지 않습니다)")
     
     # 시간 경고문
     if max_articles >= 15:
@@ -333,7 +658,7 @@ def main():
     
     if search_triggered and keyword.strip():
         with st.spinner("분석 중..."):
-            success = run_full_pipeline(keyword.strip(), max_articles)
+            success = run_full_pipeline(keyword.strip(), max_articles, incremental, source, ranking, archive)
             if success:
                 st.success("✅ 분석 완료!")
                 st.experimental_rerun()
@@ -353,6 +678,7 @@ def main():
         articles_to_show = data['summarized_articles'] if data['summarized_articles'] else data['articles']
         
         if articles_to_show:
+            display_corpus_summary(data['corpus_summary'])
             st.info(f"📊 총 {len(articles_to_show)}개 기사")
             display_articles(articles_to_show)
         else:
@@ -582,6 +908,7 @@ def main():
                 st.markdown("""
                 **포함될 내용:**
                 - 📊 분석 개요 및 통계
+                - 🧾 기사 전체 종합 요약
                 - 📰 수집된 뉴스 기사 목록
                 - 🔍 주요 키워드 분석
                 - 😊 감성 분석 결과 (있는 경우)
@@ -608,13 +935,19 @@ def main():
                             except FileNotFoundError:
                                 pass
                             
+                            # 종합 요약 로드 (있는 경우)
+                            corpus_summary = None
+                            if data['corpus_summary']:
+                                corpus_summary = data['corpus_summary'].get('sentences')
+                            
                             # PDF 리포트 생성
                             generator = NewsReportGenerator()
                             pdf_path = generator.generate_report(
                                 keyword=keyword if keyword else "분석결과",
                                 articles=articles,
                                 keywords_data=keywords_data,
-                                sentiment_stats=sentiment_stats
+                                sentiment_stats=sentiment_stats,
+                                corpus_summary=corpus_summary
                             )
                             
                             if pdf_path:
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+여러 키워드 일괄 수집 스크립트
+한 크롤러로 모든 키워드를 검색하고, 여러 키워드에 걸친 기사 본문은 한 번만 받아
+키워드별 결과를 data/batch/<키워드>.json에 저장
+
+사용법: python batch_crawl.py 키워드1 키워드2 ... [--file keywords.txt] [--max-articles N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from crawler.daum_crawler import DaumNewsCrawler, keyword_filename
+from crawler.http_cache import HttpCache
+
+
+def main():
+    parser = argparse.ArgumentParser(description="여러 키워드 뉴스 일괄 수집")
+    parser.add_argument('keywords', nargs='*', help="검색 키워드 목록")
+    parser.add_argument('--file', default=None, help="키워드 목록 파일 (한 줄에 하나)")
+    parser.add_argument('--max-articles', type=int, default=10, help="키워드별 최대 기사 수")
+    args = parser.parse_args()
+
+    keywords = list(args.keywords)
+    if args.file:
+        with open(args.file, 'r', encoding='utf-8') as f:
+            keywords.extend(line.strip() for line in f if line.strip())
+    if not keywords:
+        parser.error("키워드를 하나 이상 입력해주세요.")
+
+    os.makedirs(os.path.join("data", "batch"), exist_ok=True)
+    crawler = DaumNewsCrawler(cache=HttpCache(), stream=True)
+    started = time.perf_counter()
+
+    try:
+        results = crawler.search_news_batch(keywords, args.max_articles)
+        for keyword, articles in results.items():
+            crawler.save_articles(articles, os.path.join("batch", keyword_filename(keyword) + ".json"))
+        crawl_stats = crawler.get_crawl_stats()
+    finally:
+        crawler.close()
+
+    total = sum(len(articles) for articles in results.values())
+    print(f"✅ {len(results)}개 키워드, {total}개 기사 수집 ({time.perf_counter() - started:.1f}초)")
+    print(f"♻️ 키워드 간 중복 기사 재수집 생략 {crawl_stats['fetches_avoided']}건")
+
+
+if __name__ == "__main__":
+    main()
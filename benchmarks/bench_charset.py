@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+문자셋 판별 벤치마크
+charset 헤더가 없는 응답에서 response.text(자동 감지)와 CharsetResolver 비교
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from crawler.charset import CharsetResolver
+
+SENTENCE = "정부는 오늘 경제 활성화를 위한 새로운 정책을 발표했다. 시장은 긍정적으로 반응했다. "
+
+
+def make_page(encoding, meta, size=300 * 1024):
+    """charset 헤더 없이 전달되는 기사 페이지"""
+    head = f'<meta charset="{encoding}">' if meta else ''
+    body = SENTENCE * (size // len(SENTENCE.encode(encoding)))
+    return f'<html><head>{head}<title>기사</title></head><body><div class="article_view">{body}</div></body></html>'.encode(encoding)
+
+
+def make_response(content):
+    response = requests.Response()
+    response.status_code = 200
+    response.url = 'https://press.example.com/news/1'
+    response.headers = CaseInsensitiveDict({'Content-Type': 'text/html'})
+    response._content = content
+    return response
+
+
+def measure(func, repeat=5):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        elapsed = (time.perf_counter() - started) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def legacy_text(content):
+    """기존 방식: 인코딩 미지정 시 response.text가 바이트 분포로 자동 감지"""
+    response = make_response(content)
+    response.encoding = None
+    return response.text
+
+
+def main():
+    cases = [
+        ('UTF-8 (meta 있음)', make_page('utf-8', True)),
+        ('UTF-8 (meta 없음)', make_page('utf-8', False)),
+        ('EUC-KR (meta 있음)', make_page('euc-kr', True)),
+        ('EUC-KR (meta 없음)', make_page('euc-kr', False)),
+    ]
+
+    print("📊 300KB 페이지 디코딩 시간 (ms, 낮을수록 좋음)")
+    print(f"{'구분':<22}{'자동 감지':>10}{'판별기':>10}{'배율':>8}  판별 방법")
+    for name, content in cases:
+        resolver = CharsetResolver()
+        host = 'press.example.com'
+
+        # 같은 호스트의 두 번째 요청부터는 학습된 인코딩 사용
+        resolver.decode(make_response(content), host)
+        assert resolver.decode(make_response(content), host) == legacy_text(content)
+
+        before = measure(lambda: legacy_text(content))
+        after = measure(lambda: resolver.decode(make_response(content), host))
+        _, source = resolver.resolve(make_response(content).headers, content, host)
+        print(f"{name:<22}{before:>10.2f}{after:>10.2f}{before / after:>7.0f}x  {source}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+종합 요약 벤치마크
+여러 언론사가 같은 통신사 문장을 조금씩 고쳐 싣는 합성 기사 200개로 summarize_corpus 처리 시간과
+선택된 문장 중 거의 같은 문장(같은 원문에서 나온 문장)이 겹치는지 확인
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from summarizer.text_summarizer import TextSummarizer
+
+SYLLABLES = '가나다라마바사아자차카타파하거너더러머버서어저처커터퍼허고노도로모보소오조초코토포호구누두루무부수우주추'
+ENDINGS = ['발표했다.', '밝혔다.', '전했다.', '설명했다.', '강조했다.', '덧붙였다.']
+
+
+def make_vocabulary(rng, size):
+    words = set()
+    while len(words) < size:
+        words.add(''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))))
+    return sorted(words)
+
+
+def make_sentence(rng, vocabulary, length):
+    # 실제 기사처럼 자주 쓰는 단어와 드문 단어가 섞이도록 순위에 반비례하는 빈도로 선택 (Zipf 분포)
+    weights = [1.0 / rank for rank in range(1, len(vocabulary) + 1)]
+    return ' '.join(rng.choices(vocabulary, weights, k=length)) + ' ' + rng.choice(ENDINGS)
+
+
+def make_corpus(rng, article_count, stories, wire_sentences, own_sentences):
+    """기사 목록과 문장별 원문 번호 (통신사 문장은 (이야기, 번호), 기사 고유 문장은 None)"""
+    vocabulary = make_vocabulary(rng, 4000)
+    wire = [[make_sentence(rng, vocabulary, rng.randint(8, 14)) for _ in range(wire_sentences)]
+            for _ in range(stories)]
+
+    articles = []
+    origins = {}
+    for i in range(article_count):
+        story = rng.randrange(stories)
+        sentences = []
+        for index in rng.sample(range(wire_sentences), rng.randint(3, wire_sentences)):
+            words = wire[story][index].split()
+            words[rng.randrange(len(words) - 1)] = rng.choice(vocabulary)  # 언론사마다 단어 하나씩 고침
+            sentence = ' '.join(words)
+            sentences.append(sentence)
+            origins[sentence] = (story, index)
+        sentences.extend(make_sentence(rng, vocabulary, rng.randint(8, 14)) for _ in range(own_sentences))
+        rng.shuffle(sentences)
+        articles.append({'title': f'기사 {i}', 'link': f'https://news.example.com/{i}', 'source': f'언론사 {i % 30}',
+                         'content': ' '.join(sentences)})
+    return articles, origins
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기사 전체 종합 요약 처리 시간/중복 확인")
+    parser.add_argument('--articles', type=int, default=200, help="합성 기사 수")
+    parser.add_argument('--stories', type=int, default=8, help="통신사 기사(이야기) 수")
+    parser.add_argument('--summary-sentences', type=int, default=5, help="종합 요약 문장 수")
+    parser.add_argument('--repeat', type=int, default=5, help="반복 측정 횟수")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    articles, origins = make_corpus(rng, args.articles, args.stories, wire_sentences=10, own_sentences=15)
+    summarizer = TextSummarizer()
+    sentence_total = sum(len(article['content'].split('. ')) for article in articles)
+
+    print(f"📊 합성 기사 {len(articles)}개 (문장 약 {sentence_total:,}개) 종합 요약")
+    print(f"{'방식':<10}{'최소(초)':>10}{'중앙값(초)':>12}  중복 없음  결정적 출력")
+    for method in ('lexrank', 'textrank'):
+        timings = []
+        results = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            results.append(summarizer.summarize_corpus(articles, method, args.summary_sentences))
+            timings.append(time.perf_counter() - started)
+
+        picked = [origins.get(item['sentence']) for item in results[0]]
+        wire_picks = [origin for origin in picked if origin is not None]
+        unique = len(wire_picks) == len(set(wire_picks))
+        deterministic = all(result == results[0] for result in results)
+        timings.sort()
+        print(f"{method:<10}{timings[0]:>10.3f}{timings[len(timings) // 2]:>12.3f}"
+              f"  {'✅' if unique else '❌':<8}{'✅' if deterministic else '❌'}")
+        for item, origin in zip(results[0], picked):
+            print(f"   - [{item['source']}] {item['sentence'][:60]} (원문: {origin})")
+
+
+if __name__ == "__main__":
+    main()
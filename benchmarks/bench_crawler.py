@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+크롤러 처리량 벤치마크
+로컬 테스트 서버(fixture_server.py)를 대상으로 검색 + 본문 수집을 실행하고
+초당 기사 수와 요청 종류별 응답 시간 p50/p95/p99를 보고
+
+사용법: python benchmarks/bench_crawler.py [--keywords 4] [--max-articles 50] [--latency 0.05] [--error-rate 0.01] [--throttle-rate 0.02]
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fixture_server import FixtureConfig, FixtureServer
+from crawler.daum_crawler import DaumNewsCrawler
+
+KEYWORDS = ['경제', '정치', '사회', '문화', '스포츠', '과학', '국제', '날씨']
+
+
+def serve(config, queue):
+    """별도 프로세스에서 테스트 서버 실행 (크롤러와 GIL을 나누지 않도록)"""
+    server = FixtureServer(config)
+    queue.put(server.search_url)
+    server.serve_forever()
+
+
+def run(search_url, keywords, max_articles, max_concurrency, stream):
+    crawler = DaumNewsCrawler(
+        max_concurrency=max_concurrency,
+        search_rate=100.0,
+        search_burst=20,
+        stream=stream,
+        base_url=search_url
+    )
+    try:
+        started = time.perf_counter()
+        results = crawler.search_news_batch(keywords, max_articles)
+        elapsed = time.perf_counter() - started
+
+        articles = [article for found in results.values() for article in found]
+        fetched = sum(1 for article in articles if article.get('content'))
+        return {
+            'elapsed': elapsed,
+            'articles': len(articles),
+            'fetched': fetched,
+            'latency': crawler.get_latency_stats(),
+            'hosts': crawler.get_host_stats(),
+            'connections': crawler.get_connection_stats()
+        }
+    finally:
+        crawler.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 테스트 서버 대상 크롤러 처리량 측정")
+    parser.add_argument('--keywords', type=int, default=4, help="검색 키워드 수 (최대 8)")
+    parser.add_argument('--max-articles', type=int, default=50, help="키워드별 최대 기사 수")
+    parser.add_argument('--concurrency', type=int, default=8, help="본문 동시 수집 수")
+    parser.add_argument('--stream', action='store_true', help="본문을 찾으면 나머지 다운로드 생략")
+    parser.add_argument('--latency', type=float, default=0.05, help="서버 기본 응답 지연 (초)")
+    parser.add_argument('--jitter', type=float, default=0.02, help="서버 지연 흔들림 (초)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="500 응답 비율")
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help="429 응답 비율")
+    parser.add_argument('--server', default=None, help="이미 실행 중인 테스트 서버의 검색 주소")
+    args = parser.parse_args()
+
+    config = FixtureConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        pages=max(1, -(-args.max_articles // 10))
+    )
+
+    process = None
+    search_url = args.server
+    if search_url is None:
+        queue = multiprocessing.Queue()
+        process = multiprocessing.Process(target=serve, args=(config, queue), daemon=True)
+        process.start()
+        search_url = queue.get(timeout=10)
+
+    try:
+        result = run(search_url, KEYWORDS[:args.keywords], args.max_articles, args.concurrency, args.stream)
+    finally:
+        if process is not None:
+            process.terminate()
+            process.join()
+
+    print(f"📊 {args.keywords}개 키워드 × 최대 {args.max_articles}개 기사 "
+          f"(지연 {args.latency * 1000:.0f}ms, 오류 {args.error_rate:.0%}, 429 {args.throttle_rate:.0%})")
+    print(f"✅ {result['articles']}개 기사 (본문 {result['fetched']}개) / {result['elapsed']:.2f}초 "
+          f"= {result['fetched'] / result['elapsed']:.1f} 기사/초")
+
+    print(f"\n{'요청 종류':<10}{'건수':>8}{'p50(ms)':>10}{'p95(ms)':>10}{'p99(ms)':>10}")
+    for kind, stats in sorted(result['latency'].items()):
+        print(f"{kind:<10}{stats['count']:>8}{stats['p50'] * 1000:>10.1f}"
+              f"{stats['p95'] * 1000:>10.1f}{stats['p99'] * 1000:>10.1f}")
+
+    for host, stats in result['hosts'].items():
+        print(f"\n🌐 {host}: 요청 {stats['requests']}, 성공 {stats['successes']}, "
+              f"429 {stats['throttled']}, 오류 {stats['errors']}, 동시 요청 창 {stats['window']}")
+    print(f"🔗 연결 재사용률 {result['connections']['reuse_ratio']:.0%}")
+
+
+if __name__ == "__main__":
+    main()
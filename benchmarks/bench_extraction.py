@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+추출 엔진 벤치마크
+BeautifulSoup(html.parser) 방식과 lxml 추출 엔진의 문서당 파싱 시간 비교
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crawler.daum_crawler import DaumNewsCrawler
+
+random.seed(42)
+
+NOISE_WORDS = ['경제', '정부', '발표', '시장', '기업', '투자', '성장', '정책', '지역', '국회']
+
+
+def noise_block(count):
+    """페이지 상단/하단의 메뉴, 스크립트 등 노이즈 영역"""
+    items = ''.join(
+        f'<li><a href="https://news.example.com/menu/{i}">{random.choice(NOISE_WORDS)} 메뉴 {i}</a></li>'
+        for i in range(count)
+    )
+    return f'<div class="gnb"><ul>{items}</ul></div><script>var tracking = {{"id": 1}};</script>'
+
+
+def make_search_page(variant, count=10):
+    """검색 결과 페이지 (마크업 종류별)"""
+    items = []
+    for i in range(count):
+        title = f'{random.choice(NOISE_WORDS)} 관련 주요 뉴스 기사 제목 {i}번째 소식'
+        link = f'https://v.daum.net/v/2024010112{i:04d}'
+        if variant == 'c-item':
+            items.append(
+                f'<div class="c-item-content"><a class="f_link_b" href="{link}">{title}</a>'
+                f'<p class="c-item-text">{title} 요약 내용입니다.</p><span class="c-item-source">연합뉴스</span></div>'
+            )
+        elif variant == 'wrap_cont':
+            items.append(
+                f'<div class="wrap_cont"><a class="tit_main" href="{link}">{title}</a>'
+                f'<p class="desc">{title} 요약</p><span class="source">뉴시스</span></div>'
+            )
+        else:
+            items.append(
+                f'<li class="news"><a class="link_news" href="{link}">{title}</a><p>{title} 요약</p></li>'
+            )
+    return f'<html><head><title>검색</title></head><body>{noise_block(300)}<div id="news">{"".join(items)}</div>{noise_block(300)}</body></html>'
+
+
+def make_article_page(selector_index):
+    """언론사 기사 페이지 (본문 선택자 종류별)"""
+    paragraphs = ''.join(
+        f'<p>{" ".join(random.choice(NOISE_WORDS) for _ in range(30))} 문단 {i}.</p>' for i in range(40)
+    )
+    wrappers = [
+        '<div class="article_view">{}</div>',
+        '<div id="harmonyContainer">{}</div>',
+        '<div class="news_end">{}</div>',
+        '<div class="article-body">{}</div>',
+        '<div class="article_body">{}</div>',
+        '<div class="read_body">{}</div>',
+    ]
+    body = wrappers[selector_index].format(paragraphs)
+    return f'<html><head><title>기사</title></head><body>{noise_block(500)}{body}{noise_block(500)}</body></html>'
+
+
+def measure(func, documents, repeat=3):
+    """문서당 평균 처리 시간 (ms)"""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for document in documents:
+            func(document)
+        elapsed = (time.perf_counter() - started) / len(documents) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    search_pages = [(f'search.daum.net', make_search_page(v)) for v in ('c-item', 'wrap_cont', 'li.news') for _ in range(10)]
+    article_pages = [(f'press{i % 6}.example.com', make_article_page(i % 6)) for i in range(60)]
+
+    legacy = DaumNewsCrawler(parser='html.parser')
+    fast = DaumNewsCrawler(parser='lxml')
+
+    # 결과 동일성 확인
+    for domain, page in search_pages:
+        assert legacy.parse_search_page(page, 10) == fast.parse_search_page(page, 10, domain)
+    for domain, page in article_pages:
+        assert legacy.extract_content(page) == fast.extract_content(page, domain)
+
+    print("📊 문서당 파싱 시간 (ms, 낮을수록 좋음)")
+    print(f"{'구분':<12}{'html.parser':>14}{'lxml':>10}{'배율':>8}")
+    for name, docs, old, new in [
+        ('검색 결과', search_pages,
+         lambda d: legacy.parse_search_page(d[1], 10),
+         lambda d: fast.parse_search_page(d[1], 10, d[0])),
+        ('기사 본문', article_pages,
+         lambda d: legacy.extract_content(d[1]),
+         lambda d: fast.extract_content(d[1], d[0])),
+    ]:
+        before = measure(old, docs)
+        after = measure(new, docs)
+        print(f"{name:<12}{before:>14.2f}{after:>10.2f}{before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+병렬 요약 벤치마크
+합성 기사 5,000개를 작업자 프로세스 수별로 요약해 처리 시간과 속도 향상 배율 비교
+(결과 순서와 내용이 단일 프로세스 결과와 같은지도 확인)
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_summarizer import make_article
+from summarizer.text_summarizer import TextSummarizer
+
+
+def run(articles, method, workers):
+    summarizer = TextSummarizer(workers=workers)
+    try:
+        if workers > 1:
+            summarizer._get_pool().submit(int).result()  # 작업자 시작 시간은 측정에서 제외
+        started = time.perf_counter()
+        summarized = summarizer.summarize_articles(articles, method=method)
+        return time.perf_counter() - started, [article['ai_summary'] for article in summarized]
+    finally:
+        summarizer.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="작업자 프로세스 수별 요약 처리 시간 비교")
+    parser.add_argument('--articles', type=int, default=5000, help="합성 기사 수")
+    parser.add_argument('--method', default='textrank', choices=['textrank', 'lexrank', 'simple'])
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1, help="최대 작업자 수")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    articles = [
+        {'title': f'기사 {i}', 'content': make_article(rng, rng.randint(15, 50))}
+        for i in range(args.articles)
+    ]
+
+    worker_counts = sorted({1, *[n for n in (2, 4, 8, 16) if n < args.max_workers], args.max_workers})
+    baseline = None
+    rows = []
+    for workers in worker_counts:
+        elapsed, summaries = run(articles, args.method, workers)
+        if baseline is None:
+            baseline = (elapsed, summaries)
+        rows.append((workers, elapsed, baseline[0] / elapsed, summaries == baseline[1]))
+
+    print(f"\n📊 합성 기사 {args.articles}개 {args.method} 요약 (CPU {os.cpu_count()}개)")
+    print(f"{'작업자':>6}{'시간(초)':>10}{'배율':>8}  단일 프로세스와 동일")
+    for workers, elapsed, speedup, same in rows:
+        print(f"{workers:>6}{elapsed:>10.2f}{speedup:>7.1f}x  {'✅' if same else '❌'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+문장 분리 벤치마크
+합성 기사 10MB에 대해 기존 방식(정규식 4회 + split('.'))과 segmenter의 처리 시간/정확도 비교
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from summarizer.segmenter import clean_text, sentence_spans
+
+SENTENCES = [
+    '정부는 올해 경제 성장률을 {n}.{d}%로 전망했다.',
+    '김 장관은 "정말 가능한 목표인가?"라고 되물었다.',
+    '전문가들은 "시장 반응을 지켜봐야 한다."고 말했다.',
+    'U.S. 연방준비제도와 Dr. Kim 연구팀의 분석도 비슷했다.',
+    '수출액은 {n},{d}00억 원으로 집계됐다.',
+    '과연 효과가 있을까?',
+    '시민들은 환영한다는 입장을 밝혔다!',
+    '관계자는 "검토 중"이라며 말을 아꼈다...',
+    '[서울=연합뉴스] 이번 대책은 (가칭) 민생 안정 패키지로 불린다.',
+]
+
+
+def make_article(rng, count):
+    """합성 기사와 실제 문장 수"""
+    sentences = [rng.choice(SENTENCES).format(n=rng.randint(1, 99), d=rng.randint(0, 9)) for _ in range(count)]
+    # 말줄임표 문장은 다음 문장과 이어지므로 실제 문장 수에서 제외 (마지막 문장이면 포함)
+    expected = sum(1 for sentence in sentences[:-1] if not sentence.endswith('...')) + 1
+    return '<p>' + ' '.join(sentences) + '</p>', expected
+
+
+def legacy_clean_text(text):
+    """기존 TextSummarizer.clean_text"""
+    text = re.sub(r'<[^>]+>', '', text)
+    text = re.sub(r'\[.*?\]', '', text)
+    text = re.sub(r'\(.*?\)', '', text)
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip()
+
+
+def legacy_count(text):
+    """기존 방식의 문장 수 (빈 조각 제외)"""
+    return sum(1 for piece in legacy_clean_text(text).split('.') if piece.strip())
+
+
+def new_count(text):
+    return len(sentence_spans(clean_text(text)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="문장 분리 처리 시간/정확도 비교")
+    parser.add_argument('--size-mb', type=float, default=10.0, help="합성 말뭉치 크기 (MB)")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    articles = []
+    expected = []
+    total_bytes = 0
+    while total_bytes < args.size_mb * 1024 * 1024:
+        text, count = make_article(rng, rng.randint(10, 40))
+        articles.append(text)
+        expected.append(count)
+        total_bytes += len(text.encode('utf-8'))
+
+    print(f"📊 합성 기사 {len(articles)}개 ({total_bytes / 1024 / 1024:.1f}MB), 실제 문장 {sum(expected):,}개")
+    print(f"{'방식':<14}{'시간(초)':>10}{'MB/초':>10}{'문장 수':>12}{'정확 기사 비율':>16}")
+    for name, count in (('기존 split', legacy_count), ('segmenter', new_count)):
+        started = time.perf_counter()
+        counts = [count(text) for text in articles]
+        elapsed = time.perf_counter() - started
+        exact = sum(1 for got, want in zip(counts, expected) if got == want) / len(articles)
+        print(f"{name:<14}{elapsed:>10.2f}{total_bytes / 1024 / 1024 / elapsed:>10.1f}"
+              f"{sum(counts):>12,}{exact:>15.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스트리밍 파이프라인 벤치마크
+로컬 테스트 서버(fixture_server.py)에서 검색한 기사를 두 방식으로 처리해 첫 결과까지 걸린 시간 비교
+- 일괄: 본문을 모두 받은 뒤 요약 → 감성 분석 → 키워드 (첫 결과 = 가장 느린 본문 이후)
+- 스트리밍: 본문이 도착하는 대로 키워드 집계 → 요약 → 감성 분석 제너레이터를 이어서 처리
+두 방식의 요약/감성/키워드 결과가 같은지도 확인
+
+사용법: python benchmarks/bench_streaming.py [--max-articles 50] [--latency 0.1] [--slow-rate 0.05]
+"""
+
+import argparse
+import importlib.util
+import multiprocessing
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.fixture_server import FixtureConfig, FixtureServer
+from crawler.daum_crawler import DaumNewsCrawler
+from summarizer.text_summarizer import TextSummarizer
+from sentiment_analysis.sentiment import SentimentAnalyzer
+
+# keyword 모듈 충돌 방지를 위한 직접 import
+spec = importlib.util.spec_from_file_location("keyword_extractor", os.path.join(ROOT, "keyword", "keyword_extractor.py"))
+keyword_extractor_module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(keyword_extractor_module)
+KeywordExtractor = keyword_extractor_module.KeywordExtractor
+
+
+def serve(config, queue):
+    """별도 프로세스에서 테스트 서버 실행 (크롤러와 GIL을 나누지 않도록)"""
+    server = FixtureServer(config)
+    queue.put(server.search_url)
+    server.serve_forever()
+
+
+def make_crawler(search_url, concurrency):
+    return DaumNewsCrawler(max_concurrency=concurrency, search_rate=100.0, search_burst=20, base_url=search_url)
+
+
+def run_batch(search_url, articles, concurrency, method):
+    crawler = make_crawler(search_url, concurrency)
+    try:
+        started = time.perf_counter()
+        contents = crawler.get_article_contents([article['link'] for article in articles])
+        fetched = [dict(article, content=content) for article, content in zip(articles, contents)]
+        summarized = TextSummarizer().summarize_articles(fetched, method=method)
+        analyzed, _ = SentimentAnalyzer().analyze_articles(fetched)
+        keywords = KeywordExtractor().get_keyword_frequency(
+            [KeywordExtractor().article_text(article) for article in fetched], top_n=30
+        )
+        elapsed = time.perf_counter() - started
+        # 일괄 처리는 모든 단계가 끝나야 첫 결과를 보여줄 수 있음
+        return elapsed, elapsed, [article['ai_summary'] for article in summarized], \
+            [article['sentiment'] for article in analyzed], keywords
+    finally:
+        crawler.close()
+
+
+def run_stream(search_url, articles, concurrency, method):
+    crawler = make_crawler(search_url, concurrency)
+    extractor = KeywordExtractor()
+    tally = {}
+    arrival = []
+
+    def landed_articles():
+        for index, content in crawler.iter_article_contents([article['link'] for article in articles]):
+            arrival.append(index)
+            yield dict(articles[index], content=content)
+
+    try:
+        started = time.perf_counter()
+        stream = extractor.count_keywords_stream(landed_articles(), tally)
+        stream = TextSummarizer().summarize_stream(stream, method=method)
+        stream = SentimentAnalyzer().analyze_stream(stream)
+
+        first = None
+        processed = [None] * len(articles)
+        for done, article in enumerate(stream):
+            if first is None:
+                first = time.perf_counter() - started
+            processed[arrival[done]] = article
+        keywords = extractor.top_keywords((tally[article['link']] for article in articles), top_n=30)
+        elapsed = time.perf_counter() - started
+        return first, elapsed, [article['ai_summary'] for article in processed], \
+            [article['sentiment'] for article in processed], keywords
+    finally:
+        crawler.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="일괄 처리와 스트리밍 처리의 첫 결과 시간 비교")
+    parser.add_argument('--max-articles', type=int, default=50, help="검색할 기사 수")
+    parser.add_argument('--concurrency', type=int, default=8, help="본문 동시 수집 수")
+    parser.add_argument('--method', default='simple', choices=['simple', 'textrank', 'lexrank'])
+    parser.add_argument('--latency', type=float, default=0.1, help="서버 기본 응답 지연 (초)")
+    parser.add_argument('--jitter', type=float, default=0.05, help="서버 지연 흔들림 (초)")
+    parser.add_argument('--slow-rate', type=float, default=0.05, help="느린 응답 비율")
+    parser.add_argument('--slow-latency', type=float, default=1.5, help="느린 응답에 더하는 지연 (초)")
+    args = parser.parse_args()
+
+    config = FixtureConfig(latency=args.latency, jitter=args.jitter, pages=max(1, -(-args.max_articles // 10)),
+                           slow_rate=args.slow_rate, slow_latency=args.slow_latency)
+    queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=serve, args=(config, queue), daemon=True)
+    process.start()
+    search_url = queue.get(timeout=10)
+
+    try:
+        crawler = make_crawler(search_url, args.concurrency)
+        try:
+            articles = crawler.search_news('경제', args.max_articles, parallel=True)
+        finally:
+            crawler.close()
+
+        batch = run_batch(search_url, articles, args.concurrency, args.method)
+        stream = run_stream(search_url, articles, args.concurrency, args.method)
+    finally:
+        process.terminate()
+        process.join()
+
+    print(f"\n📊 기사 {len(articles)}개, {args.method} 요약 (지연 {args.latency * 1000:.0f}ms, "
+          f"느린 응답 {args.slow_rate:.0%} +{args.slow_latency:.1f}초)")
+    print(f"{'방식':<10}{'첫 결과(초)':>12}{'전체(초)':>10}")
+    for name, result in (('일괄', batch), ('스트리밍', stream)):
+        print(f"{name:<10}{result[0]:>12.3f}{result[1]:>10.3f}")
+    same = all(b == s for b, s in zip(batch[2:], stream[2:]))
+    print(f"요약/감성/키워드 결과 동일: {'✅' if same else '❌'}")
+
+
+if __name__ == "__main__":
+    main()
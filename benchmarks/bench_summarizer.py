@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+요약 엔진 벤치마크
+합성 기사 1,000개에 대해 sumy(TextRank/LexRank)와 NumPy/SciPy 그래프 엔진의 처리 시간 비교
+- konlpy가 없으면 sumy에는 segmenter 분리기를 넣어 순위 계산 비용만 비교 (형태소 분석 비용 제외)
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sumy.parsers.plaintext import PlaintextParser
+from sumy.nlp.tokenizers import Tokenizer
+from sumy.summarizers.text_rank import TextRankSummarizer
+from sumy.summarizers.lex_rank import LexRankSummarizer
+
+from summarizer.graph_rank import GraphRanker
+from summarizer.segmenter import SentenceTokenizer
+
+SUBJECTS = ['정부는', '전문가들은', '기업들이', '시장은', '국회는', '한국은행은', '지역 주민들은', '투자자들은']
+OBJECTS = ['경제 정책을', '금리 인상을', '수출 실적을', '부동산 대책을', '물가 안정을', '일자리 창출을', '반도체 투자를']
+VERBS = ['발표했다.', '검토하고 있다.', '우려하고 있다.', '긍정적으로 평가했다.', '지켜봐야 한다고 말했다.', '강조했다.']
+DETAILS = ['올해 하반기', '지난달', '내년 상반기', '이번 주', '최근 몇 년간', '다음 분기']
+
+
+def make_article(rng, sentence_count):
+    return ' '.join(
+        f"{rng.choice(DETAILS)} {rng.choice(SUBJECTS)} {rng.choice(OBJECTS)} {rng.choice(VERBS)}"
+        for _ in range(sentence_count)
+    )
+
+
+def sumy_tokenizer():
+    try:
+        tokenizer = Tokenizer('korean')
+        tokenizer.to_sentences("테스트 문장입니다.")
+        return tokenizer, "konlpy"
+    except Exception:
+        return SentenceTokenizer(), "segmenter (konlpy 미설치)"
+
+
+def run_sumy(summarizer, tokenizer, texts, sentence_count):
+    summaries = []
+    for text in texts:
+        parser = PlaintextParser.from_string(text, tokenizer)
+        summaries.append(' '.join(str(sentence) for sentence in summarizer(parser.document, sentence_count)))
+    return summaries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="sumy와 그래프 요약 엔진 처리 시간 비교")
+    parser.add_argument('--articles', type=int, default=1000, help="합성 기사 수")
+    parser.add_argument('--sentences', type=int, default=25, help="기사당 문장 수")
+    parser.add_argument('--summary-sentences', type=int, default=3, help="요약 문장 수")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    texts = [make_article(rng, rng.randint(args.sentences // 2, args.sentences * 2)) for _ in range(args.articles)]
+    tokenizer, tokenizer_name = sumy_tokenizer()
+
+    print(f"📊 합성 기사 {args.articles}개 요약 시간 (sumy 분리기: {tokenizer_name})")
+    print(f"{'방식':<10}{'sumy(초)':>10}{'엔진(초)':>10}{'배율':>8}  결정적 출력")
+    for method, summarizer in (('textrank', TextRankSummarizer()), ('lexrank', LexRankSummarizer())):
+        started = time.perf_counter()
+        run_sumy(summarizer, tokenizer, texts, args.summary_sentences)
+        sumy_elapsed = time.perf_counter() - started
+
+        ranker = GraphRanker(method)
+        started = time.perf_counter()
+        first = ranker.summarize_batch(texts, args.summary_sentences)
+        engine_elapsed = time.perf_counter() - started
+
+        deterministic = first == GraphRanker(method).summarize_batch(texts, args.summary_sentences)
+        print(f"{method:<10}{sumy_elapsed:>10.2f}{engine_elapsed:>10.2f}"
+              f"{sumy_elapsed / engine_elapsed:>7.0f}x  {'✅' if deterministic else '❌'}")
+
+
+if __name__ == "__main__":
+    main()
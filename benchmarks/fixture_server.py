@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+크롤러 벤치마크용 로컬 테스트 서버
+다음 검색 결과 페이지와 언론사 기사 페이지를 흉내 내어 실제 사이트 없이 처리량을 측정
+- 검색 결과: div.c-item-content / div.wrap_cont / li.news 마크업을 페이지마다 번갈아 사용
+- 기사 페이지: get_article_content가 찾는 본문 선택자를 기사마다 번갈아 사용 (일부는 EUC-KR)
+- 응답 지연, 서버 오류(500) 비율, 429(Retry-After) 비율 설정 가능
+
+사용법: python benchmarks/fixture_server.py [--port 8765] [--latency 0.05] [--error-rate 0.01] [--throttle-rate 0.02]
+"""
+
+import argparse
+import hashlib
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+SEARCH_VARIANTS = ('c-item-content', 'wrap_cont', 'news')
+
+CONTENT_VARIANTS = (
+    ('div', 'class', 'article_view'),
+    ('div', 'id', 'harmonyContainer'),
+    ('div', 'class', 'news_end'),
+    ('div', 'class', 'article-body'),
+    ('div', 'class', 'article_body'),
+    ('div', 'class', 'read_body'),
+)
+
+PRESSES = ('한국일보', '서울신문', '경제매일', '지역방송', '인터넷뉴스')
+
+SENTENCE = "정부는 오늘 경제 활성화를 위한 새로운 정책을 발표했다. 전문가들은 시장의 반응을 지켜봐야 한다고 말했다. "
+
+
+class FixtureConfig:
+    def __init__(self, latency=0.05, jitter=0.02, error_rate=0.0, throttle_rate=0.0, retry_after=1,
+                 pages=5, results_per_page=10, paragraphs=40, padding_kb=80, seed=42, slow_rate=0.0,
+                 slow_latency=1.0):
+        self.latency = latency              # 기본 응답 지연 (초)
+        self.jitter = jitter                # 지연 흔들림 (초, 균등 분포)
+        self.error_rate = error_rate        # 500 응답 비율
+        self.throttle_rate = throttle_rate  # 429 응답 비율
+        self.retry_after = retry_after      # 429 응답의 Retry-After (초)
+        self.pages = pages                  # 키워드별 검색 결과 페이지 수
+        self.results_per_page = results_per_page
+        self.paragraphs = paragraphs        # 기사 본문 문단 수
+        self.padding_kb = padding_kb        # 본문 뒤 광고/관련기사 영역 크기
+        self.seed = seed
+        self.slow_rate = slow_rate          # 느린 응답 비율 (가끔 한참 늦는 언론사 재현)
+        self.slow_latency = slow_latency    # 느린 응답에 더하는 지연 (초)
+
+
+def article_id(keyword, page, index):
+    """키워드/페이지/순번으로 정해지는 기사 ID (같은 요청에는 항상 같은 결과)"""
+    digest = hashlib.blake2b(f"{keyword}:{page}:{index}".encode('utf-8'), digest_size=6).hexdigest()
+    return int(digest, 16) % 10 ** 12
+
+
+def render_search_page(base_url, keyword, page, config):
+    """검색 결과 페이지 (페이지마다 다른 마크업)"""
+    if page > config.pages:
+        return '<html><body><div class="result_none">검색 결과가 없습니다.</div></body></html>'
+
+    variant = SEARCH_VARIANTS[(page - 1) % len(SEARCH_VARIANTS)]
+    items = []
+    for index in range(config.results_per_page):
+        number = article_id(keyword, page, index)
+        press = number % len(PRESSES)
+        link = f"{base_url}/press{press}/article/{number}"
+        title = f'<a class="f_link_b" href="{link}">{keyword} 관련 {PRESSES[press]} 기사 {number}번 제목</a>'
+        summary = f'<p class="c-item-text">{keyword}에 대한 {PRESSES[press]}의 기사 요약입니다.</p>'
+        source = f'<span class="c-item-source">{PRESSES[press]}</span>'
+        if variant == 'news':
+            items.append(f'<li class="news">{title}{summary}{source}</li>')
+        else:
+            items.append(f'<div class="{variant}">{title}{summary}{source}</div>')
+
+    listing = ''.join(items)
+    if variant == 'news':
+        listing = f'<ul class="list_news">{listing}</ul>'
+    return (f'<html><head><meta charset="utf-8"><title>{keyword} : 다음 뉴스검색</title></head>'
+            f'<body><div id="header">검색</div><div id="newsColl">{listing}</div></body></html>')
+
+
+def render_article_page(number, config):
+    """기사 페이지 (기사마다 다른 본문 선택자, 5개 중 1개는 EUC-KR)"""
+    tag, kind, value = CONTENT_VARIANTS[number % len(CONTENT_VARIANTS)]
+    attribute = f'id="{value}"' if kind == 'id' else f'class="{value}"'
+    body = ''.join(f'<p>{SENTENCE}</p>' for _ in range(config.paragraphs))
+    padding = '<div class="ad">' + '관련기사 ' * (config.padding_kb * 1024 // 15) + '</div>'
+    encoding = 'euc-kr' if number % 5 == 0 else 'utf-8'
+    html = (f'<html><head><meta charset="{encoding}"><title>기사 {number}</title>'
+            f'<script>var tracking = "{number}";</script></head>'
+            f'<body><div class="nav">메뉴</div><{tag} {attribute}>{body}</{tag}>{padding}</body></html>')
+    return html.encode(encoding), encoding
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        config = server.config
+        parts = urlparse(self.path)
+
+        with server.lock:
+            roll = server.random.random()
+            delay = max(0.0, config.latency + server.random.uniform(-config.jitter, config.jitter))
+            if config.slow_rate and server.random.random() < config.slow_rate:
+                delay += config.slow_latency
+        time.sleep(delay)
+
+        if roll < config.throttle_rate:
+            self._send(429, b'Too Many Requests', 'text/plain', {'Retry-After': str(config.retry_after)})
+            return
+        if roll < config.throttle_rate + config.error_rate:
+            self._send(500, b'Internal Server Error', 'text/plain')
+            return
+
+        if parts.path == '/search':
+            query = parse_qs(parts.query)
+            keyword = query.get('q', [''])[0]
+            page = int(query.get('p', ['1'])[0])
+            body = render_search_page(server.base_url, keyword, page, config).encode('utf-8')
+            self._send(200, body, 'text/html; charset=utf-8')
+        elif '/article/' in parts.path:
+            number = int(parts.path.rsplit('/', 1)[-1])
+            body, encoding = render_article_page(number, config)
+            # 일부 언론사처럼 charset 없는 Content-Type도 섞음
+            self._send(200, body, 'text/html' if encoding != 'utf-8' else 'text/html; charset=utf-8')
+        else:
+            self._send(404, b'Not Found', 'text/plain')
+
+    def _send(self, status, body, content_type, headers=None):
+        with self.server.lock:
+            self.server.stats[status] = self.server.stats.get(status, 0) + 1
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # 스트리밍 수집이 본문을 찾고 연결을 끊은 경우
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FixtureServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, config=None, host='127.0.0.1', port=0):
+        super().__init__((host, port), FixtureHandler)
+        self.config = config or FixtureConfig()
+        self.lock = threading.Lock()
+        self.random = random.Random(self.config.seed)
+        self.stats = {}
+        self.base_url = f"http://{host}:{self.server_address[1]}"
+        self.search_url = self.base_url + "/search"
+
+    def handle_error(self, request, client_address):
+        # 클라이언트가 먼저 연결을 끊은 경우는 정상 동작이므로 무시
+        if not isinstance(sys.exc_info()[1], (BrokenPipeError, ConnectionResetError)):
+            super().handle_error(request, client_address)
+
+    def start(self):
+        """백그라운드 스레드에서 실행"""
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+
+def main():
+    parser = argparse.ArgumentParser(description="크롤러 벤치마크용 로컬 테스트 서버")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.05, help="기본 응답 지연 (초)")
+    parser.add_argument('--jitter', type=float, default=0.02, help="지연 흔들림 (초)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="500 응답 비율")
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help="429 응답 비율")
+    parser.add_argument('--pages', type=int, default=5, help="키워드별 검색 결과 페이지 수")
+    parser.add_argument('--slow-rate', type=float, default=0.0, help="느린 응답 비율")
+    parser.add_argument('--slow-latency', type=float, default=1.0, help="느린 응답에 더하는 지연 (초)")
+    args = parser.parse_args()
+
+    config = FixtureConfig(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                           throttle_rate=args.throttle_rate, pages=args.pages, slow_rate=args.slow_rate,
+                           slow_latency=args.slow_latency)
+    server = FixtureServer(config, port=args.port)
+    print(f"🧪 테스트 서버 실행 중: {server.search_url} (Ctrl+C로 종료)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n👋 종료합니다. 응답 통계: {server.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+대량 수집 스크립트
+검색 결과 페이지를 끝까지 넘기며 기사를 data/bulk/<키워드>.jsonl에 바로 추가
+중단된 경우 다시 실행하면 마지막으로 완료한 페이지 다음부터 이어서 수집
+
+사용법: python bulk_crawl.py 키워드 [--max-articles N] [--max-pages N] [--output 경로] [--restart] [--archive]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from crawler.daum_crawler import DaumNewsCrawler
+from crawler.archive import HtmlArchive
+
+
+def main():
+    parser = argparse.ArgumentParser(description="키워드 뉴스 대량 수집 (JSONL, 이어받기 지원)")
+    parser.add_argument('keyword', help="수집할 검색 키워드")
+    parser.add_argument('--max-articles', type=int, default=None, help="최대 기사 수 (생략하면 검색 결과 끝까지)")
+    parser.add_argument('--max-pages', type=int, default=1000, help="최대 검색 페이지 수")
+    parser.add_argument('--output', default=None, help="JSONL 파일 경로 (기본: data/bulk/<키워드>.jsonl)")
+    parser.add_argument('--restart', action='store_true', help="이전 진행 상황을 지우고 처음부터 수집")
+    parser.add_argument('--archive', action='store_true', help="원본 응답을 data/archive에 함께 보관")
+    args = parser.parse_args()
+
+    crawler = DaumNewsCrawler(stream=True, archive=HtmlArchive() if args.archive else None)
+    started = time.perf_counter()
+
+    def report(written, pages):
+        elapsed = time.perf_counter() - started
+        print(f"📄 {pages}페이지 완료, 누적 {written}개 기사 ({elapsed:.0f}초)")
+
+    try:
+        result = crawler.crawl_bulk(
+            args.keyword,
+            sink_path=args.output,
+            max_articles=args.max_articles,
+            max_pages=args.max_pages,
+            resume=not args.restart,
+            progress_callback=report
+        )
+    except KeyboardInterrupt:
+        print("\n⏸️ 중단되었습니다. 다시 실행하면 마지막으로 완료한 페이지 다음부터 이어서 수집합니다.")
+        return
+    finally:
+        crawler.close()
+
+    if result['complete']:
+        status = "검색 결과 끝까지 수집"
+    elif result['error']:
+        status = "검색 요청 실패로 중단, 다시 실행하면 이어서 수집"
+    else:
+        status = "제한에 도달해 중단"
+    print(f"✅ {result['articles_written']}개 기사 → {result['sink_path']} ({status})")
+    print(f"♻️ 중복 제외 {crawler.get_crawl_stats()['duplicates_skipped']}건")
+
+
+if __name__ == "__main__":
+    main()
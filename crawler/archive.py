@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+원본 HTML 보관소 (WARC 형식)
+크롤링한 응답을 레코드마다 독립된 gzip 멤버로 압축해 세그먼트 파일에 이어 쓰고,
+URL 해시 → (세그먼트, 오프셋, 길이) 색인을 메모리 매핑해 재크롤링 없이 다시 처리할 수 있게 함
+"""
+
+import gzip
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import uuid
+import zlib
+from datetime import datetime, timezone
+
+from requests.structures import CaseInsensitiveDict
+
+from crawler.http_cache import normalize_url
+
+# 색인 항목: URL 해시(8바이트), 세그먼트 번호, 오프셋, 압축 길이
+INDEX_ENTRY = struct.Struct('<8sIQI')
+SEGMENT_NAME = "segment-{:05d}.warc.gz"
+
+
+def archive_key(url, params=None):
+    """요청 URL(쿼리 포함)의 8바이트 해시"""
+    return hashlib.blake2b(normalize_url(url, params).encode('utf-8'), digest_size=8).digest()
+
+
+def _parse_record(data):
+    """압축을 푼 WARC 레코드를 딕셔너리로 변환"""
+    warc_head, _, block = data.partition(b"\r\n\r\n")
+    warc_headers = {}
+    for line in warc_head.decode('utf-8').split("\r\n")[1:]:
+        name, _, value = line.partition(':')
+        warc_headers[name.strip()] = value.strip()
+
+    block = block[:int(warc_headers.get('Content-Length', len(block)))]
+    http_head, _, body = block.partition(b"\r\n\r\n")
+    lines = http_head.decode('iso-8859-1').split("\r\n")
+    headers = CaseInsensitiveDict()
+    for line in lines[1:]:
+        name, _, value = line.partition(':')
+        headers[name.strip()] = value.strip()
+
+    return {
+        'url': warc_headers.get('WARC-Target-URI'),
+        'kind': warc_headers.get('WARC-Crawl-Kind', 'article'),
+        'date': warc_headers.get('WARC-Date'),
+        'truncated': 'WARC-Truncated' in warc_headers,
+        'status_code': int(lines[0].split()[1]),
+        'headers': headers,
+        'content': body
+    }
+
+
+class HtmlArchive:
+    def __init__(self, directory="data/archive", segment_max_bytes=64 * 1024 * 1024):
+        self.directory = directory
+        self.segment_max_bytes = segment_max_bytes  # 세그먼트 파일 하나의 최대 크기
+        self.index_path = os.path.join(directory, "index.bin")  # URL 해시순으로 정렬된 색인 (메모리 매핑)
+        self.log_path = os.path.join(directory, "index.log")    # 마지막 정리 이후 추가된 색인 (추가 전용)
+
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self._lock = threading.Lock()
+        self.stats = {'stored': 0, 'lookups': 0, 'hits': 0}
+
+        # 최근 추가분은 메모리 딕셔너리, 나머지는 정렬된 색인 파일에서 이진 탐색
+        self.recent = {}
+        if os.path.exists(self.log_path):
+            with open(self.log_path, 'rb') as f:
+                data = f.read()
+            usable = len(data) - len(data) % INDEX_ENTRY.size  # 중간에 끊긴 마지막 기록은 무시
+            for offset in range(0, usable, INDEX_ENTRY.size):
+                digest, segment, position, length = INDEX_ENTRY.unpack_from(data, offset)
+                self.recent[digest] = (segment, position, length)
+        self._index_file = None
+        self._index = None
+        self._open_index()
+
+        segments = self._segment_numbers()
+        self.segment = segments[-1] if segments else 0
+        self._writer = None
+
+    def _segment_path(self, segment):
+        return os.path.join(self.directory, SEGMENT_NAME.format(segment))
+
+    def _segment_numbers(self):
+        numbers = []
+        for name in os.listdir(self.directory):
+            if name.startswith("segment-") and name.endswith(".warc.gz"):
+                numbers.append(int(name[len("segment-"):-len(".warc.gz")]))
+        return sorted(numbers)
+
+    def _open_index(self):
+        if os.path.exists(self.index_path) and os.path.getsize(self.index_path) >= INDEX_ENTRY.size:
+            self._index_file = open(self.index_path, 'rb')
+            self._index = mmap.mmap(self._index_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _close_index(self):
+        if self._index is not None:
+            self._index.close()
+            self._index_file.close()
+        self._index = None
+        self._index_file = None
+
+    def _search_index(self, digest):
+        """정렬된 색인에서 이진 탐색 (없으면 None)"""
+        if self._index is None:
+            return None
+        low, high = 0, len(self._index) // INDEX_ENTRY.size
+        while low < high:
+            middle = (low + high) // 2
+            offset = middle * INDEX_ENTRY.size
+            current = self._index[offset:offset + 8]
+            if current < digest:
+                low = middle + 1
+            elif current > digest:
+                high = middle
+            else:
+                return INDEX_ENTRY.unpack_from(self._index, offset)[1:]
+        return None
+
+    def _build_record(self, url, kind, status_code, reason, headers, content, truncated):
+        http_head = f"HTTP/1.1 {status_code} {reason or ''}".rstrip() + "\r\n"
+        for name, value in (headers or {}).items():
+            # 본문은 압축을 푼 상태로 저장하므로 전송 관련 헤더는 제외
+            if name.lower() in ('content-encoding', 'transfer-encoding', 'content-length'):
+                continue
+            http_head += f"{name}: {value}\r\n"
+        block = http_head.encode('iso-8859-1', errors='replace') + b"\r\n" + content
+
+        warc_head = [
+            "WARC/1.0",
+            "WARC-Type: response",
+            f"WARC-Record-ID: <urn:uuid:{uuid.uuid4()}>",
+            f"WARC-Date: {datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')}",
+            f"WARC-Target-URI: {url}",
+            f"WARC-Crawl-Kind: {kind}",
+            "Content-Type: application/http; msgtype=response",
+            f"Content-Length: {len(block)}",
+        ]
+        if truncated:
+            warc_head.append("WARC-Truncated: length")  # 본문을 찾은 뒤 다운로드를 중단한 응답
+        return ("\r\n".join(warc_head) + "\r\n\r\n").encode('utf-8') + block + b"\r\n\r\n"
+
+    def store(self, url, params, kind, status_code, headers, content, reason=None, truncated=False):
+        """응답 하나를 압축해 현재 세그먼트에 추가하고 색인에 기록"""
+        target = normalize_url(url, params)
+        record = gzip.compress(
+            self._build_record(target, kind, status_code, reason, headers, content or b'', truncated),
+            compresslevel=6
+        )
+        digest = archive_key(url, params)
+
+        with self._lock:
+            if self._writer is None or self._writer.tell() >= self.segment_max_bytes:
+                if self._writer is not None:
+                    self._writer.close()
+                    self.segment += 1
+                self._writer = open(self._segment_path(self.segment), 'ab')
+            position = self._writer.tell()
+            self._writer.write(record)
+            self._writer.flush()
+
+            with open(self.log_path, 'ab') as f:
+                f.write(INDEX_ENTRY.pack(digest, self.segment, position, len(record)))
+            self.recent[digest] = (self.segment, position, len(record))
+            self.stats['stored'] += 1
+
+    def record_response(self, url, params, kind, response):
+        """requests 응답을 그대로 보관"""
+        self.store(url, params, kind, response.status_code, response.headers, response.content,
+                   reason=response.reason)
+
+    def lookup(self, url, params=None):
+        """URL의 가장 최근 레코드 (없으면 None)"""
+        digest = archive_key(url, params)
+        with self._lock:
+            self.stats['lookups'] += 1
+            location = self.recent.get(digest) or self._search_index(digest)
+        if location is None:
+            return None
+
+        segment, position, length = location
+        with open(self._segment_path(segment), 'rb') as f:
+            f.seek(position)
+            record = _parse_record(gzip.decompress(f.read(length)))
+        if record['url'] != normalize_url(url, params):
+            return None  # 해시 충돌
+        with self._lock:
+            self.stats['hits'] += 1
+        return record
+
+    def iter_records(self, kind=None, chunk_size=64 * 1024):
+        """모든 세그먼트를 저장 순서대로 읽으며 레코드 반환 (kind로 종류 제한)
+        세그먼트를 메모리 매핑하고 오프셋을 옮겨 가며 gzip 멤버를 하나씩 풀어 세그먼트 크기에 비례한 시간에 재생"""
+        for segment in self._segment_numbers():
+            path = self._segment_path(segment)
+            if os.path.getsize(path) == 0:
+                continue
+            with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                offset = 0
+                while offset < len(mapped):
+                    # gzip 멤버 하나를 조각씩 풀고, 다음 멤버는 소비한 바이트 뒤에서 시작
+                    # (남은 데이터 전체를 복사하지 않도록 조각 단위로만 읽음)
+                    decompressor = zlib.decompressobj(wbits=31)
+                    parts = []
+                    position = offset
+                    while not decompressor.eof and position < len(mapped):
+                        chunk = mapped[position:position + chunk_size]
+                        parts.append(decompressor.decompress(chunk))
+                        position += len(chunk)
+                    if not decompressor.eof:
+                        break  # 쓰는 도중 끊긴 마지막 레코드
+                    offset = position - len(decompressor.unused_data)
+                    record = _parse_record(b''.join(parts))
+                    if kind is None or record['kind'] == kind:
+                        yield record
+
+    def compact(self):
+        """추가된 색인을 정렬된 색인 파일에 병합 (같은 URL은 최신 기록만 유지)"""
+        with self._lock:
+            if not self.recent:
+                return
+            entries = {}
+            if self._index is not None:
+                for offset in range(0, len(self._index) - len(self._index) % INDEX_ENTRY.size, INDEX_ENTRY.size):
+                    digest, segment, position, length = INDEX_ENTRY.unpack_from(self._index, offset)
+                    entries[digest] = (segment, position, length)
+            entries.update(self.recent)
+
+            temp_path = self.index_path + ".tmp"
+            with open(temp_path, 'wb') as f:
+                for digest in sorted(entries):
+                    f.write(INDEX_ENTRY.pack(digest, *entries[digest]))
+            self._close_index()
+            os.replace(temp_path, self.index_path)
+            open(self.log_path, 'wb').close()
+            self.recent = {}
+            self._open_index()
+
+    def get_stats(self):
+        """보관/조회 통계"""
+        with self._lock:
+            stats = dict(self.stats)
+            stats['segments'] = len(self._segment_numbers())
+            stats['indexed'] = len(self._index) // INDEX_ENTRY.size if self._index is not None else 0
+            stats['pending_index'] = len(self.recent)  # 다음 정리(compact) 때 병합될 항목
+        return stats
+
+    def close(self):
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+        self.compact()
+        self._close_index()
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+수집 결과 저장
+다음 뉴스 검색과 RSS 피드 수집기가 같은 articles.json 형식으로 저장하도록 공유하는 함수
+"""
+
+import json
+import os
+
+
+def save_articles(articles, filename="articles.json", data_dir="data"):
+    """수집한 기사를 JSON 파일로 저장 (저장한 경로, 실패하면 None 반환)"""
+    if not os.path.exists(data_dir):
+        os.makedirs(data_dir)
+    
+    filepath = os.path.join(data_dir, filename)
+    
+    try:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(articles, f, ensure_ascii=False, indent=2)
+        print(f"💾 기사 데이터가 {filepath}에 저장되었습니다.")
+        return filepath
+    except Exception as e:
+        print(f"❌ 파일 저장 오류: {e}")
+        return None
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+기사 본문 저장소
+전체 본문은 기사 ID(정규화 URL 해시)별로 zlib 압축해 SQLite에 따로 저장하고,
+articles.json 등 결과 파일에는 메타데이터와 짧은 미리보기만 남김
+- 요약/키워드/감성 분석 단계는 필요한 본문만 꺼내 압축 해제
+- 화면은 펼친 기사의 본문만 불러옴
+"""
+
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+from crawler.url_utils import url_digest
+
+PREVIEW_CHARS = 200
+
+
+def article_id(url):
+    """기사 링크로 정해지는 본문 ID (정규화 URL 해시 16진수)"""
+    return url_digest(url).hex()
+
+
+class ArticleBlobStore:
+    def __init__(self, path="data/article_bodies.sqlite3", compress_level=6):
+        self.path = path
+        self.compress_level = compress_level
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS bodies (
+                id TEXT PRIMARY KEY,
+                body BLOB,
+                length INTEGER,
+                stored_at REAL
+            )
+        """)
+        self._conn.commit()
+        self.stats = {'stored': 0, 'loaded': 0, 'bytes_raw': 0, 'bytes_stored': 0}
+
+    def put(self, content_id, content):
+        """본문 압축 저장 (같은 ID는 덮어씀)"""
+        raw = content.encode('utf-8')
+        body = zlib.compress(raw, self.compress_level)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO bodies (id, body, length, stored_at) VALUES (?, ?, ?, ?)",
+                (content_id, body, len(content), time.time())
+            )
+            self._conn.commit()
+            self.stats['stored'] += 1
+            self.stats['bytes_raw'] += len(raw)
+            self.stats['bytes_stored'] += len(body)
+
+    def get(self, content_id):
+        """본문 압축 해제 후 반환 (없으면 None)"""
+        with self._lock:
+            row = self._conn.execute("SELECT body FROM bodies WHERE id = ?", (content_id,)).fetchone()
+            if row is None:
+                return None
+            self.stats['loaded'] += 1
+        return zlib.decompress(row[0]).decode('utf-8')
+
+    def __contains__(self, content_id):
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM bodies WHERE id = ?", (content_id,)).fetchone() is not None
+
+    def detach(self, articles, preview_chars=PREVIEW_CHARS):
+        """기사의 본문을 저장소로 옮기고 미리보기/본문 ID/길이만 남긴 사본 반환"""
+        detached = []
+        for article in articles:
+            article = dict(article)
+            content = article.get('content')
+            # 본문이 비었거나 링크가 없는 기사는 'content' 필드를 그대로 유지
+            if content and article.get('link'):
+                content_id = article_id(article['link'])
+                self.put(content_id, content)
+                del article['content']
+                article['content_id'] = content_id
+                article['content_length'] = len(content)
+                article['content_preview'] = content[:preview_chars]
+            detached.append(article)
+        return detached
+
+    def body(self, article):
+        """기사의 전체 본문 (본문이 기록에 있으면 그대로, 없으면 저장소에서 불러옴)"""
+        if article.get('content'):
+            return article['content']
+        if article.get('content_id'):
+            content = self.get(article['content_id'])
+            if content is not None:
+                return content
+        return article.get('content_preview', '')
+
+    def get_stats(self):
+        """저장/불러오기 횟수와 압축률"""
+        with self._lock:
+            stats = dict(self.stats)
+        stats['ratio'] = round(stats['bytes_stored'] / stats['bytes_raw'], 3) if stats['bytes_raw'] else 0.0
+        return stats
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
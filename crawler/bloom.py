@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+블룸 필터
+수집한 기사 수와 관계없이 고정된 메모리로 중복 여부를 확인 (대량 수집용)
+- 이미 본 기사를 새 기사로 판단하는 일은 없고, 설정한 오탐률만큼 새 기사를 중복으로 판단할 수 있음
+"""
+
+import hashlib
+import math
+import struct
+
+_HEADER = struct.Struct('<QII')  # 비트 수, 해시 함수 수, 추가된 항목 수
+
+
+class BloomFilter:
+    def __init__(self, capacity=200000, error_rate=0.001, num_bits=None, num_hashes=None):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = num_bits or max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.num_hashes = num_hashes or max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key):
+        # 128비트 해시 하나를 둘로 나눠 k개의 위치 생성 (double hashing)
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        return [(first + i * second) % self.num_bits for i in range(self.num_hashes)]
+
+    def __contains__(self, key):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    def __len__(self):
+        return self.count
+
+    def add(self, key):
+        """항목 추가. 새 항목이면 True, 이미 있던 항목(또는 오탐)이면 False"""
+        added = False
+        for position in self._positions(key):
+            mask = 1 << (position & 7)
+            if not self.bits[position >> 3] & mask:
+                self.bits[position >> 3] |= mask
+                added = True
+        if added:
+            self.count += 1
+        return added
+
+    def to_bytes(self):
+        return _HEADER.pack(self.num_bits, self.num_hashes, self.count) + bytes(self.bits)
+
+    @classmethod
+    def from_bytes(cls, data):
+        num_bits, num_hashes, count = _HEADER.unpack_from(data)
+        bloom = cls(capacity=1, num_bits=num_bits, num_hashes=num_hashes)
+        bloom.bits = bytearray(data[_HEADER.size:_HEADER.size + len(bloom.bits)])
+        bloom.count = count
+        return bloom
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+대량 수집 결과 저장소
+기사를 받는 대로 JSONL 파일 끝에 추가하고, 페이지 단위로 체크포인트를 남겨
+중간에 중단돼도 마지막으로 완료한 페이지 다음부터 이어서 수집
+"""
+
+import json
+import os
+import struct
+
+from crawler.bloom import BloomFilter
+
+_LENGTH = struct.Struct('<I')
+
+
+class JsonlArticleSink:
+    """기사 한 건을 JSON 한 줄로 이어 쓰는 추가 전용 파일"""
+
+    def __init__(self, path):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self._file = open(path, 'ab')
+
+    def tell(self):
+        return self._file.tell()
+
+    def truncate(self, size):
+        """체크포인트 이후에 쓰다 만 기록 제거"""
+        self._file.truncate(size)
+        self._file.seek(size)
+
+    def write(self, article):
+        self._file.write((json.dumps(article, ensure_ascii=False) + "\n").encode('utf-8'))
+
+    def sync(self):
+        """버퍼를 디스크까지 기록 (체크포인트 전에 호출)"""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        self._file.close()
+
+
+def iter_jsonl_articles(path):
+    """JSONL 파일의 기사를 하나씩 읽기 (전체를 메모리에 올리지 않음)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+class BulkCheckpoint:
+    """수집 진행 상태와 중복 확인용 블룸 필터를 한 파일에 원자적으로 저장"""
+
+    def __init__(self, path, bloom_capacity=200000, error_rate=0.001):
+        self.path = path
+        self.state = {'next_page': 1, 'articles_written': 0, 'sink_size': 0, 'complete': False}
+        self.bloom = None
+
+        if os.path.exists(path):
+            try:
+                with open(path, 'rb') as f:
+                    data = f.read()
+                length = _LENGTH.unpack_from(data)[0]
+                self.state.update(json.loads(data[_LENGTH.size:_LENGTH.size + length].decode('utf-8')))
+                self.bloom = BloomFilter.from_bytes(data[_LENGTH.size + length:])
+            except (OSError, ValueError, struct.error):
+                self.bloom = None
+
+        if self.bloom is None:
+            self.bloom = BloomFilter(capacity=bloom_capacity, error_rate=error_rate)
+
+    def save(self, **state):
+        """상태 갱신 후 임시 파일에 쓰고 교체 (중간에 중단돼도 이전 체크포인트 유지)"""
+        self.state.update(state)
+        header = json.dumps(self.state, ensure_ascii=False).encode('utf-8')
+        temp_path = self.path + ".tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(_LENGTH.pack(len(header)) + header + self.bloom.to_bytes())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+협력적 작업 취소
+새 검색이 시작되면 이전 실행의 토큰을 취소해 크롤러 루프와 이후 단계가 스스로 멈추게 함
+- 대기 중인 요청은 보내지 않고, 읽는 중인 응답은 등록된 콜백으로 소켓을 닫아 즉시 끊음
+"""
+
+import itertools
+import socket
+import threading
+
+
+class CrawlCancelled(Exception):
+    """취소된 토큰으로 작업을 계속하려 할 때 발생"""
+
+
+def abort_response(response):
+    """읽는 중인 requests 응답의 소켓을 닫아 블로킹된 읽기를 바로 깨움"""
+    connection = getattr(response.raw, 'connection', None)
+    sock = getattr(connection, 'sock', None)
+    if sock is not None:
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+    response.close()
+
+
+class CancellationToken:
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks = {}              # 취소 시 호출할 콜백 (진행 중인 응답의 close 등)
+        self._handles = itertools.count(1)
+        self.reason = None
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def cancel(self, reason=None):
+        """토큰 취소 후 등록된 콜백 실행 (여러 번 호출해도 한 번만 실행)"""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.reason = reason
+            self._event.set()
+            callbacks = list(self._callbacks.values())
+            self._callbacks.clear()
+
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                pass
+
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise CrawlCancelled(self.reason or "작업이 취소되었습니다.")
+
+    def sleep(self, seconds):
+        """취소되면 바로 깨어나는 sleep (취소 시 CrawlCancelled)"""
+        if self._event.wait(timeout=max(0.0, seconds)):
+            self.raise_if_cancelled()
+
+    def register(self, callback):
+        """취소 시 호출할 콜백 등록 (이미 취소됐으면 바로 실행). 해제용 핸들 반환"""
+        with self._lock:
+            if not self._event.is_set():
+                handle = next(self._handles)
+                self._callbacks[handle] = callback
+                return handle
+        callback()
+        return None
+
+    def unregister(self, handle):
+        if handle is None:
+            return
+        with self._lock:
+            self._callbacks.pop(handle, None)
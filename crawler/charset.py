@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+문자셋 판별기
+response.text의 바이트 단위 인코딩 자동 감지(느림)를 피하기 위해
+HTTP 헤더 → <meta charset> → 호스트별 학습 결과 → UTF-8 유효성 검사(앞부분만) 순으로 확인하고
+그래도 모를 때만 전체 감지를 실행
+"""
+
+import codecs
+import re
+import threading
+
+from requests.compat import chardet
+
+# <meta charset="..."> 또는 <meta http-equiv content="text/html; charset=...">
+_META_CHARSET = re.compile(rb'''<meta[^>]+?charset\s*=\s*["']?\s*([A-Za-z0-9_\-:.]+)''', re.IGNORECASE)
+_HEADER_CHARSET = re.compile(r'''charset\s*=\s*["']?\s*([A-Za-z0-9_\-:.]+)''', re.IGNORECASE)
+
+# 한국어 레거시 인코딩은 상위 호환인 cp949로 통일
+ENCODING_ALIASES = {
+    'euc-kr': 'cp949',
+    'euc_kr': 'cp949',
+    'euckr': 'cp949',
+    'ks_c_5601-1987': 'cp949',
+    'ksc5601': 'cp949',
+    'x-windows-949': 'cp949',
+    'windows-949': 'cp949',
+    'uhc': 'cp949',
+    'utf8': 'utf-8',
+}
+
+
+def normalize_encoding(name):
+    """인코딩 이름 정규화 (알 수 없는 인코딩이면 None)"""
+    if not name:
+        return None
+    name = name.strip().strip('"\'').lower()
+    name = ENCODING_ALIASES.get(name, name)
+    try:
+        return codecs.lookup(name).name
+    except LookupError:
+        return None
+
+
+class CharsetResolver:
+    def __init__(self, sniff_bytes=4096, validate_bytes=64 * 1024):
+        self.sniff_bytes = sniff_bytes  # <meta charset>을 찾을 앞부분 크기
+        self.validate_bytes = validate_bytes  # UTF-8 유효성을 검사할 앞부분 크기
+        self.host_encodings = {}        # 호스트별로 학습한 인코딩
+        self.stats = {'header': 0, 'meta': 0, 'host': 0, 'utf-8': 0, 'detect': 0}
+        self._lock = threading.Lock()
+
+    def from_headers(self, headers):
+        """Content-Type 헤더에 명시된 charset (없으면 None)"""
+        content_type = headers.get('Content-Type', '') if headers else ''
+        match = _HEADER_CHARSET.search(content_type)
+        return normalize_encoding(match.group(1)) if match else None
+
+    def from_meta(self, content):
+        """문서 앞부분의 <meta charset> 값 (없으면 None)"""
+        match = _META_CHARSET.search(content[:self.sniff_bytes])
+        return normalize_encoding(match.group(1).decode('ascii', 'ignore')) if match else None
+
+    def _record(self, host, source, encoding):
+        with self._lock:
+            self.stats[source] += 1
+            if host and source in ('header', 'meta', 'utf-8', 'detect'):
+                self.host_encodings[host] = encoding
+
+    def resolve(self, headers, content, host=None, complete=True):
+        """(인코딩, 판별 방법) 반환. complete=False면 문서 일부만으로 판단 (스트리밍)"""
+        encoding, source, _ = self._resolve(headers, content, host, complete)
+        return encoding, source
+
+    def _resolve(self, headers, content, host, complete):
+        """(인코딩, 판별 방법, 디코딩한 문자열) 반환. 판별하면서 문서 전체를 디코딩한 경우에만 문자열이 있음"""
+        encoding = self.from_headers(headers)
+        if encoding:
+            self._record(host, 'header', encoding)
+            return encoding, 'header', None
+
+        encoding = self.from_meta(content)
+        if encoding:
+            self._record(host, 'meta', encoding)
+            return encoding, 'meta', None
+
+        encoding = self.host_encodings.get(host) if host else None
+        if encoding:
+            self._record(host, 'host', encoding)
+            return encoding, 'host', None
+
+        # UTF-8 디코딩은 C 구현이라 빠르고, 잘못된 바이트가 있으면 바로 실패함
+        # (레거시 인코딩 문서가 우연히 올바른 UTF-8일 가능성은 매우 낮으므로 앞부분만 검사)
+        whole = len(content) <= self.validate_bytes
+        try:
+            text = codecs.getincrementaldecoder('utf-8')().decode(
+                content if whole else content[:self.validate_bytes], final=complete and whole
+            )
+            self._record(host, 'utf-8', 'utf-8')
+            return 'utf-8', 'utf-8', text if whole and complete else None
+        except UnicodeDecodeError:
+            pass
+
+        # 최후의 수단: 바이트 분포 기반 전체 감지
+        detected = chardet.detect(content)['encoding'] if chardet else None
+        encoding = normalize_encoding(detected) or 'cp949'
+        self._record(host, 'detect', encoding)
+        return encoding, 'detect', None
+
+    def decode(self, response, host=None):
+        """응답 본문을 판별한 인코딩으로 디코딩"""
+        if not response.content:
+            return ""
+        return self.decode_content(response.headers, response.content, host)
+
+    def decode_content(self, headers, content, host=None, complete=True):
+        """원본 바이트를 판별한 인코딩으로 디코딩 (판별 중 이미 디코딩했으면 그 결과 사용)"""
+        encoding, _, text = self._resolve(headers, content, host, complete)
+        return text if text is not None else content.decode(encoding, errors='replace')
+
+    def get_stats(self):
+        """판별 방법별 횟수"""
+        with self._lock:
+            return dict(self.stats)
@@ -5,66 +5,552 @@
 키워드로 뉴스 검색하고 기사 내용을 수집
 """
 
-import requests
 from bs4 import BeautifulSoup
-import json
-import time
+import asyncio
+import itertools
+import functools
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import os
+import queue
+import re
+import threading
+import time
+from collections import deque
+from urllib.parse import urlparse
+
+from crawler.http_session import create_session, ConnectionStats, DEFAULT_TIMEOUT
+from crawler.rate_limiter import RateLimiter
+from crawler.host_scheduler import HostScheduler, THROTTLE_STATUS_CODES
+from crawler.charset import CharsetResolver
+from crawler.url_utils import canonicalize_url
+from crawler.article_output import save_articles
+from crawler.cancellation import CrawlCancelled, abort_response
+from crawler.bulk_sink import JsonlArticleSink, BulkCheckpoint
+
+try:
+    from crawler.extractor import ArticleExtractor, init_worker, extract_content_worker, parse_search_worker
+except ImportError:
+    ArticleExtractor = None  # lxml이 없으면 BeautifulSoup 파서 사용
+
+def keyword_filename(keyword):
+    """키워드를 파일 이름으로 쓸 수 있게 변환"""
+    return re.sub(r'[\\/:*?"<>|\s]+', '_', keyword.strip())
 
 class DaumNewsCrawler:
-    def __init__(self):
-        self.base_url = "https://search.daum.net/search"
+    def __init__(self, max_concurrency=8, timeout=DEFAULT_TIMEOUT, max_retries=3, backoff_factor=0.5,
+                 search_rate=2.0, search_burst=3, scheduler=None, cache=None,
+                 parser='lxml', stream=False, max_article_bytes=2 * 1024 * 1024, seen_store=None,
+                 parse_workers=0, max_pending_parses=None, watermarks=None, archive=None, cancel_token=None,
+                 base_url="https://search.daum.net/search"):
+        self.base_url = base_url  # 검색 주소 (벤치마크 시 로컬 테스트 서버로 변경)
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        # 본문 동시 수집 시 최대 동시 요청 수
+        self.max_concurrency = max_concurrency
+        
+        # 검색 페이지 설정 (페이지당 결과 수는 병렬 요청 시 필요한 페이지 수 추정에 사용)
+        self.max_pages = 5
+        self.results_per_page = 10
+        self.search_rate_limiter = RateLimiter(rate=search_rate, burst=search_burst)
+        
+        # keep-alive 커넥션 풀을 공유하는 세션 (재시도/백오프 포함)
+        self.timeout = timeout  # (연결, 읽기) 타임아웃
+        self.connection_stats = ConnectionStats()
+        self.session = create_session(
+            headers=self.headers,
+            pool_maxsize=max(10, max_concurrency),
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+            stats=self.connection_stats
+        )
+        
+        # 호스트별 적응형 동시성 제어 (429/503 시 재시도 횟수)
+        self.scheduler = scheduler or HostScheduler(max_total=max(max_concurrency, 2))
+        self.max_throttle_retries = 2
+        
+        # 디스크 HTTP 캐시 (HttpCache 인스턴스, 없으면 캐시하지 않음)
+        self.cache = cache
+        
+        # HTML 추출 엔진 ('lxml': 도메인별 선택자 학습 엔진, 'html.parser': 기존 BeautifulSoup 방식)
+        self.extractor = ArticleExtractor() if parser == 'lxml' and ArticleExtractor else None
+        
+        # 기사 본문 스트리밍 수집 (본문을 찾으면 나머지 다운로드 중단, lxml 엔진 필요)
+        self.stream = stream and self.extractor is not None
+        self.max_article_bytes = max_article_bytes
+        self.stream_chunk_size = 16 * 1024
+        
+        # 헤더/meta/호스트 학습 기반 문자셋 판별 (response.text 자동 감지 대체)
+        self.charset_resolver = CharsetResolver()
+        
+        # HTML 파싱 전용 프로세스 풀 (0이면 사용하지 않음, lxml 엔진 필요)
+        # 다운로드는 스레드에서 계속하고 파싱은 작업자 프로세스에서 처리 (스트리밍 수집 시 본문은 제외)
+        self.parse_workers = parse_workers if self.extractor is not None else 0
+        self.max_pending_parses = max_pending_parses or max(2, self.parse_workers * 2)
+        self._parse_pool = None
+        
+        # 이전 실행에서 수집한 기사 기록 (SeenArticleStore, 없으면 매번 새로 수집)
+        self.seen_store = seen_store
+        
+        # 키워드별 증분 검색 워터마크 (KeywordWatermarks, 증분 검색 시 필요)
+        self.watermarks = watermarks
+        
+        # 원본 응답 보관소 (HtmlArchive, 있으면 네트워크에서 받은 응답을 압축 보관해 재처리에 사용)
+        self.archive = archive
+        
+        # 협력적 취소 토큰 (CancellationToken, 취소되면 대기 중/진행 중인 요청을 중단하고 CrawlCancelled 발생)
+        self.cancel_token = cancel_token
+        
+        # 크롤링 통계 (여러 스레드에서 갱신)
+        self.stats = {'bytes_downloaded': 0, 'duplicates_skipped': 0, 'fetches_avoided': 0}
+        self._stats_lock = threading.Lock()
+        
+        # 요청 종류별 최근 응답 시간 (백분위 계산용, 종류마다 최근 10000건)
+        self.fetch_latencies = {}
+    
+    def _fetch(self, url, params=None, slot_acquired=False, kind='article', stream=False):
+        """공유 세션으로 GET 요청 (캐시/호스트 스케줄링/타임아웃/재시도 적용)"""
+        host = urlparse(url).netloc
+        
+        # 캐시 확인: 신선하면 요청 없이 반환, 만료됐으면 조건부 요청
+        # (스트리밍 응답은 본문을 찾으면 읽기를 멈춰 전체 응답을 저장할 수 없으므로 캐시를 쓰지 않음,
+        #  이미 수집한 기사는 seen_store가 본문을 저장해 다시 요청하지 않음)
+        cache_entry = None
+        request_headers = None
+        use_cache = self.cache and not stream
+        if use_cache:
+            cache_entry, fresh = self.cache.lookup(url, params, kind)
+            if fresh:
+                if slot_acquired:
+                    self.scheduler.cancel(host)
+                return self.cache.to_response(cache_entry)
+            if cache_entry:
+                request_headers = self.cache.conditional_headers(cache_entry)
+                if not request_headers:
+                    self.cache.miss(kind)
+                    cache_entry = None
+        
+        attempts = 0
+        while True:
+            if self.cancel_token is not None and self.cancel_token.cancelled:
+                if slot_acquired:
+                    self.scheduler.cancel(host)
+                self.cancel_token.raise_if_cancelled()
+            if kind == 'search':
+                self.search_rate_limiter.acquire(self.cancel_token)  # 검색 서버 요청 간격 조절
+            if not slot_acquired:
+                self.scheduler.acquire(host, self.cancel_token)
+            slot_acquired = False
+            
+            started = time.monotonic()
+            try:
+                # 취소 토큰이 있으면 본문을 직접 읽어 읽는 도중에도 연결을 끊을 수 있게 함
+                response = self.session.get(url, params=params, headers=request_headers,
+                                            timeout=self.timeout, stream=stream or self.cancel_token is not None)
+                if self.cancel_token is not None and not stream:
+                    self._read_body(response)
+            except CrawlCancelled:
+                self.scheduler.cancel(host)
+                raise
+            except Exception:
+                self.scheduler.release(host, latency=time.monotonic() - started, error=True)
+                raise
+            
+            latency = time.monotonic() - started
+            self.scheduler.release(
+                host,
+                status_code=response.status_code,
+                latency=latency,
+                retry_after=response.headers.get('Retry-After')
+            )
+            with self._stats_lock:
+                self.fetch_latencies.setdefault(kind, deque(maxlen=10000)).append(latency)
+            
+            # 과부하 응답이면 스케줄러가 정한 대기 시간 후 다시 요청
+            if response.status_code in THROTTLE_STATUS_CODES and attempts < self.max_throttle_retries:
+                attempts += 1
+                response.close()
+                continue
+            
+            break
+        
+        if cache_entry is not None:
+            if response.status_code == 304:
+                # 변경 없음: 저장된 본문 재사용
+                self.cache.revalidated(cache_entry, kind)
+                return self.cache.to_response(cache_entry)
+            self.cache.miss(kind)
+        
+        response.raise_for_status()
+        if use_cache:
+            self.cache.store(url, params, kind, response)
+        if self.archive is not None and not stream:
+            self.archive.record_response(url, params, kind, response)  # 스트리밍 응답은 읽은 만큼 따로 보관
+        return response
+    
+    def _read_body(self, response):
+        """취소 시 바로 끊을 수 있도록 close 콜백을 등록한 채 본문 전체 읽기"""
+        handle = self.cancel_token.register(functools.partial(abort_response, response))
+        try:
+            response.content
+        except Exception:
+            self.cancel_token.raise_if_cancelled()
+            raise
+        finally:
+            self.cancel_token.unregister(handle)
+        self.cancel_token.raise_if_cancelled()  # 연결이 끊겨 일부만 읽은 경우
+    
+    def _check_cancelled(self):
+        if self.cancel_token is not None:
+            self.cancel_token.raise_if_cancelled()
+    
+    def _count(self, name, amount=1):
+        with self._stats_lock:
+            self.stats[name] = self.stats.get(name, 0) + amount
+    
+    def get_crawl_stats(self):
+        """크롤링 통계 반환"""
+        with self._stats_lock:
+            return dict(self.stats)
+    
+    def _decode(self, response):
+        """응답 본문을 빠르게 문자열로 변환"""
+        return self.charset_resolver.decode(response, urlparse(response.url).netloc)
+    
+    def get_latency_stats(self):
+        """요청 종류별 응답 시간 백분위 (초)"""
+        with self._stats_lock:
+            samples = {kind: sorted(latencies) for kind, latencies in self.fetch_latencies.items()}
+        
+        report = {}
+        for kind, values in samples.items():
+            if not values:
+                continue
+            report[kind] = {'count': len(values)}
+            for percent in (50, 95, 99):
+                index = min(len(values) - 1, max(0, -(-percent * len(values) // 100) - 1))
+                report[kind][f'p{percent}'] = round(values[index], 4)
+        return report
+    
+    def get_connection_stats(self):
+        """연결 재사용 통계 반환"""
+        return self.connection_stats.snapshot()
     
-    def search_news(self, keyword, max_articles=10):
+    def get_host_stats(self):
+        """호스트별 요청 통계 반환"""
+        return self.scheduler.get_stats()
+    
+    def get_cache_stats(self):
+        """HTTP 캐시 적중률 통계 반환 (캐시 미사용 시 빈 딕셔너리)"""
+        return self.cache.get_stats() if self.cache else {}
+    
+    def _get_parse_pool(self):
+        """파서 작업자 프로세스 풀 (처음 사용할 때 생성)"""
+        if not self.parse_workers:
+            return None
+        with self._stats_lock:
+            if self._parse_pool is None:
+                self._parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers, initializer=init_worker)
+            return self._parse_pool
+    
+    def close(self):
+        """세션, 커넥션 풀, 파서 작업자 정리"""
+        self.session.close()
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown()
+            self._parse_pool = None
+        if self.cache:
+            self.cache.close()
+        if self.seen_store is not None:
+            self.seen_store.close()
+        if self.archive is not None:
+            self.archive.close()
+    
+    def _build_search_params(self, keyword, page, recency=False):
+        """페이지 번호별 검색 파라미터 생성 (recency=True면 최신순 정렬)"""
+        # 첫 번째 페이지와 나머지 페이지의 파라미터가 다름
+        params = {
+            'w': 'news',
+            'nil_search': 'btn',
+            'DA': 'NTB' if page == 1 else 'PGD',
+            'enc': 'utf8',
+            'cluster': 'y',
+            'cluster_page': '1',
+        }
+        if page > 1:
+            params['p'] = str(page)
+        if recency:
+            params['sort'] = 'recency'
+        params['q'] = keyword
+        return params
+    
+    def search_news(self, keyword, max_articles=10, parallel=False, incremental=False):
         """키워드로 뉴스 검색 (여러 페이지 지원)"""
+        if incremental and self.watermarks is not None:
+            return self._search_new_articles(keyword, max_articles)
+        
+        if parallel:
+            articles = self._search_pages_parallel(keyword, max_articles)
+        else:
+            articles = self._search_pages_serial(keyword, max_articles)
+        
+        # 전체 검색 결과도 다음 증분 검색의 기준으로 기록
+        if self.watermarks is not None and articles:
+            self.watermarks.update(keyword, [article['link'] for article in articles])
+        return articles
+    
+    def _search_pages_serial(self, keyword, max_articles):
+        """페이지를 하나씩 순서대로 요청"""
         all_articles = []
+        seen_links = set()
         page = 1
         
-        while len(all_articles) < max_articles and page <= 5:  # 최대 5페이지까지
-            # 첫 번째 페이지와 나머지 페이지의 파라미터가 다름
-            if page == 1:
-                params = {
-                    'w': 'news',
-                    'nil_search': 'btn',
-                    'DA': 'NTB',
-                    'enc': 'utf8',
-                    'cluster': 'y',
-                    'cluster_page': '1',
-                    'q': keyword
-                }
-            else:
-                params = {
-                    'w': 'news',
-                    'nil_search': 'btn',
-                    'DA': 'PGD',
-                    'enc': 'utf8',
-                    'cluster': 'y',
-                    'cluster_page': '1',
-                    'p': str(page),
-                    'q': keyword
-                }
-            
+        while len(all_articles) < max_articles and page <= self.max_pages:
+            self._check_cancelled()
+            params = self._build_search_params(keyword, page)
             page_articles = self._search_single_page(params, max_articles - len(all_articles))
             
             if not page_articles:
                 break
             
-            all_articles.extend(page_articles)
+            all_articles.extend(self._dedupe_articles(page_articles, seen_links))
             page += 1
-            time.sleep(1)  # 페이지 간 요청 간격
         
         return all_articles[:max_articles]  # 요청한 개수만큼만 반환
     
-    def _search_single_page(self, params, max_articles_for_page):
-        """단일 페이지에서 뉴스 검색"""
+    def search_news_batch(self, keywords, max_articles=10, incremental=False):
+        """여러 키워드를 한 번에 검색하고 본문까지 수집 ({키워드: 기사 목록} 반환)
+        커넥션 풀과 호스트 스케줄러를 함께 쓰고, 여러 키워드에 걸친 기사의 본문은 한 번만 받아 나눠 줌"""
+        keywords = list(dict.fromkeys(keyword.strip() for keyword in keywords if keyword.strip()))
+        if not keywords:
+            return {}
+        
+        # 키워드별 검색 (검색 요청 간격은 공유하는 속도 제한기가 조절)
+        with ThreadPoolExecutor(max_workers=max(1, min(len(keywords), self.max_concurrency))) as executor:
+            searches = [executor.submit(self.search_news, keyword, max_articles, False, incremental)
+                        for keyword in keywords]
+            results = {keyword: future.result() for keyword, future in zip(keywords, searches)}
+        
+        # 모든 키워드의 링크를 한 번에 넘겨 같은 기사는 한 번만 수집
+        links = [article['link'] for keyword in keywords for article in results[keyword]]
+        self._check_cancelled()
+        contents = iter(self.get_article_contents(links))
+        for keyword in keywords:
+            for article in results[keyword]:
+                article['content'] = next(contents)
+        return results
+    
+    def _search_new_articles(self, keyword, max_articles):
+        """증분 검색: 최신순으로 탐색하다 이전에 본 기사에 도달하면 중단"""
+        new_articles = []
+        seen_links = set()
+        page = 1
+        reached_known = False
+        
+        while len(new_articles) < max_articles and page <= self.max_pages and not reached_known:
+            self._check_cancelled()
+            params = self._build_search_params(keyword, page, recency=True)
+            page_articles = self._search_single_page(params, max_articles - len(new_articles))
+            
+            if not page_articles:
+                break
+            
+            for article in self._dedupe_articles(page_articles, seen_links):
+                if self.watermarks.is_known(keyword, article['link']):
+                    reached_known = True  # 여기부터는 이전 수집 결과
+                    break
+                new_articles.append(article)
+            page += 1
+        
+        new_articles = new_articles[:max_articles]
+        if new_articles:
+            self.watermarks.update(keyword, [article['link'] for article in new_articles])
+        return new_articles
+    
+    def _search_pages_parallel(self, keyword, max_articles):
+        """필요할 것으로 예상되는 페이지들을 병렬로 미리 요청"""
+        all_articles = []
+        seen_links = set()
+        next_page = 1
+        
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            while len(all_articles) < max_articles and next_page <= self.max_pages:
+                self._check_cancelled()
+                # 남은 기사 수로 필요한 페이지 수 추정
+                remaining = max_articles - len(all_articles)
+                page_count = -(-remaining // self.results_per_page)
+                pages = list(range(next_page, min(next_page + page_count, self.max_pages + 1)))
+                
+                futures = [
+                    executor.submit(self._search_single_page,
+                                    self._build_search_params(keyword, page), max_articles)
+                    for page in pages
+                ]
+                
+                # 페이지 순서대로 결과를 합치고, 충분하면 나머지 요청은 취소
+                exhausted = False
+                for future in futures:
+                    if exhausted or len(all_articles) >= max_articles:
+                        future.cancel()
+                        continue
+                    
+                    page_articles = future.result()
+                    if not page_articles:
+                        exhausted = True  # 결과가 없는 페이지 이후는 의미 없음
+                        continue
+                    all_articles.extend(self._dedupe_articles(page_articles, seen_links))
+                
+                if exhausted:
+                    break
+                next_page = pages[-1] + 1
+        
+        return all_articles[:max_articles]
+    
+    def crawl_bulk(self, keyword, sink_path=None, max_articles=None, max_pages=1000, resume=True,
+                   progress_callback=None, page_retries=3, retry_delay=2.0):
+        """대량 수집: 검색 결과를 끝까지 넘기며 수집한 기사를 JSONL 파일에 바로 추가
+        메모리에는 한 페이지 분량만 두고 중복 확인은 고정 크기 블룸 필터로 처리하며,
+        페이지마다 체크포인트를 남겨 중단 후 다시 실행하면 마지막으로 완료한 페이지 다음부터 이어감
+        검색 페이지 요청이 실패하면 page_retries번까지 다시 시도하고, 그래도 실패하면 완료 표시 없이 중단
+        (완료는 정상 응답에 검색 결과가 없을 때만 기록)
+        (seen_store는 수집한 모든 기사의 해시를 메모리에 올리므로 대량 수집에는 사용하지 않는 것이 좋음)"""
+        if not sink_path:
+            sink_path = os.path.join("data", "bulk", keyword_filename(keyword) + ".jsonl")
+        checkpoint_path = sink_path + ".checkpoint"
+        if not resume:
+            for path in (sink_path, checkpoint_path):
+                if os.path.exists(path):
+                    os.remove(path)
+        
+        checkpoint = BulkCheckpoint(checkpoint_path)
+        if checkpoint.state.get('keyword') not in (None, keyword):
+            raise ValueError(f"{sink_path}는 다른 키워드({checkpoint.state['keyword']})의 수집 결과입니다.")
+        
+        sink = JsonlArticleSink(sink_path)
+        sink.truncate(checkpoint.state['sink_size'])  # 마지막 체크포인트 이후 쓰다 만 기사 제거
+        written = checkpoint.state['articles_written']
+        page = checkpoint.state['next_page']
+        complete = checkpoint.state['complete']
+        error = None
+        
         try:
-            response = requests.get(self.base_url, params=params, headers=self.headers)
-            response.raise_for_status()
+            while not complete and page <= max_pages and (not max_articles or written < max_articles):
+                self._check_cancelled()
+                params = self._build_search_params(keyword, page)
+                try:
+                    page_articles = self._fetch_search_page_with_retry(params, page_retries, retry_delay)
+                except CrawlCancelled:
+                    raise
+                except Exception as e:
+                    error = str(e)  # 일시적 오류로 끝난 것으로 보지 않음 (다시 실행하면 이 페이지부터)
+                    print(f"❌ {page}페이지 검색 실패, 수집을 중단합니다: {e}")
+                    break
+                if not page_articles:
+                    complete = True  # 정상 응답에 더 이상 검색 결과 없음
+                    break
+                
+                new_articles = []
+                page_links = set()
+                for article in page_articles:
+                    key = canonicalize_url(article['link'])
+                    if key in checkpoint.bloom or key in page_links:
+                        self._count('duplicates_skipped')
+                        continue
+                    page_links.add(key)
+                    article['link'] = key  # 다른 수집 경로와 같이 정규화된 링크로 저장
+                    new_articles.append(article)
+                if max_articles:
+                    new_articles = new_articles[:max_articles - written]
+                
+                contents = self.get_article_contents([article['link'] for article in new_articles])
+                for article, content in zip(new_articles, contents):
+                    article['content'] = content
+                    sink.write(article)
+                    checkpoint.bloom.add(article['link'])
+                written += len(new_articles)
+                page += 1
+                
+                # 기사 기록을 디스크에 반영한 뒤 체크포인트 갱신
+                sink.sync()
+                checkpoint.save(keyword=keyword, next_page=page, articles_written=written, sink_size=sink.tell())
+                if progress_callback:
+                    progress_callback(written, page - 1)
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            if complete:
+                checkpoint.save(keyword=keyword, complete=True)
+        finally:
+            sink.close()
+        
+        return {
+            'keyword': keyword,
+            'sink_path': sink_path,
+            'articles_written': written,
+            'pages': page - 1,
+            'complete': complete,
+            'error': error
+        }
+    
+    def _dedupe_articles(self, articles, seen_links):
+        """링크를 대표 URL로 정규화하고 이미 나온 기사는 제외"""
+        unique_articles = []
+        for article in articles:
+            link = canonicalize_url(article.get('link', ''))
+            if link in seen_links:
+                self._count('duplicates_skipped')
+                continue
+            seen_links.add(link)
+            article['link'] = link
+            unique_articles.append(article)
+        return unique_articles
+    
+    def _search_single_page(self, params, max_articles_for_page):
+        """단일 페이지에서 뉴스 검색 (요청 실패 시 빈 목록)"""
+        try:
+            return self._fetch_search_page(params, max_articles_for_page)
+        except CrawlCancelled:
+            raise
+        except Exception as e:
+            return []
+    
+    def _fetch_search_page(self, params, max_articles_for_page):
+        """단일 페이지 검색 (요청/응답 오류는 그대로 전달)"""
+        response = self._fetch(self.base_url, params=params, kind='search')
+        domain = urlparse(response.url).netloc
+        
+        parse_pool = self._get_parse_pool()
+        if parse_pool:
+            encoding, _ = self.charset_resolver.resolve(response.headers, response.content, domain)
+            future = parse_pool.submit(parse_search_worker, response.content, encoding, max_articles_for_page, domain)
+            return future.result()
+        
+        return self.parse_search_page(self._decode(response), max_articles_for_page, domain)
+    
+    def _fetch_search_page_with_retry(self, params, retries, delay):
+        """대량 수집용 검색: 실패하면 간격을 두 배씩 늘려 다시 시도, 마지막 오류는 그대로 전달"""
+        for attempt in range(retries + 1):
+            try:
+                return self._fetch_search_page(params, self.results_per_page)
+            except CrawlCancelled:
+                raise
+            except Exception:
+                if attempt >= retries:
+                    raise
+                self._count('search_retries')
+                if self.cancel_token is not None:
+                    self.cancel_token.sleep(delay * (2 ** attempt))
+                else:
+                    time.sleep(delay * (2 ** attempt))
+    
+    def parse_search_page(self, html, max_articles_for_page, domain=None):
+        """검색 결과 HTML에서 기사 목록 추출"""
+        if self.extractor:
+            return self.extractor.parse_search_results(html, max_articles_for_page, domain)
+        return self._parse_search_page_bs4(html, max_articles_for_page)
+    
+    def _parse_search_page_bs4(self, html, max_articles_for_page):
+        """BeautifulSoup 기반 검색 결과 파싱 (lxml 미설치 시 사용)"""
+        try:
+            soup = BeautifulSoup(html, 'html.parser')
             articles = []
             
             # 다양한 뉴스 아이템 선택자 시도
@@ -161,7 +647,6 @@ class DaumNewsCrawler:
                         }
                         
                         articles.append(article_data)
-                        time.sleep(0.2)  # 서버 부하 방지
                     
                 except Exception as e:
                     continue
@@ -173,11 +658,109 @@ class DaumNewsCrawler:
     
     def get_article_content(self, article_url):
         """개별 기사의 본문 내용 추출"""
+        stored = self._stored_content(article_url)
+        if stored is not None:
+            return stored
+        return self._get_article_content(article_url)
+    
+    def _stored_content(self, article_url):
+        """이전 실행에서 저장한 본문 (없으면 None)"""
+        if self.seen_store is None:
+            return None
+        content = self.seen_store.get_content(article_url)
+        if content is not None:
+            self._count('fetches_avoided')
+        return content
+    
+    def _get_article_content(self, article_url, slot_acquired=False):
         try:
-            response = requests.get(article_url, headers=self.headers)
-            response.raise_for_status()
+            if self.stream:
+                content = self._stream_article_content(article_url, slot_acquired)
+            elif self._get_parse_pool():
+                raw = self._download_article(article_url, slot_acquired)
+                content = self._get_parse_pool().submit(extract_content_worker, *raw).result()
+            else:
+                response = self._fetch(article_url, slot_acquired=slot_acquired)
+                content = self.extract_content(self._decode(response), urlparse(response.url).netloc)
+        except CrawlCancelled:
+            raise
+        except Exception as e:
+            print(f"❌ 본문 추출 오류: {e}")
+            return ""
+        
+        self._remember_content(article_url, content)
+        return content
+    
+    def _remember_content(self, article_url, content):
+        if self.seen_store is not None and content:
+            self.seen_store.add(article_url, content)
+    
+    def _download_article(self, article_url, slot_acquired=False):
+        """파서 작업자에게 넘길 (원본 바이트, 인코딩, 도메인) 다운로드"""
+        response = self._fetch(article_url, slot_acquired=slot_acquired)
+        domain = urlparse(response.url).netloc
+        encoding, _ = self.charset_resolver.resolve(response.headers, response.content, domain)
+        return response.content, encoding, domain
+    
+    def _stream_article_content(self, article_url, slot_acquired=False, max_chars=None):
+        """응답을 조금씩 읽으며 본문을 찾으면 다운로드 중단"""
+        response = self._fetch(article_url, slot_acquired=slot_acquired, stream=True)
+        domain = urlparse(response.url).netloc
+        
+        received = {'chunks': [], 'complete': False}
+        # 취소되면 읽는 중인 연결을 바로 끊음
+        handle = (self.cancel_token.register(functools.partial(abort_response, response))
+                  if self.cancel_token is not None else None)
+        try:
+            # 첫 조각으로 문자셋 판별 (헤더 → meta → 호스트 학습 → UTF-8 검사)
+            chunks = response.iter_content(chunk_size=self.stream_chunk_size)
+            if self.archive is not None:
+                chunks = self._tee_chunks(chunks, received)
+            first_chunk = next(chunks, b'')
+            encoding, _ = self.charset_resolver.resolve(response.headers, first_chunk, domain, complete=False)
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            content, bytes_read = self.extractor.extract_content_stream(
+                itertools.chain([first_chunk], chunks),
+                domain=domain,
+                max_chars=max_chars,
+                max_bytes=self.max_article_bytes,
+                encoding=encoding
+            )
+        except Exception:
+            self._check_cancelled()
+            raise
+        finally:
+            if handle is not None:
+                self.cancel_token.unregister(handle)
+            response.close()
+        self._check_cancelled()  # 끊긴 응답에서 얻은 일부 본문은 버림
+        
+        if self.archive is not None:
+            # 본문을 찾고 중단한 응답은 읽은 부분까지만 보관 (WARC-Truncated 표시)
+            self.archive.store(article_url, None, 'article', response.status_code, response.headers,
+                               b''.join(received['chunks']), reason=response.reason,
+                               truncated=not received['complete'])
+        
+        self._count('bytes_downloaded', bytes_read)
+        return content
+    
+    def _tee_chunks(self, chunks, received):
+        """읽은 조각을 보관용으로 모으면서 그대로 전달"""
+        for chunk in chunks:
+            received['chunks'].append(chunk)
+            yield chunk
+        received['complete'] = True
+    
+    def extract_content(self, html, domain=None, max_chars=None):
+        """기사 HTML에서 본문 추출 (max_chars를 지정하면 그 길이로 제한)"""
+        if self.extractor:
+            return self.extractor.extract_content(html, domain, max_chars)
+        return self._extract_content_bs4(html, max_chars)
+    
+    def _extract_content_bs4(self, html, max_chars=None):
+        """BeautifulSoup 기반 본문 추출 (lxml 미설치 시 사용)"""
+        try:
+            soup = BeautifulSoup(html, 'html.parser')
             
             # 다양한 뉴스 사이트의 본문 선택자 시도
             content_selectors = [
@@ -196,28 +779,168 @@ class DaumNewsCrawler:
                     content = content_elem.get_text(strip=True)
                     break
             
-            return content[:1000] if content else ""  # 1000자로 제한
+            if not content:
+                return ""
+            return content[:max_chars] if max_chars else content
             
         except Exception as e:
             print(f"❌ 본문 추출 오류: {e}")
             return ""
     
-    def save_articles(self, articles, filename="articles.json"):
-        """수집한 기사를 JSON 파일로 저장"""
-        data_dir = "data"
-        if not os.path.exists(data_dir):
-            os.makedirs(data_dir)
+    async def iter_article_contents_async(self, urls, max_concurrency=None):
+        """여러 기사의 본문을 동시 수집하며 도착하는 순서대로 (입력 위치, 본문) 반환 (비동기 반복자)
+        같은 기사를 가리키는 링크는 한 번만 수집해 해당 위치마다 반환, 반복을 멈추면 남은 요청은 취소"""
+        limit = max_concurrency or self.max_concurrency
+        semaphore = asyncio.Semaphore(max(1, limit))
+        parse_pool = None if self.stream else self._get_parse_pool()
+        parse_slots = asyncio.Semaphore(self.max_pending_parses)
+        
+        async def fetch(url):
+            self._check_cancelled()
+            stored = self._stored_content(url)
+            if stored is not None:
+                return stored
+            if parse_pool:
+                return await fetch_and_parse(url)
+            # 호스트 슬롯을 먼저 비동기로 기다림 (느린 호스트가 스레드를 점유하지 않도록)
+            host = urlparse(url).netloc
+            await self.scheduler.acquire_async(host, self.cancel_token)
+            started = False
+            try:
+                async with semaphore:
+                    started = True
+                    # requests는 블로킹 방식이므로 스레드에서 실행 (슬롯은 스레드에서 반환)
+                    return await asyncio.to_thread(self._get_article_content, url, True)
+            finally:
+                if not started:
+                    self.scheduler.cancel(host)  # 요청 전에 취소된 작업의 슬롯 반환
         
-        filepath = os.path.join(data_dir, filename)
+        async def fetch_and_parse(url):
+            # 파싱 대기열이 가득 차면 새 다운로드도 멈춤 (backpressure)
+            async with parse_slots:
+                host = urlparse(url).netloc
+                await self.scheduler.acquire_async(host, self.cancel_token)
+                started = False
+                try:
+                    async with semaphore:
+                        started = True
+                        raw = await asyncio.to_thread(self._download_article, url, True)
+                    # 다운로드 슬롯을 반환한 뒤 작업자 프로세스에서 파싱
+                    content = await asyncio.wrap_future(parse_pool.submit(extract_content_worker, *raw))
+                except CrawlCancelled:
+                    raise
+                except Exception as e:
+                    print(f"❌ 본문 추출 오류: {e}")
+                    return ""
+                finally:
+                    if not started:
+                        self.scheduler.cancel(host)  # 요청 전에 취소된 작업의 슬롯 반환
+            self._remember_content(url, content)
+            return content
         
+        async def fetch_keyed(url):
+            return url, await fetch(url)
+        
+        # 같은 기사를 가리키는 링크는 한 번만 수집
+        positions = {}
+        for index, url in enumerate(urls):
+            if not url:
+                yield index, ""
+                continue
+            key = canonicalize_url(url)
+            if key in positions:
+                self._count('fetches_avoided')
+                positions[key].append(index)
+            else:
+                positions[key] = [index]
+        
+        tasks = [asyncio.ensure_future(fetch_keyed(url)) for url in positions]
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(articles, f, ensure_ascii=False, indent=2)
-            print(f"💾 기사 데이터가 {filepath}에 저장되었습니다.")
-            return filepath
-        except Exception as e:
-            print(f"❌ 파일 저장 오류: {e}")
-            return None
+            for completed in asyncio.as_completed(tasks):
+                url, content = await completed
+                for index in positions[url]:
+                    yield index, content
+        finally:
+            # 중간에 멈추거나 오류가 나면 아직 끝나지 않은 요청 취소 (호스트 슬롯은 각 작업에서 반환)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def get_article_contents_async(self, urls, max_concurrency=None):
+        """여러 기사의 본문을 비동기로 동시 수집 (입력 순서 유지)"""
+        contents = [""] * len(urls)
+        async for index, content in self.iter_article_contents_async(urls, max_concurrency):
+            contents[index] = content
+        return contents
+    
+    def iter_article_contents(self, urls, max_concurrency=None):
+        """본문이 도착하는 순서대로 (입력 위치, 본문) 반환하는 제너레이터
+        이벤트 루프는 별도 스레드에서 돌아가므로 받는 쪽이 처리하는 동안에도 다음 본문을 계속 수집"""
+        urls = list(urls)
+        if not urls:
+            return
+        
+        results = queue.Queue()
+        finished = object()
+        
+        async def produce():
+            try:
+                async for item in self.iter_article_contents_async(urls, max_concurrency):
+                    results.put(item)
+            except asyncio.CancelledError:
+                pass
+            except Exception as e:
+                results.put(e)
+            finally:
+                results.put(finished)
+        
+        loop = asyncio.new_event_loop()
+        task = loop.create_task(produce())
+        
+        def run():
+            try:
+                loop.run_until_complete(task)
+            finally:
+                loop.run_until_complete(loop.shutdown_asyncgens())
+                loop.run_until_complete(loop.shutdown_default_executor())
+                loop.close()
+        
+        threading.Thread(target=run, daemon=True).start()
+        try:
+            while True:
+                item = results.get()
+                if item is finished:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            # 받는 쪽이 중간에 멈추면 남은 수집 취소 (이미 끝난 루프면 무시)
+            if not task.done():
+                try:
+                    loop.call_soon_threadsafe(task.cancel)
+                except RuntimeError:
+                    pass
+    
+    def get_article_contents(self, urls, max_concurrency=None):
+        """여러 기사의 본문을 동시 수집 (get_article_content 반복문 대체용)"""
+        urls = list(urls)
+        if not urls:
+            return []
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.get_article_contents_async(urls, max_concurrency))
+        
+        # 이미 이벤트 루프가 실행 중이면 별도 스레드에서 새 루프로 실행
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(asyncio.run, self.get_article_contents_async(urls, max_concurrency))
+            return future.result()
+    
+    def save_articles(self, articles, filename="articles.json"):
+        """수집한 기사를 JSON 파일로 저장"""
+        return save_articles(articles, filename)
 
 if __name__ == "__main__":
     # 개발용 테스트 코드
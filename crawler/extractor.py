@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+lxml 기반 고속 추출 엔진
+- 선택자를 XPath로 미리 컴파일해 문서를 한 번만 파싱
+- 도메인별로 성공한 선택자를 기억해 다음에는 그 선택자부터 시도
+- 기억한 본문 선택자가 있으면 해당 영역(subtree)만 잘라서 파싱
+"""
+
+import re
+import threading
+from lxml import etree, html as lxml_html
+
+# 텍스트 추출 시 제외할 태그 (BeautifulSoup get_text와 동일하게 동작)
+SKIP_TEXT_TAGS = {'script', 'style', 'template'}
+
+# 선택자 정의: (태그, 속성 조건 종류, 값)
+#   'class'    : class 토큰 일치 (CSS .name)
+#   'class*'   : class 속성에 부분 문자열 포함 (CSS [class*="name"])
+#   'id'       : id 일치 (CSS #name)
+#   None       : 태그만 일치
+CONTAINER_SELECTORS = [
+    ('div', 'class', 'c-item-content'),
+    ('div', 'class', 'wrap_cont'),
+    ('li', 'class', 'news'),
+    ('div', 'class', 'item-title'),
+    ('div', 'class', 'news-item'),
+    ('article', None, None),
+]
+
+TITLE_SELECTORS = [
+    ('a', 'class', 'f_link_b'),
+    ('a', 'class', 'tit-g'),
+    ('a', 'class*', 'tit'),
+    ('a', 'class*', 'link'),
+]
+
+SUMMARY_SELECTORS = [
+    ('p', 'class', 'c-item-text'),
+    ('*', 'class', 'summary'),
+    ('*', 'class', 'desc'),
+    ('p', None, None),
+]
+
+SOURCE_SELECTORS = [
+    ('span', 'class', 'c-item-source'),
+    ('*', 'class', 'source'),
+    ('*', 'class', 'press'),
+]
+
+CONTENT_SELECTORS = [
+    ('div', 'class', 'article_view'),
+    ('div', 'id', 'harmonyContainer'),
+    ('div', 'class', 'news_end'),
+    ('div', 'class', 'article-body'),
+    ('div', 'class', 'article_body'),
+    ('div', 'class', 'read_body'),
+]
+
+# 부분 파싱 시 선택자 위치부터 잘라낼 최대 길이 (문자 수)
+SUBTREE_WINDOW = 200000
+
+# 스트리밍 추출 시 비정상적으로 큰 페이지에 대한 최대 다운로드 크기 (바이트)
+MAX_STREAM_BYTES = 2 * 1024 * 1024
+
+_XML_DECLARATION = re.compile(r'^\s*<\?xml[^>]*\?>')
+
+
+def selector_to_xpath(selector, first=False):
+    """선택자 정의를 XPath 식으로 변환"""
+    tag, kind, value = selector
+    if kind == 'class':
+        condition = f"[contains(concat(' ', normalize-space(@class), ' '), ' {value} ')]"
+    elif kind == 'class*':
+        condition = f"[contains(@class, '{value}')]"
+    elif kind == 'id':
+        condition = f"[@id='{value}']"
+    else:
+        condition = ""
+    expression = f".//{tag}{condition}"
+    return f"({expression})[1]" if first else expression
+
+
+def selector_to_marker(selector):
+    """원본 HTML에서 선택자 위치를 빠르게 찾기 위한 정규식 (부분 파싱용)"""
+    tag, kind, value = selector
+    if kind == 'class':
+        attribute = rf'''class\s*=\s*["'](?:[^"']*\s)?{re.escape(value)}(?:\s[^"']*)?["']'''
+    elif kind == 'id':
+        attribute = rf'''id\s*=\s*["']{re.escape(value)}["']'''
+    else:
+        return None
+    return re.compile(rf'<{tag}\b[^>]*{attribute}', re.IGNORECASE)
+
+
+def element_matches(element, selector):
+    """요소가 선택자 정의와 일치하는지 확인 (스트리밍 파싱용)"""
+    tag, kind, value = selector
+    if tag != '*' and element.tag != tag:
+        return False
+    if kind == 'class':
+        return value in (element.get('class') or '').split()
+    if kind == 'class*':
+        return value in (element.get('class') or '')
+    if kind == 'id':
+        return element.get('id') == value
+    return True
+
+
+def element_text(element):
+    """요소의 텍스트를 공백 제거 후 이어붙임 (get_text(strip=True)와 동일)"""
+    parts = []
+
+    def walk(node):
+        if node.text:
+            text = node.text.strip()
+            if text:
+                parts.append(text)
+        for child in node:
+            if isinstance(child.tag, str) and child.tag not in SKIP_TEXT_TAGS:
+                walk(child)
+            if child.tail:
+                tail = child.tail.strip()
+                if tail:
+                    parts.append(tail)
+
+    if isinstance(element.tag, str) and element.tag not in SKIP_TEXT_TAGS:
+        walk(element)
+    return ''.join(parts)
+
+
+def parse_html(text):
+    """HTML 문자열을 lxml 트리로 파싱"""
+    if isinstance(text, str):
+        text = _XML_DECLARATION.sub('', text, count=1)
+    if not text or not text.strip():
+        return None
+    try:
+        return lxml_html.document_fromstring(text)
+    except (etree.ParserError, ValueError):
+        return None
+
+
+class CompiledSelectors:
+    """선택자 그룹 (전체 검색용/첫 번째 요소 검색용 XPath 미리 컴파일)"""
+
+    def __init__(self, name, selectors):
+        self.name = name
+        self.selectors = selectors
+        self.find_all = [etree.XPath(selector_to_xpath(sel)) for sel in selectors]
+        self.find_first = [etree.XPath(selector_to_xpath(sel, first=True)) for sel in selectors]
+        self.markers = [selector_to_marker(sel) for sel in selectors]
+
+
+class ArticleExtractor:
+    def __init__(self, learn=True):
+        self.learn = learn
+        self.containers = CompiledSelectors('container', CONTAINER_SELECTORS)
+        self.titles = CompiledSelectors('title', TITLE_SELECTORS)
+        self.summaries = CompiledSelectors('summary', SUMMARY_SELECTORS)
+        self.sources = CompiledSelectors('source', SOURCE_SELECTORS)
+        self.contents = CompiledSelectors('content', CONTENT_SELECTORS)
+
+        self._all_links = etree.XPath('.//a[@href]')
+        self._links = etree.XPath('.//a')
+
+        # 도메인별로 마지막에 성공한 선택자 번호 {(그룹, 도메인): 번호}
+        self.learned = {}
+        self._lock = threading.Lock()
+
+    def _order(self, group, domain):
+        """학습된 선택자를 맨 앞으로 둔 시도 순서"""
+        order = list(range(len(group.selectors)))
+        learned = self.learned.get((group.name, domain)) if domain else None
+        if learned is not None:
+            order.remove(learned)
+            order.insert(0, learned)
+        return order
+
+    def _remember(self, group, domain, index):
+        if self.learn and domain:
+            with self._lock:
+                self.learned[(group.name, domain)] = index
+
+    def _locate_subtree(self, text, group, domain):
+        """학습된 선택자의 위치부터 잘라낸 HTML 조각 반환 (없으면 None)"""
+        if not domain or not isinstance(text, str):
+            return None
+        learned = self.learned.get((group.name, domain))
+        if learned is None or group.markers[learned] is None:
+            return None
+        match = group.markers[learned].search(text)
+        if not match:
+            return None
+        return text[match.start():match.start() + SUBTREE_WINDOW]
+
+    def _first_text(self, group, node):
+        for find in group.find_first:
+            found = find(node)
+            if found:
+                return element_text(found[0])
+        return None
+
+    def parse_search_results(self, text, max_articles, domain=None):
+        """검색 결과 페이지에서 기사 목록 추출"""
+        subtree_root = None
+        subtree = self._locate_subtree(text, self.containers, domain)
+        if subtree is not None:
+            subtree_root = parse_html(subtree)
+        news_items, root = self._find_containers(subtree_root, text, domain, max_articles)
+        if root is None:
+            return []
+
+        articles = []
+        if not news_items:
+            # 모든 링크 중에서 뉴스 관련 링크 찾기
+            news_links = [link for link in self._all_links(root) if 'news' in link.get('href', '').lower()]
+            for link in news_links[:max_articles]:
+                title = element_text(link)
+                if title and len(title) > 10:
+                    articles.append({
+                        'title': title,
+                        'link': link.get('href'),
+                        'summary': "",
+                        'source': "다음뉴스",
+                        'content': ""
+                    })
+            return articles
+
+        for item in news_items:
+            if len(articles) >= max_articles:
+                break
+
+            title_elem, title = self._find_title(item, domain)
+            if title_elem is None:
+                continue
+
+            link = title_elem.get('href', '')
+            summary = self._first_text(self.summaries, item) or ""
+            source = self._first_text(self.sources, item)
+            if source is None:
+                source = "다음뉴스"
+
+            if title and len(title) > 5:
+                articles.append({
+                    'title': title,
+                    'link': link,
+                    'summary': summary,
+                    'source': source,
+                    'content': ""
+                })
+
+        return articles
+
+    def _find_containers(self, subtree_root, text, domain, max_articles):
+        """기사 컨테이너 목록 찾기 (부분 파싱에서 못 찾으면 전체 문서로 재시도)"""
+        if subtree_root is not None:
+            items = self._match_containers(subtree_root, domain, max_articles)
+            if items:
+                return items, subtree_root
+
+        root = parse_html(text)
+        if root is None:
+            return [], None
+        return self._match_containers(root, domain, max_articles), root
+
+    def _match_containers(self, root, domain, max_articles):
+        for index in self._order(self.containers, domain):
+            items = self.containers.find_all[index](root)
+            if items:
+                self._remember(self.containers, domain, index)
+                return items[:max_articles]
+        return []
+
+    def _find_title(self, item, domain):
+        """제목 요소 찾기 (기존 선택자 우선순위 규칙 유지)"""
+        title_elem = None
+        title = ""
+        for index in self._order(self.titles, domain):
+            found = self.titles.find_first[index](item)
+            title_elem = found[0] if found else None
+            title = element_text(title_elem) if title_elem is not None else ""
+            if title and len(title) > 10:
+                self._remember(self.titles, domain, index)
+                return title_elem, title
+
+        # 일반 a 태그 시도
+        if title_elem is None:
+            for link in self._links(item):
+                text = element_text(link)
+                if text and len(text) > 15 and 'http' in link.get('href', ''):
+                    return link, text
+
+        return title_elem, title
+
+    def extract_content(self, text, domain=None, max_chars=None):
+        """기사 페이지에서 본문 추출"""
+        subtree = self._locate_subtree(text, self.contents, domain)
+        if subtree is not None:
+            content = self._extract_content_from(parse_html(subtree), domain)
+            if content:
+                return content[:max_chars] if max_chars else content
+
+        content = self._extract_content_from(parse_html(text), domain)
+        if not content:
+            return ""
+        return content[:max_chars] if max_chars else content
+
+    def _extract_content_from(self, root, domain):
+        if root is None:
+            return ""
+        for index in self._order(self.contents, domain):
+            found = self.contents.find_first[index](root)
+            if found:
+                self._remember(self.contents, domain, index)
+                return element_text(found[0])
+        return ""
+
+    def extract_content_stream(self, chunks, domain=None, max_chars=None,
+                               max_bytes=MAX_STREAM_BYTES, encoding=None):
+        """바이트 조각을 점진적으로 파싱해 본문을 찾으면 읽기 중단 (본문, 읽은 바이트 수 반환)"""
+        # 최우선 선택자의 본문이 닫히거나 (지정한 경우) max_chars만큼 채워지면 나머지는 내려받지 않음
+        parser = etree.HTMLPullParser(events=('start', 'end'), encoding=encoding)
+        order = self._order(self.contents, domain)
+
+        best_rank = None      # 찾은 본문 선택자의 시도 순위 (0이 최우선)
+        best_index = None
+        best_element = None
+        closed = False
+        bytes_read = 0
+        finished = False
+
+        def handle_events():
+            nonlocal best_rank, best_index, best_element, closed
+            for event, element in parser.read_events():
+                if event == 'start' and best_rank != 0:
+                    limit = len(order) if best_rank is None else best_rank
+                    for rank in range(limit):
+                        if element_matches(element, self.contents.selectors[order[rank]]):
+                            best_rank, best_index, best_element = rank, order[rank], element
+                            closed = False
+                            break
+                elif event == 'end' and element is best_element:
+                    closed = True
+
+        for chunk in chunks:
+            if not chunk:
+                continue
+            bytes_read += len(chunk)
+            parser.feed(chunk)
+            handle_events()
+
+            if best_rank == 0:
+                if closed or (max_chars and len(element_text(best_element)) >= max_chars):
+                    break
+            if bytes_read >= max_bytes:
+                break
+        else:
+            finished = True
+
+        if finished:
+            try:
+                parser.close()
+            except etree.XMLSyntaxError:
+                pass
+            handle_events()
+
+        if best_element is None:
+            return "", bytes_read
+
+        self._remember(self.contents, domain, best_index)
+        content = element_text(best_element)
+        return (content[:max_chars] if max_chars else content), bytes_read
+
+
+# 프로세스 풀 작업자용 함수 (작업자마다 자체 추출 엔진과 선택자 학습 상태를 가짐)
+_worker_extractor = None
+
+
+def init_worker():
+    """파서 작업자 프로세스 초기화"""
+    global _worker_extractor
+    _worker_extractor = ArticleExtractor()
+
+
+def _get_worker_extractor():
+    global _worker_extractor
+    if _worker_extractor is None:
+        _worker_extractor = ArticleExtractor()
+    return _worker_extractor
+
+
+def extract_content_worker(content, encoding, domain=None, max_chars=None):
+    """작업자 프로세스에서 원본 바이트를 디코딩하고 본문 추출"""
+    text = content.decode(encoding, errors='replace')
+    return _get_worker_extractor().extract_content(text, domain, max_chars)
+
+
+def parse_search_worker(content, encoding, max_articles, domain=None):
+    """작업자 프로세스에서 검색 결과 페이지 파싱"""
+    text = content.decode(encoding, errors='replace')
+    return _get_worker_extractor().parse_search_results(text, max_articles, domain)
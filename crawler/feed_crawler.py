@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+언론사 RSS/Atom 피드 수집기
+검색 페이지와 기사 페이지를 각각 요청하는 대신 피드 하나로 제목/링크/요약/본문을 받아
+DaumNewsCrawler와 같은 형태의 기사 딕셔너리로 변환
+- ETag/Last-Modified 조건부 요청 (HttpCache 사용 시)
+- 큰 피드도 받는 대로 점진적으로 파싱하고 필요한 만큼 모이면 다운로드 중단
+"""
+
+import functools
+import html
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from crawler.http_session import create_session, ConnectionStats, DEFAULT_TIMEOUT
+from crawler.article_output import save_articles
+from crawler.url_utils import canonicalize_url
+from crawler.cancellation import CrawlCancelled, abort_response
+
+try:
+    from lxml import etree  # 선언된 인코딩(EUC-KR 등)을 그대로 처리
+except ImportError:
+    from xml.etree import ElementTree as etree
+
+# 기본 피드 목록 (이름, 주소)
+DEFAULT_FEEDS = [
+    ('연합뉴스', 'https://www.yna.co.kr/rss/news.xml'),
+    ('한겨레', 'https://www.hani.co.kr/rss/'),
+    ('경향신문', 'https://www.khan.co.kr/rss/rssdata/total_news.xml'),
+    ('동아일보', 'https://rss.donga.com/total.xml'),
+]
+
+ATOM_NS = '{http://www.w3.org/2005/Atom}'
+RSS1_NS = '{http://purl.org/rss/1.0/}'
+CONTENT_ENCODED = '{http://purl.org/rss/1.0/modules/content/}encoded'
+
+ITEM_TAGS = {'item', RSS1_NS + 'item', ATOM_NS + 'entry'}
+FEED_TITLE_PARENTS = {'channel', RSS1_NS + 'channel', ATOM_NS + 'feed'}
+
+_TAG = re.compile(r'<[^>]+>')
+_SPACES = re.compile(r'\s+')
+
+
+def html_to_text(value):
+    """피드 안의 HTML 조각을 일반 텍스트로 변환"""
+    if not value:
+        return ""
+    return _SPACES.sub(' ', html.unescape(_TAG.sub(' ', value))).strip()
+
+
+def _child_text(item, *tags):
+    for tag in tags:
+        child = item.find(tag)
+        if child is not None and child.text and child.text.strip():
+            return child.text.strip()
+    return ""
+
+
+def _item_link(item):
+    """RSS <link>텍스트 또는 Atom <link rel="alternate" href>"""
+    link = _child_text(item, 'link', RSS1_NS + 'link')
+    if link:
+        return link
+    for child in item.findall(ATOM_NS + 'link'):
+        if child.get('rel', 'alternate') == 'alternate' and child.get('href'):
+            return child.get('href')
+    return _child_text(item, 'guid')
+
+
+def parse_feed_item(item, source, max_chars=None):
+    """RSS item / Atom entry 요소를 기사 딕셔너리로 변환"""
+    summary = html_to_text(_child_text(item, 'description', RSS1_NS + 'description',
+                                       ATOM_NS + 'summary'))
+    content = html_to_text(_child_text(item, CONTENT_ENCODED, ATOM_NS + 'content')) or summary
+    return {
+        'title': html_to_text(_child_text(item, 'title', RSS1_NS + 'title', ATOM_NS + 'title')),
+        'link': _item_link(item),
+        'summary': summary,
+        'source': source,
+        'content': content[:max_chars] if max_chars else content
+    }
+
+
+class FeedNewsCrawler:
+    def __init__(self, feeds=None, max_concurrency=4, timeout=DEFAULT_TIMEOUT, max_retries=3,
+                 backoff_factor=0.5, cache=None, watermarks=None, max_feed_bytes=5 * 1024 * 1024,
+                 cancel_token=None):
+        self.feeds = feeds or DEFAULT_FEEDS
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Accept': 'application/rss+xml, application/atom+xml, application/xml;q=0.9, */*;q=0.8'
+        }
+        # 피드 동시 요청 수
+        self.max_concurrency = max_concurrency
+
+        self.timeout = timeout  # (연결, 읽기) 타임아웃
+        self.connection_stats = ConnectionStats()
+        self.session = create_session(
+            headers=self.headers,
+            pool_maxsize=max(10, max_concurrency),
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+            stats=self.connection_stats
+        )
+
+        # 디스크 HTTP 캐시 (HttpCache 인스턴스, 있으면 ETag/Last-Modified 조건부 요청)
+        self.cache = cache
+
+        # 키워드별 증분 검색 워터마크 (KeywordWatermarks, 증분 검색 시 필요)
+        self.watermarks = watermarks
+
+        # 비정상적으로 큰 피드에 대한 최대 다운로드 크기 (바이트)
+        self.max_feed_bytes = max_feed_bytes
+        self.stream_chunk_size = 16 * 1024
+
+        # 협력적 취소 토큰 (CancellationToken, 취소되면 읽는 중인 피드 연결을 끊고 CrawlCancelled 발생)
+        self.cancel_token = cancel_token
+
+        # 피드에서 받은 본문 (정규화 URL → 본문), get_article_contents에서 사용
+        self.contents = {}
+
+        self.stats = {'feeds_fetched': 0, 'feeds_not_modified': 0, 'items_parsed': 0, 'bytes_downloaded': 0,
+                      'duplicates_skipped': 0, 'fetches_avoided': 0}
+        self._stats_lock = threading.Lock()
+
+    def _check_cancelled(self):
+        if self.cancel_token is not None:
+            self.cancel_token.raise_if_cancelled()
+
+    def _count(self, name, amount=1):
+        with self._stats_lock:
+            self.stats[name] = self.stats.get(name, 0) + amount
+
+    def get_crawl_stats(self):
+        """크롤링 통계 반환"""
+        with self._stats_lock:
+            return dict(self.stats)
+
+    def get_connection_stats(self):
+        """연결 재사용 통계 반환"""
+        return self.connection_stats.snapshot()
+
+    def get_cache_stats(self):
+        """HTTP 캐시 적중률 통계 반환 (캐시 미사용 시 빈 딕셔너리)"""
+        return self.cache.get_stats() if self.cache else {}
+
+    def close(self):
+        """세션과 캐시 정리"""
+        self.session.close()
+        if self.cache:
+            self.cache.close()
+
+    def _matches(self, article, keyword):
+        """제목/요약/본문에 키워드가 들어 있는지 확인 (대소문자 무시)"""
+        if not keyword:
+            return True
+        keyword = keyword.lower()
+        return any(keyword in (article[field] or '').lower() for field in ('title', 'summary', 'content'))
+
+    def _parse_chunks(self, chunks, source, keyword, max_articles):
+        """피드 바이트를 조각 단위로 파싱하며 키워드에 맞는 기사 수집 (충분히 모이면 중단)"""
+        parser = etree.XMLPullParser(events=('start', 'end'))
+        articles = []
+        path = []
+        complete = True
+
+        try:
+            for chunk in chunks:
+                parser.feed(chunk)
+                for event, element in parser.read_events():
+                    if event == 'start':
+                        path.append(element.tag)
+                        continue
+                    path.pop()
+
+                    if element.tag in (ATOM_NS + 'title', 'title', RSS1_NS + 'title') and path and path[-1] in FEED_TITLE_PARENTS:
+                        # 피드 이름 대신 채널 제목을 출처로 사용
+                        source = html_to_text(element.text) or source
+                    elif element.tag in ITEM_TAGS:
+                        article = parse_feed_item(element, source)
+                        element.clear()  # 처리한 항목은 바로 비워 메모리 사용량 유지
+                        self._count('items_parsed')
+                        if article['title'] and article['link'] and self._matches(article, keyword):
+                            articles.append(article)
+
+                if max_articles and len(articles) >= max_articles:
+                    complete = False
+                    break
+            else:
+                parser.close()
+        except etree.ParseError as e:
+            print(f"❌ 피드 파싱 오류 ({source}): {e}")
+            complete = False
+
+        return articles, complete
+
+    def _read_chunks(self, response, received):
+        """응답 본문을 조각 단위로 읽기 (읽은 조각은 received에 모음, 최대 크기 제한)"""
+        total = 0
+        for chunk in response.iter_content(chunk_size=self.stream_chunk_size):
+            self._check_cancelled()
+            total += len(chunk)
+            self._count('bytes_downloaded', len(chunk))
+            received.append(chunk)
+            yield chunk
+            if total >= self.max_feed_bytes:
+                break
+
+    def fetch_feed(self, name, url, keyword=None, max_articles=None):
+        """피드 하나를 받아 키워드에 맞는 기사 목록 반환"""
+        self._check_cancelled()
+        cache_entry = None
+        request_headers = None
+        if self.cache:
+            cache_entry, fresh = self.cache.lookup(url, None, 'feed')
+            if cache_entry and not fresh:
+                request_headers = self.cache.conditional_headers(cache_entry)
+                if not request_headers:
+                    self.cache.miss('feed')
+                    cache_entry = None
+
+        try:
+            if cache_entry is not None and request_headers is None:
+                body = cache_entry['body']  # TTL 안의 캐시 항목
+            else:
+                response = self.session.get(url, headers=request_headers, timeout=self.timeout, stream=True)
+                # 취소되면 읽는 중인 연결을 바로 끊음
+                handle = (self.cancel_token.register(functools.partial(abort_response, response))
+                          if self.cancel_token is not None else None)
+                try:
+                    if cache_entry is not None and response.status_code == 304:
+                        # 변경 없음: 저장된 피드를 다시 파싱
+                        self.cache.revalidated(cache_entry, 'feed')
+                        self._count('feeds_not_modified')
+                        body = cache_entry['body']
+                    else:
+                        if cache_entry is not None:
+                            self.cache.miss('feed')
+                        response.raise_for_status()
+                        self._count('feeds_fetched')
+
+                        received = []
+                        articles, complete = self._parse_chunks(self._read_chunks(response, received),
+                                                                name, keyword, max_articles)
+                        # 끝까지 읽은 피드만 캐시에 저장 (다음 요청의 조건부 요청 기준)
+                        if self.cache and complete:
+                            self.cache.store_content(url, None, 'feed', response.headers, b''.join(received), response.url)
+                        self._check_cancelled()
+                        return articles
+                finally:
+                    if handle is not None:
+                        self.cancel_token.unregister(handle)
+                    response.close()
+
+            chunk_size = self.stream_chunk_size
+            chunks = (body[i:i + chunk_size] for i in range(0, len(body), chunk_size))
+            return self._parse_chunks(chunks, name, keyword, max_articles)[0]
+        except CrawlCancelled:
+            raise
+        except Exception as e:
+            self._check_cancelled()  # 연결을 끊어서 난 오류
+            print(f"❌ 피드 수집 오류 ({name}): {e}")
+            return []
+
+    def search_news(self, keyword, max_articles=10, parallel=False, incremental=False):
+        """등록된 피드에서 키워드가 들어간 기사 검색 (DaumNewsCrawler.search_news와 같은 형태)"""
+        if parallel:
+            with ThreadPoolExecutor(max_workers=max(1, self.max_concurrency)) as executor:
+                results = list(executor.map(lambda feed: self.fetch_feed(feed[0], feed[1], keyword, max_articles),
+                                            self.feeds))
+        else:
+            results = [self.fetch_feed(name, url, keyword, max_articles) for name, url in self.feeds]
+
+        self._check_cancelled()
+        use_watermarks = incremental and self.watermarks is not None
+
+        # 피드 순서대로 합치며 같은 기사(정규화 URL 기준)는 한 번만
+        articles = []
+        seen_links = set()
+        for feed_articles in results:
+            for article in feed_articles:
+                key = canonicalize_url(article['link'])
+                if key in seen_links:
+                    self._count('duplicates_skipped')
+                    continue
+                seen_links.add(key)
+                if use_watermarks and self.watermarks.is_known(keyword, key):
+                    continue
+                article['link'] = key
+                articles.append(article)
+        articles = articles[:max_articles]
+
+        for article in articles:
+            self.contents[article['link']] = article['content']
+        if self.watermarks is not None and articles:
+            self.watermarks.update(keyword, [article['link'] for article in articles])
+        return articles
+
+    def get_article_content(self, article_url):
+        """피드에서 받은 기사 본문 (없으면 빈 문자열)"""
+        return self.contents.get(canonicalize_url(article_url), "")
+
+    def get_article_contents(self, urls, max_concurrency=None):
+        """여러 기사의 본문 반환 (피드에 이미 들어 있으므로 추가 요청 없음)"""
+        contents = [self.get_article_content(url) if url else "" for url in urls]
+        self._count('fetches_avoided', sum(1 for content in contents if content))
+        return contents
+
+    def iter_article_contents(self, urls, max_concurrency=None):
+        """(입력 위치, 본문) 반환 (DaumNewsCrawler와 같은 스트리밍 인터페이스, 본문이 이미 있으므로 입력 순서대로)"""
+        for index, content in enumerate(self.get_article_contents(urls, max_concurrency)):
+            yield index, content
+
+    def save_articles(self, articles, filename="articles.json"):
+        """수집한 기사를 JSON 파일로 저장"""
+        return save_articles(articles, filename)
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+호스트별 적응형 요청 스케줄러
+언론사 도메인마다 동시 요청 창(window)을 두고 AIMD 방식으로 조절
+- 성공 시 창을 조금씩 키움 (additive increase)
+- 429/503, 연결 오류, 지연 증가 시 창을 줄임 (multiplicative decrease)
+- Retry-After 헤더가 있으면 해당 시간 동안 요청 보류
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+# 서버가 과부하를 알리는 상태 코드
+THROTTLE_STATUS_CODES = (429, 503)
+
+
+def parse_retry_after(value):
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 초로 변환"""
+    if not value:
+        return None
+
+    value = str(value).strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class HostState:
+    """단일 호스트의 창 크기와 통계"""
+
+    def __init__(self, initial_window):
+        self.window = float(initial_window)
+        self.in_flight = 0
+        self.cooldown_until = 0.0
+        self.throttle_streak = 0
+
+        # 지연 시간 추적 (기준값 대비 증가 감지)
+        self.ewma_latency = None
+        self.min_latency = None
+        self.last_decrease_at = 0.0
+        self.latencies = deque(maxlen=500)
+
+        self.requests = 0
+        self.successes = 0
+        self.throttled = 0
+        self.errors = 0
+
+
+class HostScheduler:
+    def __init__(self, initial_window=2, min_window=1, max_window=8,
+                 max_total=16, latency_factor=2.0, latency_slack=0.25,
+                 default_backoff=1.0, max_backoff=60.0):
+        self.initial_window = initial_window
+        self.min_window = min_window
+        self.max_window = max_window
+        self.max_total = max_total  # 전체 호스트 합산 최대 동시 요청 수
+        self.latency_factor = latency_factor
+        self.latency_slack = latency_slack  # 아주 짧은 지연의 작은 흔들림은 무시
+        self.default_backoff = default_backoff
+        self.max_backoff = max_backoff
+
+        self.hosts = {}
+        self.total_in_flight = 0
+        self._condition = threading.Condition()
+
+    def _state(self, host):
+        state = self.hosts.get(host)
+        if state is None:
+            state = HostState(self.initial_window)
+            self.hosts[host] = state
+        return state
+
+    def try_acquire(self, host):
+        """슬롯을 얻으면 0, 아니면 다시 시도할 때까지의 대기 시간(초) 반환"""
+        with self._condition:
+            return self._try_acquire_locked(host)
+
+    def _try_acquire_locked(self, host):
+        state = self._state(host)
+        now = time.monotonic()
+
+        if state.cooldown_until > now:
+            return state.cooldown_until - now
+        if state.in_flight >= max(self.min_window, int(state.window)):
+            return 0.05
+        if self.total_in_flight >= self.max_total:
+            return 0.05
+
+        state.in_flight += 1
+        state.requests += 1
+        self.total_in_flight += 1
+        return 0
+
+    def acquire(self, host, cancel_token=None):
+        """해당 호스트의 슬롯을 얻을 때까지 대기 (다른 호스트 요청은 막지 않음)"""
+        with self._condition:
+            while True:
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
+                wait_time = self._try_acquire_locked(host)
+                if wait_time == 0:
+                    return
+                if cancel_token is not None:
+                    wait_time = min(wait_time, 0.2)  # 쿨다운 중에도 취소 여부를 확인하도록 짧게 대기
+                self._condition.wait(timeout=wait_time)
+
+    async def acquire_async(self, host, cancel_token=None):
+        """acquire의 비동기 버전 (이벤트 루프를 막지 않음)"""
+        while True:
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+            wait_time = self.try_acquire(host)
+            if wait_time == 0:
+                return
+            await asyncio.sleep(min(wait_time, 0.2 if cancel_token is not None else 0.5))
+
+    def cancel(self, host):
+        """요청을 보내지 않고 슬롯만 반환 (캐시 적중 등)"""
+        with self._condition:
+            state = self._state(host)
+            state.in_flight = max(0, state.in_flight - 1)
+            state.requests = max(0, state.requests - 1)
+            self.total_in_flight = max(0, self.total_in_flight - 1)
+            self._condition.notify_all()
+
+    def release(self, host, status_code=None, latency=None, retry_after=None, error=False):
+        """요청 결과를 반영해 창 크기 조절 후 슬롯 반환"""
+        with self._condition:
+            state = self._state(host)
+            state.in_flight = max(0, state.in_flight - 1)
+            self.total_in_flight = max(0, self.total_in_flight - 1)
+            now = time.monotonic()
+
+            if error or status_code in THROTTLE_STATUS_CODES:
+                # 과부하 신호: 창을 절반으로 줄이고 일정 시간 요청 보류
+                if error:
+                    state.errors += 1
+                else:
+                    state.throttled += 1
+                state.throttle_streak += 1
+                state.window = max(self.min_window, state.window / 2)
+                state.last_decrease_at = now
+
+                delay = parse_retry_after(retry_after)
+                if delay is None:
+                    delay = self.default_backoff * (2 ** (state.throttle_streak - 1))
+                state.cooldown_until = max(state.cooldown_until, now + min(delay, self.max_backoff))
+            else:
+                if status_code is not None and status_code < 400:
+                    state.successes += 1
+                state.throttle_streak = 0
+
+                if latency is not None:
+                    self._record_latency(state, latency, now)
+                else:
+                    state.window = min(self.max_window, state.window + 1 / state.window)
+
+            self._condition.notify_all()
+
+    def _record_latency(self, state, latency, now):
+        state.latencies.append(latency)
+        state.min_latency = latency if state.min_latency is None else min(state.min_latency, latency)
+        state.ewma_latency = latency if state.ewma_latency is None else 0.8 * state.ewma_latency + 0.2 * latency
+
+        # 지연이 기준값보다 크게 늘면 창을 줄임 (한 번의 지연 주기에 한 번만)
+        threshold = max(state.min_latency * self.latency_factor, state.min_latency + self.latency_slack)
+        rising = len(state.latencies) >= 3 and state.ewma_latency > threshold
+        if rising and now - state.last_decrease_at > state.ewma_latency:
+            state.window = max(self.min_window, state.window * 0.75)
+            state.last_decrease_at = now
+        elif not rising:
+            state.window = min(self.max_window, state.window + 1 / state.window)
+
+    def get_stats(self):
+        """호스트별 통계 반환"""
+        with self._condition:
+            now = time.monotonic()
+            stats = {}
+            for host, state in self.hosts.items():
+                stats[host] = {
+                    'window': round(state.window, 2),
+                    'in_flight': state.in_flight,
+                    'requests': state.requests,
+                    'successes': state.successes,
+                    'throttled': state.throttled,
+                    'errors': state.errors,
+                    'avg_latency': round(state.ewma_latency, 3) if state.ewma_latency is not None else None,
+                    'cooldown': round(max(0.0, state.cooldown_until - now), 2)
+                }
+            return stats
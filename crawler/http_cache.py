@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+디스크 기반 HTTP 캐시
+정규화한 URL+파라미터를 키로 응답을 SQLite에 저장
+- 요청 종류별 TTL (검색 페이지는 짧게, 기사 본문은 길게)
+- TTL이 지나면 ETag/Last-Modified로 조건부 재검증
+- 전체 크기 제한을 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (LRU)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# 요청 종류별 기본 TTL (초)
+DEFAULT_TTLS = {
+    'search': 10 * 60,          # 검색 결과: 10분
+    'feed': 0,                  # RSS/Atom 피드: 매번 조건부 요청으로 재검증
+    'article': 7 * 24 * 3600    # 기사 본문: 7일
+}
+
+# 캐시에 함께 저장할 응답 헤더
+STORED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified')
+
+
+def normalize_url(url, params=None):
+    """scheme/host 소문자화, fragment 제거, 쿼리 파라미터 정렬"""
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if params:
+        query.extend((str(k), str(v)) for k, v in params.items())
+    query.sort()
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or '/', urlencode(query), ''))
+
+
+class HttpCache:
+    def __init__(self, path="data/http_cache.sqlite3", ttls=None, max_bytes=200 * 1024 * 1024):
+        self.path = path
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.max_bytes = max_bytes
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                url TEXT,
+                kind TEXT,
+                headers TEXT,
+                body BLOB,
+                size INTEGER,
+                stored_at REAL,
+                last_access REAL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_last_access ON entries(last_access)")
+        self._conn.commit()
+
+        self.total_size = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        self.stats = {}
+
+    def _count(self, kind, field):
+        kind_stats = self.stats.setdefault(kind, {'hits': 0, 'misses': 0, 'revalidated': 0})
+        kind_stats[field] += 1
+
+    def lookup(self, url, params=None, kind='article'):
+        """캐시 항목 조회. (항목, 신선도) 반환, 없으면 (None, False)"""
+        key = hashlib.sha1(normalize_url(url, params).encode('utf-8')).hexdigest()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, headers, body, stored_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._count(kind, 'misses')
+                return None, False
+
+            now = time.time()
+            self._conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+
+        entry = {
+            'key': key,
+            'url': row[0],
+            'headers': json.loads(row[1]),
+            'body': zlib.decompress(row[2]),
+            'stored_at': row[3]
+        }
+        fresh = now - entry['stored_at'] < self.ttls.get(kind, 0)
+        if fresh:
+            with self._lock:
+                self._count(kind, 'hits')
+        return entry, fresh
+
+    def conditional_headers(self, entry):
+        """재검증 요청에 사용할 조건부 헤더"""
+        headers = {}
+        if entry['headers'].get('ETag'):
+            headers['If-None-Match'] = entry['headers']['ETag']
+        if entry['headers'].get('Last-Modified'):
+            headers['If-Modified-Since'] = entry['headers']['Last-Modified']
+        return headers
+
+    def revalidated(self, entry, kind='article'):
+        """304 응답을 받은 항목의 저장 시각 갱신"""
+        with self._lock:
+            self._conn.execute("UPDATE entries SET stored_at = ? WHERE key = ?", (time.time(), entry['key']))
+            self._conn.commit()
+            self._count(kind, 'revalidated')
+
+    def miss(self, kind='article'):
+        """만료된 항목을 다시 받아야 하는 경우 (재검증 실패)"""
+        with self._lock:
+            self._count(kind, 'misses')
+
+    def store(self, url, params, kind, response):
+        """200 응답을 압축해 저장하고 필요하면 LRU 정리"""
+        if response.status_code != 200:
+            return
+        self.store_content(url, params, kind, response.headers, response.content, response.url)
+
+    def store_content(self, url, params, kind, headers, content, final_url=None):
+        """이미 읽어 둔 본문 저장 (스트리밍으로 끝까지 읽은 응답용)"""
+        key = hashlib.sha1(normalize_url(url, params).encode('utf-8')).hexdigest()
+        headers = {name: headers[name] for name in STORED_HEADERS if name in headers}
+        body = zlib.compress(content)
+        now = time.time()
+
+        with self._lock:
+            old = self._conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+            if old:
+                self.total_size -= old[0]
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, final_url or url, kind, json.dumps(headers), body, len(body), now, now)
+            )
+            self.total_size += len(body)
+            self._evict_locked()
+            self._conn.commit()
+
+    def _evict_locked(self):
+        while self.total_size > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM entries ORDER BY last_access LIMIT 50"
+            ).fetchall()
+            if not rows:
+                break
+            for key, size in rows:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self.total_size -= size
+                if self.total_size <= self.max_bytes:
+                    break
+
+    def to_response(self, entry):
+        """캐시 항목을 requests.Response 객체로 변환"""
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.url = entry['url']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = entry['body']
+        response.from_cache = True
+        return response
+
+    def get_stats(self):
+        """요청 종류별 적중률 통계"""
+        with self._lock:
+            report = {}
+            for kind, kind_stats in self.stats.items():
+                served = kind_stats['hits'] + kind_stats['revalidated']
+                total = served + kind_stats['misses']
+                report[kind] = dict(kind_stats, hit_ratio=round(served / total, 3) if total else 0.0)
+            report['size_bytes'] = self.total_size
+            return report
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTTP 세션 관리
+커넥션 풀(keep-alive), 재시도/백오프, 연결 재사용 통계 제공
+"""
+
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+# 기본 타임아웃 (연결, 읽기) 초
+DEFAULT_TIMEOUT = (3.05, 10)
+
+# 재시도 대상 상태 코드 (서버 오류)
+# 429/503은 호스트 스케줄러가 Retry-After를 반영해 처리하므로 제외
+RETRY_STATUS_CODES = (500, 502, 504)
+
+
+class ConnectionStats:
+    """새 연결 / 재사용 연결 카운터"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.new_connections = 0
+        self.requests = 0
+
+    def record_new_connection(self):
+        with self._lock:
+            self.new_connections += 1
+
+    def record_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def snapshot(self):
+        """현재 통계를 딕셔너리로 반환"""
+        with self._lock:
+            reused = max(0, self.requests - self.new_connections)
+            return {
+                'requests': self.requests,
+                'new_connections': self.new_connections,
+                'reused_connections': reused,
+                'reuse_ratio': round(reused / self.requests, 3) if self.requests else 0.0
+            }
+
+
+class CountingHTTPAdapter(HTTPAdapter):
+    """연결 생성/요청 횟수를 세는 HTTPAdapter"""
+
+    def __init__(self, stats, *args, **kwargs):
+        self.stats = stats
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+
+        stats = self.stats
+
+        def counting_pool(base_class):
+            class CountingPool(base_class):
+                def _new_conn(self):
+                    stats.record_new_connection()
+                    return super()._new_conn()
+
+                def _make_request(self, *args, **kwargs):
+                    # 재시도를 포함한 실제 HTTP 요청 1회마다 호출됨
+                    stats.record_request()
+                    return super()._make_request(*args, **kwargs)
+            return CountingPool
+
+        # 이 어댑터의 풀 매니저에만 카운팅 풀 클래스를 적용
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': counting_pool(HTTPConnectionPool),
+            'https': counting_pool(HTTPSConnectionPool)
+        }
+
+
+def create_session(headers=None, pool_connections=20, pool_maxsize=20,
+                   max_retries=3, backoff_factor=0.5, stats=None):
+    """커넥션 풀과 재시도 정책이 설정된 requests 세션 생성"""
+    retry = Retry(
+        total=max_retries,
+        connect=max_retries,
+        read=max_retries,
+        status=max_retries,
+        backoff_factor=backoff_factor,  # 0.5, 1, 2초... 지수 백오프
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        raise_on_status=False,  # 마지막 응답은 그대로 돌려주고 raise_for_status로 처리
+        respect_retry_after_header=False  # Retry-After는 호스트 스케줄러에서 처리
+    )
+
+    adapter = CountingHTTPAdapter(
+        stats if stats is not None else ConnectionStats(),
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry
+    )
+
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    if headers:
+        session.headers.update(headers)
+
+    return session
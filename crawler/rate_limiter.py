@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+요청 속도 제한기
+토큰 버킷 방식으로 초당 요청 수를 제한 (고정 sleep 대체)
+"""
+
+import threading
+import time
+
+
+class RateLimiter:
+    def __init__(self, rate=2.0, burst=1):
+        """rate: 초당 허용 요청 수, burst: 순간적으로 허용할 최대 요청 수"""
+        self.rate = float(rate)
+        self.capacity = max(1.0, float(burst))
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        elapsed = now - self.updated_at
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated_at = now
+
+    def acquire(self, cancel_token=None):
+        """토큰을 얻을 때까지 대기 (대기한 시간 반환, cancel_token이 취소되면 CrawlCancelled)"""
+        if self.rate <= 0:
+            return 0.0
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                wait_time = (1 - self.tokens) / self.rate
+
+            if cancel_token is not None:
+                cancel_token.sleep(wait_time)
+            else:
+                time.sleep(wait_time)
+            waited += wait_time
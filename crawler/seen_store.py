@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+수집한 기사 기록 저장소
+정규화된 URL의 8바이트 해시를 파일에 모아두는 seen-set
+재실행 시 이미 수집한 기사는 get_article_content를 다시 호출하지 않고 본문 저장소(ArticleBlobStore)의 본문을 재사용
+- 메모리에는 해시만 올리고, 본문은 해시로 정해지는 본문 ID(article_id)로 필요한 기사만 불러옴
+"""
+
+import os
+import threading
+
+from crawler.blob_store import ArticleBlobStore
+from crawler.url_utils import url_digest
+
+DIGEST_SIZE = 8
+
+
+class SeenArticleStore:
+    def __init__(self, directory="data/seen_articles", blob_store=None):
+        self.directory = directory
+        self.digest_path = os.path.join(directory, "seen.bin")  # 8바이트 해시 목록 (추가 전용)
+
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self._lock = threading.Lock()
+        self.seen = set()
+        # 본문은 결과 파일과 같은 본문 저장소에 한 번만 저장 (넘겨받지 않으면 기본 저장소를 직접 열고 닫음)
+        self._owns_blob_store = blob_store is None
+        self.blob_store = blob_store if blob_store is not None else ArticleBlobStore()
+        self._load()
+
+    def _load(self):
+        if os.path.exists(self.digest_path):
+            with open(self.digest_path, 'rb') as f:
+                data = f.read()
+            usable = len(data) - len(data) % DIGEST_SIZE  # 중간에 끊긴 마지막 기록은 무시
+            self.seen = {data[i:i + DIGEST_SIZE] for i in range(0, usable, DIGEST_SIZE)}
+
+    def __contains__(self, url):
+        return url_digest(url) in self.seen
+
+    def __len__(self):
+        return len(self.seen)
+
+    def get_content(self, url):
+        """저장된 본문 반환 (없으면 None, 본문 저장소가 비워졌으면 다시 수집하도록 None)"""
+        digest = url_digest(url)
+        if digest not in self.seen:
+            return None
+        return self.blob_store.get(digest.hex())
+
+    def add(self, url, content=None):
+        """기사를 seen-set에 추가하고 본문이 있으면 본문 저장소에 저장"""
+        digest = url_digest(url)
+        with self._lock:
+            if digest not in self.seen:
+                self.seen.add(digest)
+                with open(self.digest_path, 'ab') as f:
+                    f.write(digest)
+
+        if content:
+            self.blob_store.put(digest.hex(), content)
+
+    def close(self):
+        if self._owns_blob_store:
+            self.blob_store.close()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+URL 정규화 유틸리티
+같은 기사를 가리키는 여러 형태의 링크(리다이렉트 래퍼, 추적 파라미터,
+다음 뉴스 도메인 변형 등)를 하나의 대표 URL로 통일
+"""
+
+import hashlib
+import re
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode, unquote
+
+# 실제 목적지 URL을 담고 있는 리다이렉트 파라미터
+REDIRECT_PARAMS = ('url', 'u', 'target', 'redirect', 'redirect_url', 'returnurl', 'link')
+
+# 기사 식별과 무관한 추적용 파라미터
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'igshid', 'ref', 'referer', 'from',
+    'nil_profile', 'nil_src', 'rcmd', 'rc', 'f', 'outlink', 'cmpid', 'share'
+}
+TRACKING_PREFIXES = ('utm_',)
+
+# 다음 뉴스 기사 링크 변형 (news.v.daum.net, m.v.daum.net, news.daum.net/v/ 등)
+_DAUM_ARTICLE = re.compile(r'^(?:[a-z]+\.)*(?:v\.)?daum\.net$')
+_DAUM_ARTICLE_PATH = re.compile(r'^/v/(\d{8,})')
+
+
+def _unwrap_redirect(parts):
+    """리다이렉트 래퍼면 목적지 URL 반환"""
+    for key, value in parse_qsl(parts.query, keep_blank_values=True):
+        if key.lower() in REDIRECT_PARAMS:
+            target = unquote(value)
+            if target.startswith(('http://', 'https://')):
+                return target
+    return None
+
+
+def canonicalize_url(url):
+    """기사 링크를 대표 URL로 정규화"""
+    if not url:
+        return url
+
+    url = url.strip()
+    parts = urlsplit(url)
+
+    # 리다이렉트 래퍼는 여러 겹일 수 있음
+    for _ in range(3):
+        target = _unwrap_redirect(parts)
+        if not target:
+            break
+        parts = urlsplit(target)
+
+    scheme = (parts.scheme or 'https').lower()
+    host = (parts.hostname or '').lower()
+    port = parts.port
+    if port and not ((scheme == 'http' and port == 80) or (scheme == 'https' and port == 443)):
+        host = f"{host}:{port}"
+
+    # 다음 뉴스 기사는 v.daum.net/v/<기사ID> 하나로 통일
+    article_match = _DAUM_ARTICLE_PATH.match(parts.path)
+    if article_match and _DAUM_ARTICLE.match(host.split(':')[0]):
+        return f"https://v.daum.net/v/{article_match.group(1)}"
+
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    ]
+    query.sort()
+
+    path = parts.path or '/'
+    if len(path) > 1 and path.endswith('/'):
+        path = path.rstrip('/')
+
+    return urlunsplit((scheme, host, path, urlencode(query), ''))
+
+
+def url_digest(url):
+    """정규화된 URL의 8바이트 해시 (seen-set 저장용)"""
+    return hashlib.blake2b(canonicalize_url(url).encode('utf-8'), digest_size=8).digest()
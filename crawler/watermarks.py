@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+키워드별 수집 워터마크
+키워드마다 최근에 본 기사 링크와 가장 최신 다음 뉴스 기사 ID를 기록해
+증분 검색 시 이미 수집한 결과에 도달하면 페이지 탐색을 멈춤
+"""
+
+import json
+import os
+import re
+import threading
+from datetime import datetime
+
+# 다음 뉴스 기사 ID (예: v.daum.net/v/20240101120000123 → 작성 시각 기반 숫자)
+_DAUM_ARTICLE_ID = re.compile(r'^https://v\.daum\.net/v/(\d+)$')
+
+
+def article_id(link):
+    """정규화된 다음 뉴스 링크에서 기사 ID 추출 (없으면 None)"""
+    match = _DAUM_ARTICLE_ID.match(link or '')
+    return match.group(1) if match else None
+
+
+# 같은 파일을 쓰는 인스턴스끼리 공유하는 잠금 (실행마다 인스턴스를 따로 만들고, 취소된 실행의 작업 스레드가
+# 새 실행과 동시에 쓸 수 있음)
+_FILE_LOCKS = {}
+_FILE_LOCKS_GUARD = threading.Lock()
+
+
+def _file_lock(path):
+    with _FILE_LOCKS_GUARD:
+        return _FILE_LOCKS.setdefault(os.path.abspath(path), threading.Lock())
+
+
+class KeywordWatermarks:
+    def __init__(self, path="data/watermarks.json", max_links=300):
+        self.path = path
+        self.max_links = max_links  # 키워드별로 기억할 최근 링크 수
+        self._lock = _file_lock(path)
+        self._written = {}  # 이 인스턴스가 마지막으로 저장한 키워드별 워터마크
+        self._restored = set()  # restore 이후에는 더 쓰지 않는 키워드 (취소된 실행의 늦은 update 차단)
+        self.data = self._read()
+
+    def _read(self):
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                pass
+        return {}
+
+    def _key(self, keyword):
+        return keyword.strip().lower()
+
+    def is_known(self, keyword, link):
+        """이전 수집에서 이미 본 기사인지 확인"""
+        mark = self.data.get(self._key(keyword))
+        if not mark:
+            return False
+        if link in mark['links']:
+            return True
+        current_id = article_id(link)
+        newest_id = mark.get('newest_id')
+        # 기사 ID는 시각 순으로 증가하므로 워터마크 이하면 이미 지난 기사
+        return bool(current_id and newest_id and
+                    (len(current_id), current_id) <= (len(newest_id), newest_id))
+
+    def has_watermark(self, keyword):
+        return self._key(keyword) in self.data
+
+    def get(self, keyword):
+        """현재 워터마크 사본 (없으면 None), 작업 취소 시 restore로 되돌릴 때 사용"""
+        mark = self.data.get(self._key(keyword))
+        return json.loads(json.dumps(mark)) if mark else None
+
+    def restore(self, keyword, mark):
+        """get으로 받아 둔 상태로 워터마크 복원
+        파일의 워터마크가 이 인스턴스가 마지막으로 쓴 그대로일 때만 되돌림 (그사이 다른 실행이 갱신했으면 유지),
+        이후 이 인스턴스의 update는 무시"""
+        key = self._key(keyword)
+        with self._lock:
+            self._restored.add(key)
+            if key not in self._written:
+                return False
+            data = self._read()
+            if data.get(key) != self._written.pop(key):
+                return False
+            if mark is None:
+                data.pop(key, None)
+            else:
+                data[key] = mark
+            self._save(data)
+            self.data = data
+            return True
+
+    def update(self, keyword, links):
+        """새로 수집한 링크로 워터마크 갱신 후 저장 (파일을 다시 읽어 이 키워드만 변경)"""
+        key = self._key(keyword)
+        with self._lock:
+            if key in self._restored:
+                return
+            data = self._read()
+            mark = data.get(key, {'links': [], 'newest_id': None})
+
+            new_links = set(links)
+            merged = list(links) + [link for link in mark['links'] if link not in new_links]
+            mark['links'] = merged[:self.max_links]
+
+            ids = [article_id(link) for link in links]
+            ids = [i for i in ids if i]
+            if mark.get('newest_id'):
+                ids.append(mark['newest_id'])
+            if ids:
+                mark['newest_id'] = max(ids, key=lambda i: (len(i), i))
+
+            mark['updated_at'] = datetime.now().isoformat(timespec='seconds')
+            data[key] = mark
+            self._save(data)
+            self._written[key] = json.loads(json.dumps(mark))
+            self.data = data
+
+    def _save(self, data):
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        temp_path = self.path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.path)
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+키워드 문서 빈도(DF) 색인
+지금까지 수집한 기사마다 각 키워드가 나온 기사 수를 누적해 TF-IDF/BM25 키워드 순위에 사용
+- 새 기사만 더하면 되는 증분 색인 (이전 기사를 다시 읽지 않음)
+- 같은 기사(정규화 URL 기준)는 다시 수집해도 한 번만 셈
+- 압축 이진 형식으로 저장해 빠르게 불러옴 (헤더 + zlib(빈도 배열 + 기사 해시 + 단어 목록))
+"""
+
+import os
+import struct
+import sys
+import threading
+import zlib
+from array import array
+
+from crawler.url_utils import url_digest
+
+_MAGIC = b'KDF1'
+_HEADER = struct.Struct('<4sQQII')  # 형식 표시, 기사 수, 전체 단어 수, 단어 수, 기사 해시 수
+_DIGEST_SIZE = 8
+_SWAP = sys.byteorder == 'big'  # 빈도 배열은 항상 little-endian으로 저장
+
+
+class DocumentFrequencyIndex:
+    def __init__(self, path="data/keyword_df.bin"):
+        self.path = path
+        self._lock = threading.Lock()
+        self.doc_count = 0  # 색인한 기사 수
+        self.total_length = 0  # 색인한 기사의 키워드 수 합 (BM25 평균 기사 길이용)
+        self.df = {}  # 단어 → 그 단어가 나온 기사 수
+        self._doc_ids = set()  # 색인한 기사의 8바이트 URL 해시
+        self._dirty = False
+
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'rb') as f:
+                    self._load(f.read())
+            except (OSError, ValueError, struct.error, zlib.error):
+                print(f"⚠️ 키워드 색인을 읽을 수 없어 새로 만듭니다: {path}")
+                self.doc_count = self.total_length = 0
+                self.df = {}
+                self._doc_ids = set()
+
+    def __len__(self):
+        return self.doc_count
+
+    def __contains__(self, link):
+        return bool(link) and url_digest(link) in self._doc_ids
+
+    def _load(self, data):
+        magic, doc_count, total_length, term_count, id_count = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise ValueError("키워드 색인 형식이 아닙니다")
+        payload = zlib.decompress(data[_HEADER.size:])
+
+        counts = array('I')
+        counts.frombytes(payload[:term_count * counts.itemsize])
+        if _SWAP:
+            counts.byteswap()
+        offset = term_count * counts.itemsize
+        digests = payload[offset:offset + id_count * _DIGEST_SIZE]
+        offset += id_count * _DIGEST_SIZE
+        terms = payload[offset:].decode('utf-8').split('\n') if term_count else []
+        if len(terms) != term_count or len(digests) != id_count * _DIGEST_SIZE:
+            raise ValueError("키워드 색인이 손상되었습니다")
+
+        self.doc_count = doc_count
+        self.total_length = total_length
+        self.df = dict(zip(terms, counts))
+        self._doc_ids = {digests[i:i + _DIGEST_SIZE] for i in range(0, len(digests), _DIGEST_SIZE)}
+
+    def to_bytes(self):
+        with self._lock:
+            terms = list(self.df)
+            counts = array('I', (self.df[term] for term in terms))
+            if _SWAP:
+                counts.byteswap()
+            payload = counts.tobytes() + b''.join(self._doc_ids) + '\n'.join(terms).encode('utf-8')
+            header = _HEADER.pack(_MAGIC, self.doc_count, self.total_length, len(terms), len(self._doc_ids))
+        return header + zlib.compress(payload, 6)
+
+    def add(self, link, terms, length):
+        """기사 하나 색인 (terms: 기사에 나온 서로 다른 단어, length: 기사의 키워드 수)
+        이미 색인한 기사면 False (링크가 없으면 중복 확인 없이 색인)"""
+        digest = url_digest(link) if link else None
+        with self._lock:
+            if digest is not None:
+                if digest in self._doc_ids:
+                    return False
+                self._doc_ids.add(digest)
+            for term in terms:
+                self.df[term] = self.df.get(term, 0) + 1
+            self.doc_count += 1
+            self.total_length += length
+            self._dirty = True
+        return True
+
+    def save(self):
+        """바뀐 내용이 있으면 임시 파일에 쓴 뒤 교체"""
+        if not self.path or not self._dirty:
+            return
+        data = self.to_bytes()
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        temp_path = self.path + ".tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, self.path)
+        self._dirty = False
+
+    def get_stats(self):
+        return {
+            'documents': self.doc_count,
+            'terms': len(self.df),
+            'avg_length': round(self.total_length / self.doc_count, 1) if self.doc_count else 0.0,
+        }
+
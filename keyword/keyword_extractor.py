@@ -7,6 +7,7 @@ KoNLPy Okt를 사용한 명사 추출
 
 import re
 import json
+import math
 from collections import Counter
 
 class KeywordExtractor:
@@ -24,6 +25,10 @@ class KeywordExtractor:
             '서울', '경기', '인천', '부산', '대구', '광주', '대전', '울산', '세종',
             '한국', '우리나라', '국내', '전국', '지역', '지방', '수도권', '비수도권'
         }
+        
+        # BM25 파라미터 (기사 안 빈도 포화 정도, 기사 길이 보정 정도)
+        self.bm25_k1 = 1.2
+        self.bm25_b = 0.75
     
     def clean_text(self, text):
         """텍스트 전처리"""
@@ -63,59 +68,120 @@ class KeywordExtractor:
             print(f"❌ 키워드 추출 오류: {e}")
             return []
     
-    def get_keyword_frequency(self, texts, top_n=20):
-        """여러 텍스트에서 키워드 빈도 계산"""
-        all_nouns = []
-        
-        for text in texts:
-            nouns = self.extract_nouns(text)
-            all_nouns.extend(nouns)
-        
-        # 빈도 계산
-        counter = Counter(all_nouns)
-        
-        # 상위 N개 키워드 반환
-        top_keywords = counter.most_common(top_n)
-        
-        return top_keywords
+    def get_keyword_frequency(self, texts, top_n=20, ranking='count', df_index=None):
+        """여러 텍스트에서 키워드 빈도 계산 (ranking: 'count' 빈도순, 'tfidf'/'bm25'는 top_keywords 참고)"""
+        counters = [Counter(self.extract_nouns(text)) for text in texts]
+        return self.top_keywords(counters, top_n, ranking=ranking, df_index=df_index)
     
-    def extract_keywords_from_articles(self, articles, top_n=30):
-        """기사들에서 키워드 추출"""
+    def extract_keywords_from_articles(self, articles, top_n=30, blob_store=None, ranking='count', df_index=None):
+        """기사들에서 키워드 추출 (blob_store가 있으면 본문 저장소에서 전체 본문을 불러옴)"""
         print(f"🔍 기사에서 키워드 추출 중...")
         
         # 모든 텍스트 수집 (제목 + 요약 + 본문)
-        all_texts = []
-        
-        for article in articles:
-            # 제목
-            title = article.get('title', '')
-            # 요약 (AI 요약이 있으면 우선, 없으면 원본 요약)
-            summary = article.get('ai_summary', '') or article.get('summary', '')
-            # 본문
-            content = article.get('content', '')
-            
-            # 모든 텍스트 합치기
-            combined_text = f"{title} {summary} {content}"
-            all_texts.append(combined_text)
+        all_texts = [self.article_text(article, blob_store) for article in articles]
         
         # 키워드 빈도 계산
-        keywords = self.get_keyword_frequency(all_texts, top_n)
+        keywords = self.get_keyword_frequency(all_texts, top_n, ranking=ranking, df_index=df_index)
+        self.print_keywords(keywords)
+        return keywords
+    
+    def article_text(self, article, blob_store=None):
+        """키워드를 셀 기사 텍스트 (제목 + 요약 + 본문)"""
+        # 제목
+        title = article.get('title', '')
+        # 요약 (AI 요약이 있으면 우선, 없으면 원본 요약)
+        summary = article.get('ai_summary', '') or article.get('summary', '')
+        # 본문
+        content = blob_store.body(article) if blob_store else article.get('content', '')
         
+        # 모든 텍스트 합치기
+        return f"{title} {summary} {content}"
+    
+    def print_keywords(self, keywords):
         print(f"✅ 상위 {len(keywords)}개 키워드 추출 완료!")
         
         # 결과 출력
         print("\n📊 추출된 키워드:")
-        for i, (keyword, count) in enumerate(keywords, 1):
+        for i, (keyword, count, *_) in enumerate(keywords, 1):
             print(f"{i:2d}. {keyword} ({count}회)")
+    
+    def count_keywords_stream(self, articles, tally, blob_store=None):
+        """기사가 들어오는 대로 키워드 빈도를 세어 tally(링크 → Counter)에 기록하고 기사는 그대로 넘기는 제너레이터
+        현재까지의 상위 키워드는 언제든 top_keywords(tally.values())로 계산"""
+        for article in articles:
+            tally[article.get('link', '')] = Counter(self.extract_nouns(self.article_text(article, blob_store)))
+            yield article
+    
+    def index_keywords(self, df_index, counters, doc_ids=None):
+        """기사별 빈도를 문서 빈도 색인에 추가 (이미 색인한 기사는 doc_ids의 링크로 확인해 건너뜀)
+        TF-IDF/BM25 순위를 계산하기 전에 한 번 호출, 새로 색인한 기사 수 반환"""
+        added = 0
+        for index, counts in enumerate(counters):
+            if df_index.add(doc_ids[index] if doc_ids else None, counts.keys(), sum(counts.values())):
+                added += 1
+        return added
+    
+    def top_keywords(self, counters, top_n=30, ranking='count', df_index=None, with_scores=False):
+        """기사별 빈도를 합쳐 상위 키워드 계산 → [(단어, 빈도)] (순위 방식에 따른 점수순, with_scores=True면 [(단어, 빈도, 점수)])
+        - 'count': 전체 빈도순 (기사 순서대로 합치면 get_keyword_frequency와 같은 결과)
+        - 'tfidf': 빈도 × log(전체 기사 수 / 문서 빈도), 'bm25': 기사별 빈도를 기사 길이로 보정해 포화시킨 BM25 점수 합
+        모든 기사에 나오는 단어는 점수가 0에 가까워짐. 문서 빈도는 df_index(DocumentFrequencyIndex)에 쌓인 기사 기준
+        (색인은 바꾸지 않으므로 index_keywords로 먼저 추가), df_index가 없으면 주어진 기사만 기준"""
+        total = Counter()
+        if ranking == 'count':
+            for counts in counters:
+                total.update(counts)
+            if with_scores:
+                return [(word, count, count) for word, count in total.most_common(top_n)]
+            return total.most_common(top_n)
+        if ranking not in ('tfidf', 'bm25'):
+            raise ValueError(f"지원하지 않는 키워드 순위 방식: {ranking}")
         
-        return keywords
+        # 한 번 훑으며 빈도를 합침 (이전 기사는 색인 통계만 사용)
+        counters = list(counters)
+        batch_df = Counter()
+        for counts in counters:
+            total.update(counts)
+            if df_index is None:
+                batch_df.update(counts.keys())
+        if not total:
+            return []
+        
+        if df_index is None:
+            doc_count, df = len(counters), batch_df
+            avg_length = sum(total.values()) / doc_count
+        else:
+            doc_count, df = df_index.doc_count, df_index.df
+            avg_length = df_index.total_length / max(doc_count, 1)
+        
+        scores = Counter()
+        if ranking == 'tfidf':
+            for word, count in total.items():
+                frequency = min(max(df.get(word, 0), 1), max(doc_count, 1))
+                scores[word] = count * math.log(max(doc_count, 1) / frequency)
+        else:
+            k1, b = self.bm25_k1, self.bm25_b
+            for counts in counters:
+                norm = k1 * (1 - b + b * sum(counts.values()) / max(avg_length, 1e-9))
+                for word, count in counts.items():
+                    scores[word] += count * (k1 + 1) / (count + norm)
+            for word in scores:
+                frequency = min(df.get(word, 0), doc_count)
+                scores[word] *= math.log(1 + (doc_count - frequency + 0.5) / (frequency + 0.5))
+        
+        # 점수가 같으면 빈도가 높은 단어, 그다음 먼저 나온 단어 우선
+        position = {word: i for i, word in enumerate(total)}
+        ranked = sorted(total, key=lambda word: (-round(scores[word], 9), -total[word], position[word]))
+        if with_scores:
+            return [(word, total[word], round(scores[word], 4)) for word in ranked[:top_n]]
+        return [(word, total[word]) for word in ranked[:top_n]]
     
     def save_keywords(self, keywords, filename="keywords.json"):
-        """키워드를 JSON 파일로 저장"""
+        """키워드를 JSON 파일로 저장 (top_keywords(with_scores=True) 결과면 순위 점수도 'score'로 저장, 'count'는 항상 빈도)"""
         try:
             # 딕셔너리 형태로 변환
             keyword_dict = {
-                'keywords': [{'word': word, 'count': count} for word, count in keywords],
+                'keywords': [dict(zip(('word', 'count', 'score'), keyword)) for keyword in keywords],
                 'total_keywords': len(keywords)
             }
             
@@ -184,14 +184,16 @@ class WordCloudGenerator:
             print(f"❌ 워드클라우드 생성 오류: {e}")
             return None
     
-    def create_multiple_styles(self, keywords_file="data/keywords.json"):
-        """3가지 스타일의 워드클라우드 생성 (속도 최적화)"""
+    def create_multiple_styles(self, keywords_file="data/keywords.json", output_dir=None):
+        """3가지 스타일의 워드클라우드 생성 (속도 최적화, output_dir은 data 폴더 기준 하위 폴더)"""
         styles = ['default', 'dark', 'rainbow']
         
         print("🎨 3가지 스타일의 워드클라우드 생성 중...")
         
         for style in styles:
             output_file = f"wordcloud_{style}.png"
+            if output_dir:
+                output_file = os.path.join(output_dir, output_file)
             print(f"📸 {style} 스타일 생성 중...")
             
             wordcloud = self.create_from_keywords_file(
@@ -204,6 +204,22 @@ class NewsReportGenerator:
         
         self.pdf.ln(10)
     
+    def add_corpus_summary_section(self, corpus_summary):
+        """종합 요약 섹션 추가 (기사 전체에서 뽑은 핵심 문장)"""
+        self.pdf.set_font('Arial', 'B', 14)
+        self.pdf.cell(0, 10, 'Overall Summary', ln=True)
+        self.pdf.ln(5)
+        
+        for i, item in enumerate(corpus_summary, 1):
+            sentence = item['sentence']
+            sentence = sentence[:150] + '...' if len(sentence) > 150 else sentence
+            
+            # 문장과 출처 안전 출력
+            self.safe_text_output(f'{i}. {sentence}', font_size=10)
+            self.safe_text_output(f'   Source: {item.get("source") or "Unknown"}', font_size=9)
+        
+        self.pdf.ln(10)
+    
     def add_articles_section(self, articles):
         """기사 목록 섹션 추가"""
         self.pdf.set_font('Arial', 'B', 14)
@@ -247,8 +263,9 @@ class NewsReportGenerator:
             # 이미지 추가 (차트)
             self.pdf.image(chart_path, x=10, y=40, w=190)
     
-    def generate_report(self, keyword, articles, keywords_data, sentiment_stats=None, output_filename=None):
-        """전체 리포트 생성"""
+    def generate_report(self, keyword, articles, keywords_data, sentiment_stats=None, output_filename=None,
+                        corpus_summary=None):
+        """전체 리포트 생성 (corpus_summary: TextSummarizer.summarize_corpus 결과)"""
         if not output_filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_filename = f"news_report_{keyword}_{timestamp}.pdf"
@@ -262,6 +279,8 @@ class NewsReportGenerator:
             statistics.update(sentiment_stats)
         
         self.add_summary_section(statistics)
+        if corpus_summary:
+            self.add_corpus_summary_section(corpus_summary)
         self.add_keywords_section(keywords_data)
         self.add_articles_section(articles)
         
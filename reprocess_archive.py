@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+보관된 원본 HTML 재처리 스크립트
+data/archive에 저장된 검색 결과/기사 응답을 다시 크롤링하지 않고
+추출 → 요약 → 키워드 → 감성 분석 단계에 그대로 통과시킴
+
+사용법: python reprocess_archive.py [키워드] [--archive data/archive] [--max-articles N] [--ranking count|tfidf|bm25]
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import sys
+import time
+from urllib.parse import urlparse, parse_qs
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from crawler.archive import HtmlArchive
+from crawler.blob_store import ArticleBlobStore
+from crawler.daum_crawler import DaumNewsCrawler
+from crawler.url_utils import canonicalize_url
+from summarizer.text_summarizer import TextSummarizer
+from summarizer.summary_cache import SummaryCache
+from sentiment_analysis.sentiment import SentimentAnalyzer
+
+# keyword 모듈 충돌 방지를 위한 직접 import
+spec = importlib.util.spec_from_file_location("keyword_extractor",
+                                              os.path.join(current_dir, "keyword", "keyword_extractor.py"))
+keyword_extractor_module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(keyword_extractor_module)
+KeywordExtractor = keyword_extractor_module.KeywordExtractor
+
+spec = importlib.util.spec_from_file_location("df_index", os.path.join(current_dir, "keyword", "df_index.py"))
+df_index_module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(df_index_module)
+DocumentFrequencyIndex = df_index_module.DocumentFrequencyIndex
+
+
+def decode_record(crawler, record):
+    """보관된 응답 본문을 크롤러와 같은 방식으로 디코딩"""
+    domain = urlparse(record['url']).netloc
+    html = crawler.charset_resolver.decode_content(record['headers'], record['content'], domain,
+                                                   complete=not record['truncated'])
+    return html, domain
+
+
+def replay_articles(archive, crawler, keyword=None, max_articles=None):
+    """보관된 검색 결과 페이지에서 기사 목록을 만들고 본문을 보관소에서 추출"""
+    articles = []
+    seen_links = set()
+
+    for record in archive.iter_records(kind='search'):
+        if keyword and parse_qs(urlparse(record['url']).query).get('q', [None])[0] != keyword:
+            continue
+        html, domain = decode_record(crawler, record)
+        page_articles = crawler.parse_search_page(html, crawler.results_per_page, domain)
+        articles.extend(crawler._dedupe_articles(page_articles, seen_links))
+        if max_articles and len(articles) >= max_articles:
+            articles = articles[:max_articles]
+            break
+
+    missing = 0
+    for article in articles:
+        # 본문 수집 시 정규화된 URL로 요청하므로 정규화 URL을 먼저 조회
+        record = archive.lookup(canonicalize_url(article['link'])) or archive.lookup(article['link'])
+        if record is None:
+            article['content'] = ""
+            missing += 1
+            continue
+        html, domain = decode_record(crawler, record)
+        article['content'] = crawler.extract_content(html, domain)
+
+    if missing:
+        print(f"⚠️ 보관소에 본문이 없는 기사 {missing}개")
+    return articles
+
+
+def reprocess(keyword=None, archive_dir="data/archive", max_articles=None, ranking='count'):
+    """보관소 재처리 후 파이프라인과 같은 결과 파일 저장"""
+    started = time.perf_counter()
+    archive = HtmlArchive(archive_dir)
+    crawler = DaumNewsCrawler()  # 네트워크 요청 없이 추출기/문자셋 판별기만 사용
+
+    try:
+        articles = replay_articles(archive, crawler, keyword, max_articles)
+    finally:
+        crawler.close()
+        archive.close()
+
+    if not articles:
+        print("❌ 재처리할 기사가 없습니다.")
+        return False
+    print(f"📄 보관소에서 {len(articles)}개 기사 추출 ({time.perf_counter() - started:.2f}초)")
+
+    # 전체 본문은 압축 저장소로 옮기고 결과 파일에는 미리보기만 저장
+    blob_store = ArticleBlobStore()
+    articles = blob_store.detach(articles)
+    crawler.save_articles(articles)
+
+    summary_cache = SummaryCache()
+    summarizer = TextSummarizer(cache=summary_cache, workers=(os.cpu_count() or 1) if len(articles) >= 200 else 0)
+    summarized_articles = summarizer.summarize_articles(articles, method='simple', blob_store=blob_store)
+    corpus_summary = summarizer.summarize_corpus(articles, blob_store=blob_store)
+    summarizer.close()
+    summary_cache.close()
+    with open('data/summarized_articles.json', 'w', encoding='utf-8') as f:
+        json.dump(summarized_articles, f, ensure_ascii=False, indent=2)
+    with open('data/corpus_summary.json', 'w', encoding='utf-8') as f:
+        json.dump({'keyword': keyword, 'total_articles': len(articles), 'sentences': corpus_summary},
+                  f, ensure_ascii=False, indent=2)
+
+    extractor = KeywordExtractor()
+    keyword_tally = {}
+    for _ in extractor.count_keywords_stream(articles, keyword_tally, blob_store=blob_store):
+        pass
+    counters = [keyword_tally[article.get('link', '')] for article in articles]
+    df_index = None
+    if ranking != 'count':
+        df_index = DocumentFrequencyIndex()
+        extractor.index_keywords(df_index, counters, [article.get('link', '') for article in articles])
+        df_index.save()  # 이미 색인한 기사는 다시 세지 않음
+    keywords = extractor.top_keywords(counters, top_n=30, ranking=ranking, df_index=df_index, with_scores=True)
+    extractor.print_keywords(keywords)
+    extractor.save_keywords(keywords)
+
+    analyzer = SentimentAnalyzer()
+    analyzed_articles, _ = analyzer.analyze_articles(articles, blob_store=blob_store)
+    analyzer.save_sentiment_analysis(analyzed_articles)
+    blob_store.close()
+
+    print(f"✅ 재처리 완료! {len(articles)}개 기사, {len(keywords)}개 키워드 ({time.perf_counter() - started:.2f}초)")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="보관된 원본 HTML로 분석 파이프라인 재실행")
+    parser.add_argument('keyword', nargs='?', help="재처리할 검색 키워드 (생략하면 보관된 전체 검색 결과)")
+    parser.add_argument('--archive', default="data/archive", help="보관소 디렉토리")
+    parser.add_argument('--max-articles', type=int, default=None, help="재처리할 최대 기사 수")
+    parser.add_argument('--ranking', default='count', choices=['count', 'tfidf', 'bm25'], help="키워드 순위 방식")
+    args = parser.parse_args()
+
+    reprocess(args.keyword, args.archive, args.max_articles, args.ranking)
+
+
+if __name__ == "__main__":
+    main()
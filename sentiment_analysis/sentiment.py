@@ -81,32 +81,38 @@ class SentimentAnalyzer:
             'negative_count': negative_count
         }
     
-    def analyze_articles(self, articles):
-        """여러 기사의 감성 분석"""
+    def analyze_article(self, article, blob_store=None):
+        """기사 하나의 감성 분석 결과를 추가한 사본 반환"""
+        # 제목과 본문을 합쳐서 분석
+        title = article.get('title', '')
+        content = blob_store.body(article) if blob_store else article.get('content', '')
+        summary = article.get('summary', '')
+        
+        combined_text = f"{title} {summary} {content}"
+        
+        # 기사 정보에 감성 분석 결과 추가
+        article_with_sentiment = article.copy()
+        article_with_sentiment['sentiment'] = self.analyze_sentiment(combined_text)
+        return article_with_sentiment
+    
+    def analyze_articles(self, articles, blob_store=None):
+        """여러 기사의 감성 분석 (blob_store가 있으면 본문 저장소에서 전체 본문을 불러옴)"""
         results = []
         sentiment_summary = {'positive': 0, 'negative': 0, 'neutral': 0}
         
-        for article in articles:
-            # 제목과 본문을 합쳐서 분석
-            title = article.get('title', '')
-            content = article.get('content', '')
-            summary = article.get('summary', '')
-            
-            combined_text = f"{title} {summary} {content}"
-            
-            sentiment_result = self.analyze_sentiment(combined_text)
-            
-            # 기사 정보에 감성 분석 결과 추가
-            article_with_sentiment = article.copy()
-            article_with_sentiment['sentiment'] = sentiment_result
-            
+        for article_with_sentiment in self.analyze_stream(articles, blob_store):
             results.append(article_with_sentiment)
             
             # 전체 감성 요약 업데이트
-            sentiment_summary[sentiment_result['sentiment']] += 1
+            sentiment_summary[article_with_sentiment['sentiment']['sentiment']] += 1
         
         return results, sentiment_summary
     
+    def analyze_stream(self, articles, blob_store=None):
+        """기사가 들어오는 대로 감성 분석해 바로 넘기는 제너레이터 (앞 단계 제너레이터와 연결해 사용)"""
+        for article in articles:
+            yield self.analyze_article(article, blob_store)
+    
     def get_sentiment_statistics(self, analyzed_articles):
         """감성 분석 통계 생성"""
         if not analyzed_articles:
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+그래프 기반 요약 엔진 (NumPy/SciPy)
+여러 기사의 문장을 한 번에 문장-단어 희소 행렬로 만들고, 희소 행렬 곱으로 문장 유사도를 계산한 뒤
+거듭제곱법으로 TextRank/LexRank 점수를 구함
+- 단어 열을 (기사, 단어) 쌍마다 따로 두어 행렬 곱 한 번으로 기사별 유사도 블록만 계산
+- 모든 기사의 점수를 하나의 벡터로 묶어 함께 반복 계산 (기사 수만큼 반복하지 않음)
+- 같은 입력에는 항상 같은 요약 (점수가 같으면 앞 문장 우선)
+- select_corpus: 모든 기사를 하나의 문장 그래프로 묶은 기사 전체 종합 요약 (거의 같은 문장은 한 번만)
+"""
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+
+from summarizer.segmenter import split_sentences, tokenize
+
+
+class GraphRanker:
+    def __init__(self, method='textrank', damping=0.85, tolerance=1e-6, max_iterations=200,
+                 lexrank_threshold=0.1, corpus_threshold=0.2):
+        if method not in ('textrank', 'lexrank'):
+            raise ValueError(f"지원하지 않는 요약 방식: {method}")
+        self.method = method
+        self.damping = damping
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.lexrank_threshold = lexrank_threshold  # LexRank에서 간선으로 인정할 최소 코사인 유사도
+        self.corpus_threshold = corpus_threshold  # 종합 요약(LexRank) 그래프에서 간선으로 인정할 최소 코사인 유사도
+
+    def _term_matrix(self, documents):
+        """문장-단어 빈도 희소 행렬 (열은 기사별 단어), 문장별 기사 번호와 단어 수"""
+        vocabulary = {}
+        term_ids = []
+        token_counts = []
+        for sentences in documents:
+            for sentence in sentences:
+                ids = [vocabulary.setdefault(token, len(vocabulary)) for token in tokenize(sentence)]
+                term_ids.extend(ids)
+                token_counts.append(len(ids))
+
+        sentence_counts = np.array([len(sentences) for sentences in documents], dtype=np.int64)
+        doc_of = np.repeat(np.arange(len(documents)), sentence_counts)
+        token_counts = np.array(token_counts, dtype=np.int64)
+        token_rows = np.repeat(np.arange(len(token_counts)), token_counts)
+
+        # (기사, 단어) 쌍마다 열 하나 → 다른 기사 문장끼리는 곱이 항상 0
+        keys = doc_of[token_rows] * max(1, len(vocabulary)) + np.array(term_ids, dtype=np.int64)
+        columns, inverse = np.unique(keys, return_inverse=True)
+        tf = sparse.csr_matrix(
+            (np.ones(len(keys)), (token_rows, inverse.ravel())),
+            shape=(len(token_counts), len(columns))
+        )
+        column_docs = columns // max(1, len(vocabulary))
+        return tf, doc_of, token_counts, sentence_counts, column_docs
+
+    def _textrank_weights(self, tf, token_counts):
+        """겹치는 단어 수 / (log|Si| + log|Sj|)"""
+        binary = tf.copy()
+        binary.data[:] = 1.0
+        overlap = (binary @ binary.T).tocoo()
+        log_lengths = np.log(np.maximum(token_counts, 1))
+        denominator = log_lengths[overlap.row] + log_lengths[overlap.col]
+        weights = np.divide(overlap.data, denominator, out=np.zeros_like(overlap.data), where=denominator > 0)
+        return overlap.row, overlap.col, weights
+
+    def _unit_tfidf(self, tf, sentence_counts, column_docs):
+        """문장별 TF-IDF 벡터를 길이 1로 정규화 (행끼리 곱하면 코사인 유사도)"""
+        document_frequency = np.diff(tf.tocsc().indptr)
+        idf = np.log1p(sentence_counts[column_docs] / np.maximum(document_frequency, 1))
+        weighted = tf @ sparse.diags(idf)
+        norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1)).ravel())
+        return (sparse.diags(np.divide(1.0, norms, out=np.zeros_like(norms), where=norms > 0)) @ weighted).tocsr()
+
+    def _lexrank_weights(self, unit):
+        """길이 1로 정규화한 TF-IDF 벡터끼리 코사인 유사도가 임계값 이상이면 간선"""
+        similarity = (unit @ unit.T).tocoo()
+        edges = similarity.data >= self.lexrank_threshold
+        return similarity.row[edges], similarity.col[edges], np.ones(int(edges.sum()))
+
+    def _graph_scores(self, doc_of, sentence_counts, rows, cols, weights, prior=None, self_loops=False):
+        """간선 목록으로 전이 행렬을 만들고 거듭제곱법으로 문장 점수 계산
+        prior: 순간이동 확률 (없으면 기사 안 문장마다 같은 확률), self_loops: 자기 자신으로 가는 간선 유지"""
+        size = len(doc_of)
+        off_diagonal = np.ones(len(rows), dtype=bool) if self_loops else rows != cols
+        graph = sparse.csr_matrix(
+            (weights[off_diagonal], (rows[off_diagonal], cols[off_diagonal])), shape=(size, size)
+        )
+
+        # 행 정규화한 전이 행렬 (나가는 간선이 없는 문장의 점수는 같은 기사 문장에 순간이동 확률대로 분배)
+        out_weight = np.asarray(graph.sum(axis=1)).ravel()
+        dangling = out_weight == 0
+        inverse = np.divide(1.0, out_weight, out=np.zeros_like(out_weight), where=~dangling)
+        transition = (sparse.diags(inverse) @ graph).T.tocsr()
+
+        base = 1.0 / sentence_counts[doc_of].astype(float) if prior is None else prior
+        scores = base
+        teleport = (1.0 - self.damping) * base
+        for _ in range(self.max_iterations):
+            dangling_mass = np.bincount(doc_of, weights=scores * dangling, minlength=len(sentence_counts))
+            updated = teleport + self.damping * (transition @ scores + dangling_mass[doc_of] * base)
+            delta = np.abs(updated - scores).max()
+            scores = updated
+            if delta < self.tolerance:
+                break
+        return scores
+
+    def rank(self, documents):
+        """문장 리스트의 리스트 → 전체 문장 점수, 문장별 기사 번호"""
+        tf, doc_of, token_counts, sentence_counts, column_docs = self._term_matrix(documents)
+        if len(doc_of) == 0:
+            return np.zeros(0), doc_of
+
+        if self.method == 'textrank':
+            rows, cols, weights = self._textrank_weights(tf, token_counts)
+        else:
+            rows, cols, weights = self._lexrank_weights(self._unit_tfidf(tf, sentence_counts, column_docs))
+        return self._graph_scores(doc_of, sentence_counts, rows, cols, weights), doc_of
+
+    def select(self, documents, sentence_count=3):
+        """기사별 상위 문장을 원래 순서대로 반환 (문장 리스트의 리스트)"""
+        scores, doc_of = self.rank(documents)
+        selected = [[] for _ in documents]
+        if len(scores) == 0:
+            return selected
+
+        # 기사 → 점수 내림차순 → 문장 순서로 정렬해 기사별 상위 sentence_count개 선택
+        position = np.arange(len(scores))
+        order = np.lexsort((position, -np.round(scores, 12), doc_of))
+        doc_starts = np.concatenate(([0], np.cumsum([len(sentences) for sentences in documents])[:-1]))
+        rank = np.empty_like(position)
+        rank[order] = position - doc_starts[doc_of[order]]
+
+        flat = [sentence for sentences in documents for sentence in sentences]
+        for index in np.flatnonzero(rank < sentence_count):
+            selected[doc_of[index]].append(flat[index])
+        return selected
+
+    def summarize_batch(self, texts, sentence_count=3):
+        """여러 텍스트를 한 번에 요약 (문장 수가 sentence_count 이하면 원문 그대로)"""
+        summaries = list(texts)
+        targets = []
+        documents = []
+        for index, text in enumerate(texts):
+            sentences = split_sentences(text)
+            if len(sentences) > sentence_count:
+                targets.append(index)
+                documents.append(sentences)
+
+        for index, sentences in zip(targets, self.select(documents, sentence_count)):
+            summaries[index] = ' '.join(sentences)
+        return summaries
+
+    def select_corpus(self, documents, sentence_count=5, redundancy_threshold=0.5, max_term_ratio=0.05):
+        """모든 기사 문장을 하나의 그래프로 묶어 전체에서 상위 문장 선택 → [(기사 번호, 문장 번호)] (점수 순)
+        - 단어 사전과 유사도 계산을 기사 전체가 공유 (기사마다 따로 계산하지 않음)
+        - 코사인 유사도가 redundancy_threshold 이상인 거의 같은 문장은 한 묶음으로 합쳐 대표 문장 하나만 선택
+        - 여러 언론사가 실은 묶음일수록 순간이동 확률을 높여 점수 계산 (약한 연결만 많은 문장보다 우선)
+        - TextRank에서는 전체 문장의 max_term_ratio보다 많은 문장에 나오는 흔한 단어를 겹치는 단어 수에서 제외"""
+        flat = [sentence for sentences in documents for sentence in sentences]
+        if not flat:
+            return []
+        size = len(flat)
+        tf, doc_of, token_counts, sentence_counts, column_docs = self._term_matrix([flat])
+        doc_index = np.repeat(np.arange(len(documents)), [len(sentences) for sentences in documents])
+        doc_starts = np.concatenate(([0], np.cumsum([len(sentences) for sentences in documents])[:-1]))
+
+        # 거의 같은 문장 판별과 LexRank 유사도는 모든 단어 기준 코사인 유사도로 계산
+        # (여러 언론사가 반복한 문장은 그 단어 자체가 흔한 단어가 되므로 흔한 단어를 빼면 묶이지 않음)
+        unit = self._unit_tfidf(tf, sentence_counts, column_docs)
+        similarity = (unit @ unit.T).tocoo()
+
+        # 1. 거의 같은 문장 묶기 (연결 요소), 묶음 안에서 다른 문장과 가장 비슷한 문장이 대표
+        duplicate = similarity.data >= redundancy_threshold
+        duplicates = sparse.csr_matrix(
+            (similarity.data[duplicate], (similarity.row[duplicate], similarity.col[duplicate])), shape=(size, size)
+        )
+        cluster_count, labels = connected_components(duplicates, directed=False)
+        closeness = np.asarray(duplicates.sum(axis=1)).ravel()
+        order = np.lexsort((np.arange(size), -np.round(closeness, 12), labels))
+        first = np.ones(size, dtype=bool)
+        first[1:] = labels[order[1:]] != labels[order[:-1]]
+        representative = order[first]  # 묶음 번호 순
+
+        # 묶음별 기사 수 (같은 기사 안 반복은 한 번만)
+        pairs = np.unique(labels * len(documents) + doc_index)
+        support = np.bincount(pairs // len(documents), minlength=cluster_count).astype(float)
+
+        # 2. 문장 그래프를 묶음 그래프로 합쳐 점수 계산
+        if self.method == 'textrank':
+            # 흔한 단어는 거의 모든 문장을 서로 잇기만 하므로 겹치는 단어 수에서 제외
+            distinctive = np.diff(tf.tocsc().indptr) <= max(2, max_term_ratio * size)
+            rows, cols, weights = self._textrank_weights(tf[:, distinctive], token_counts)
+        else:
+            edges = similarity.data >= self.corpus_threshold
+            rows, cols, weights = similarity.row[edges], similarity.col[edges], similarity.data[edges]
+        # 묶음 사이 간선은 합치고, 묶음 안 문장끼리의 유사도는 자기 자신으로 가는 간선으로 남김
+        # (묶음으로 합쳤다고 서로 지지하던 연결이 사라지면 반복 문장이 고립된 문장처럼 낮게 평가됨)
+        between = labels[rows] != labels[cols]
+        membership = sparse.csr_matrix((np.ones(size), (np.arange(size), labels)), shape=(size, cluster_count))
+        sentence_graph = sparse.csr_matrix((weights[between], (rows[between], cols[between])), shape=(size, size))
+        duplicate_edges = duplicates.tocoo()
+        within = duplicate_edges.row != duplicate_edges.col
+        internal = np.bincount(labels[duplicate_edges.row[within]], weights=duplicate_edges.data[within],
+                               minlength=cluster_count)
+        cluster_graph = (membership.T @ sentence_graph @ membership + sparse.diags(internal)).tocoo()
+        scores = self._graph_scores(np.zeros(cluster_count, dtype=np.int64), np.array([cluster_count]),
+                                    cluster_graph.row, cluster_graph.col, cluster_graph.data,
+                                    prior=support / support.sum(), self_loops=True)
+
+        # 3. 점수 순 → 대표 문장 순서로 상위 묶음 선택 (단어가 없는 문장 제외)
+        ranked = np.lexsort((representative, -np.round(scores, 12)))
+        chosen = [representative[cluster] for cluster in ranked if token_counts[representative[cluster]] > 0]
+        return [(int(doc_index[i]), int(i - doc_starts[doc_index[i]])) for i in chosen[:sentence_count]]
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+한국어 문장 분리기
+미리 컴파일한 정규식으로 텍스트를 한 번 훑어 문장 위치(시작, 끝)만 반환 (문장 문자열을 복사하지 않음)
+- 마침표/물음표/느낌표 뒤 닫는 따옴표·괄호까지 한 문장으로 처리 ("...했다." 등)
+- 소수점(3.5), 영문 약어(U.S., Dr.), 이니셜(J.), 목록 번호(1.), 말줄임표(...)에서는 나누지 않음
+"""
+
+import re
+
+# 문장 끝 후보: 종결 부호 + 닫는 따옴표/괄호 + 뒤따르는 공백(또는 텍스트 끝)
+# 한글 바로 뒤 마침표("...했다.")는 확실한 문장 끝이라 그룹 1 없이 매칭 (추가 확인 생략)
+_BOUNDARY = re.compile(r'(?:(?<=[가-힣])\.|([.?!…]+))([\'"”’」』)\]]*)(?:\s+|$)')
+_NON_SPACE = re.compile(r'\S')
+_TRAILING_SPACE = re.compile(r'\s*$')
+
+# clean_text용: HTML 태그, [기자명] 등 대괄호, (괄호) 내용을 한 번에 제거
+_MARKUP = re.compile(r'<[^>]+>|\[.*?\]|\(.*?\)')
+
+# 2글자 이상 한글 단어(끝의 조사 제거) 또는 영문 단어
+_TOKEN = re.compile(
+    r'(?<![가-힣])([가-힣]{2,}?)(?:으로|에서|에게|까지|부터|보다|처럼|은|는|이|가|을|를|에|의|와|과|도|로|만)?(?![가-힣])'
+    r'|([A-Za-z]{2,})'
+)
+
+# 마침표가 붙어도 문장이 끝나지 않는 영문 약어 (소문자, 마지막 마침표 제외)
+ABBREVIATIONS = frozenset([
+    'mr', 'mrs', 'ms', 'dr', 'prof', 'sr', 'jr', 'st', 'vs', 'etc', 'inc', 'co', 'corp', 'ltd',
+    'no', 'vol', 'fig', 'approx', 'u.s', 'u.k', 'u.n', 'e.g', 'i.e', 'a.m', 'p.m', 'jan', 'feb',
+    'mar', 'apr', 'jun', 'jul', 'aug', 'sep', 'sept', 'oct', 'nov', 'dec'
+])
+
+_OPENING_PUNCTUATION = '(["\'“‘「『'
+
+
+def clean_text(text):
+    """HTML 태그/대괄호/괄호 내용 제거 후 연속 공백 정리"""
+    if not text:
+        return ""
+    return ' '.join(_MARKUP.sub('', text).split())
+
+
+def _is_boundary(text, start, match):
+    """종결 부호 후보가 실제 문장 끝인지 확인"""
+    terminator = match.group(1)
+    if terminator[0] == '…' or terminator.startswith('..'):
+        return False  # 말줄임표
+    if terminator != '.':
+        return True  # ? ! 는 항상 문장 끝
+
+    # 마침표 바로 앞 단어로 약어/이니셜/목록 번호 판별
+    word_start = max(start, text.rfind(' ', start, match.start()) + 1)
+    word = text[word_start:match.start()].lstrip(_OPENING_PUNCTUATION)
+    if not word:
+        return True
+    if word.lower() in ABBREVIATIONS:
+        return False
+    if len(word) == 1 and 'A' <= word <= 'Z':
+        return False  # 이니셜
+    if word.isdigit() and len(word) <= 2 and word_start == start:
+        return False  # 문장 첫머리의 목록 번호
+    return True
+
+
+def sentence_spans(text):
+    """문장별 (시작, 끝) 위치 목록 (앞뒤 공백 제외)"""
+    spans = []
+    if not text:
+        return spans
+
+    found = _NON_SPACE.search(text)
+    start = found.start() if found else len(text)
+    for match in _BOUNDARY.finditer(text):
+        end = match.end(2)
+        if end <= start or (match.group(1) is not None and not _is_boundary(text, start, match)):
+            continue
+        spans.append((start, end))
+        start = match.end()  # 뒤따르는 공백까지 매칭했으므로 다음 문장 시작
+
+    if start < len(text):
+        spans.append((start, _TRAILING_SPACE.search(text, start).start()))
+    return spans
+
+
+def split_sentences(text):
+    """문장 문자열 목록 (위치가 필요 없을 때)"""
+    return [text[start:end] for start, end in sentence_spans(text)]
+
+
+def count_sentences(text):
+    return len(sentence_spans(text))
+
+
+def tokenize(sentence):
+    """문장에서 단어 추출 (한글은 조사 제거, 영문은 소문자)"""
+    return [korean or english.lower() for korean, english in _TOKEN.findall(sentence)]
+
+
+class SentenceTokenizer:
+    """sumy PlaintextParser용 분리기 (형태소 분석기 없이 이 모듈의 규칙 사용)"""
+
+    def __init__(self, language='korean'):
+        self.language = language
+
+    def to_sentences(self, paragraph):
+        return split_sentences(paragraph)
+
+    def to_words(self, sentence):
+        return tokenize(sentence)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+요약 결과 캐시
+전처리된 본문 해시 + 요약 방식 + 문장 수 + 알고리즘 버전을 키로 요약문을 SQLite에 저장
+- 같은 본문은 다시 요약하지 않고 저장된 요약문 사용
+- 요약 알고리즘 버전이 바뀌면 이전 항목은 조회되지 않고 다음 실행 시 삭제
+- 전체 크기 제한을 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (LRU)
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+# 요약 알고리즘 버전 (graph_rank/segmenter 등 요약 결과가 달라지는 변경을 하면 올림)
+SUMMARY_VERSION = "1"
+
+
+class SummaryCache:
+    def __init__(self, path="data/summary_cache.sqlite3", version=SUMMARY_VERSION, max_bytes=50 * 1024 * 1024):
+        self.path = path
+        self.version = str(version)
+        self.max_bytes = max_bytes
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS summaries (
+                key TEXT PRIMARY KEY,
+                version TEXT,
+                summary TEXT,
+                size INTEGER,
+                last_access REAL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_summary_access ON summaries(last_access)")
+
+        # 다른 알고리즘 버전으로 만든 요약은 더 이상 쓰지 않으므로 정리
+        self._conn.execute("DELETE FROM summaries WHERE version != ?", (self.version,))
+        self._conn.commit()
+
+        self.total_size = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM summaries").fetchone()[0]
+        self.stats = {'hits': 0, 'misses': 0, 'stored': 0}
+
+    def make_key(self, cleaned_text, method, sentence_count):
+        """전처리된 본문 + 요약 방식 + 문장 수 + 버전 해시"""
+        digest = hashlib.sha1(f"{self.version}|{method}|{sentence_count}|".encode('utf-8'))
+        digest.update(cleaned_text.encode('utf-8'))
+        return digest.hexdigest()
+
+    def get_many(self, keys):
+        """저장된 요약문 조회 (키 → 요약문, 없는 키는 제외)"""
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        with self._lock:
+            # SQLite 변수 개수 제한을 넘지 않도록 나눠서 조회
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                found.update(self._conn.execute(
+                    f"SELECT key, summary FROM summaries WHERE key IN ({placeholders})", chunk
+                ).fetchall())
+
+            if found:
+                now = time.time()
+                self._conn.executemany("UPDATE summaries SET last_access = ? WHERE key = ?",
+                                       [(now, key) for key in found])
+                self._conn.commit()
+            self.stats['hits'] += len(found)
+            self.stats['misses'] += len(keys) - len(found)
+        return found
+
+    def put_many(self, summaries):
+        """요약문 저장 (키 → 요약문) 후 필요하면 LRU 정리"""
+        if not summaries:
+            return
+        now = time.time()
+        with self._lock:
+            for key, summary in summaries.items():
+                size = len(summary.encode('utf-8')) + len(key)
+                old = self._conn.execute("SELECT size FROM summaries WHERE key = ?", (key,)).fetchone()
+                if old:
+                    self.total_size -= old[0]
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO summaries VALUES (?, ?, ?, ?, ?)",
+                    (key, self.version, summary, size, now)
+                )
+                self.total_size += size
+            self.stats['stored'] += len(summaries)
+            self._evict_locked()
+            self._conn.commit()
+
+    def _evict_locked(self):
+        while self.total_size > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM summaries ORDER BY last_access LIMIT 50"
+            ).fetchall()
+            if not rows:
+                break
+            for key, size in rows:
+                self._conn.execute("DELETE FROM summaries WHERE key = ?", (key,))
+                self.total_size -= size
+                if self.total_size <= self.max_bytes:
+                    break
+
+    def get_stats(self):
+        """적중률 통계"""
+        with self._lock:
+            total = self.stats['hits'] + self.stats['misses']
+            return dict(self.stats, hit_ratio=round(self.stats['hits'] / total, 3) if total else 0.0,
+                        size_bytes=self.total_size)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -2,43 +2,82 @@
 # -*- coding: utf-8 -*-
 """
 텍스트 요약기
-sumy 라이브러리를 사용한 TextRank 기반 요약
+NumPy/SciPy 그래프 엔진(graph_rank)으로 TextRank/LexRank 요약 (미설치 시 sumy 사용)
+문장 분리는 모든 요약 방식이 segmenter 모듈을 공유
 """
 
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
 from sumy.parsers.plaintext import PlaintextParser
-from sumy.nlp.tokenizers import Tokenizer
 from sumy.summarizers.text_rank import TextRankSummarizer
 from sumy.summarizers.lex_rank import LexRankSummarizer
-import re
+
+from summarizer.segmenter import clean_text, count_sentences, sentence_spans, split_sentences, SentenceTokenizer
+
+try:
+    from summarizer.graph_rank import GraphRanker
+except ImportError:
+    GraphRanker = None  # NumPy/SciPy가 없으면 sumy 사용
 
 class TextSummarizer:
-    def __init__(self, language='korean'):
+    def __init__(self, language='korean', cache=None, workers=0, chunk_size=None):
         self.language = language
+        self.cache = cache  # SummaryCache (같은 본문은 다시 요약하지 않음)
+        
+        # 요약 작업자 프로세스 수 (0/1이면 현재 프로세스에서 처리), 작업자에 한 번에 넘길 기사 수
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        
         self.textrank_summarizer = TextRankSummarizer()
         self.lexrank_summarizer = LexRankSummarizer()
+        self.sentence_tokenizer = SentenceTokenizer(language)
+        
+        # 여러 기사를 한 번에 처리하는 그래프 요약 엔진
+        self.graph_rankers = {
+            'textrank': GraphRanker('textrank'),
+            'lexrank': GraphRanker('lexrank')
+        } if GraphRanker else {}
     
     def clean_text(self, text):
-        """텍스트 전처리"""
-        if not text:
-            return ""
-        
-        # HTML 태그 제거
-        text = re.sub(r'<[^>]+>', '', text)
-        
-        # 특수문자 정리
-        text = re.sub(r'\[.*?\]', '', text)  # [기자명] 등 제거
-        text = re.sub(r'\(.*?\)', '', text)  # (괄호) 내용 제거
-        
-        # 연속된 공백 정리
-        text = re.sub(r'\s+', ' ', text)
+        """텍스트 전처리 (HTML 태그, [기자명], (괄호) 내용 제거 및 공백 정리)"""
+        return clean_text(text)
+    
+    def engine_name(self, method):
+        """요약 캐시 키에 넣을 방식 이름 (같은 방식이라도 엔진이 다르면 결과가 다름)"""
+        if method in self.graph_rankers:
+            return f"{method}:graph"
+        if method in ('textrank', 'lexrank'):
+            return f"{method}:sumy"
+        return method
+    
+    def summarize_graph_batch(self, texts, method='textrank', sentence_count=3, raise_errors=False):
+        """여러 텍스트를 그래프 엔진으로 한 번에 요약 (100자 미만은 그대로 반환)"""
+        cleaned_texts = [self.clean_text(text) for text in texts]
+        summaries = list(cleaned_texts)
+        targets = [i for i, cleaned in enumerate(cleaned_texts) if len(cleaned) >= 100]
         
-        # 앞뒤 공백 제거
-        text = text.strip()
+        try:
+            ranked = self.graph_rankers[method].summarize_batch(
+                [cleaned_texts[i] for i in targets], sentence_count
+            )
+        except Exception as e:
+            if raise_errors:
+                raise
+            print(f"❌ {method} 일괄 요약 오류: {e}")
+            ranked = [cleaned_texts[i][:200] + "..." for i in targets]  # 실패시 앞부분만 반환
         
-        return text
+        for i, summary in zip(targets, ranked):
+            summaries[i] = summary
+        return summaries
     
     def summarize_textrank(self, text, sentence_count=3):
         """TextRank 알고리즘으로 요약"""
+        if self.graph_rankers:
+            return self.summarize_graph_batch([text], 'textrank', sentence_count)[0]
+        
         try:
             cleaned_text = self.clean_text(text)
             
@@ -46,11 +85,10 @@ class TextSummarizer:
                 return cleaned_text
             
             # 문장이 너무 적으면 sentence_count 조정
-            sentences = cleaned_text.split('.')
-            if len(sentences) <= sentence_count:
+            if count_sentences(cleaned_text) <= sentence_count:
                 return cleaned_text
             
-            parser = PlaintextParser.from_string(cleaned_text, Tokenizer(self.language))
+            parser = PlaintextParser.from_string(cleaned_text, self.sentence_tokenizer)
             summary = self.textrank_summarizer(parser.document, sentence_count)
             
             summary_text = ' '.join([str(sentence) for sentence in summary])
@@ -62,17 +100,19 @@ class TextSummarizer:
     
     def summarize_lexrank(self, text, sentence_count=3):
         """LexRank 알고리즘으로 요약"""
+        if self.graph_rankers:
+            return self.summarize_graph_batch([text], 'lexrank', sentence_count)[0]
+        
         try:
             cleaned_text = self.clean_text(text)
             
             if len(cleaned_text) < 100:
                 return cleaned_text
             
-            sentences = cleaned_text.split('.')
-            if len(sentences) <= sentence_count:
+            if count_sentences(cleaned_text) <= sentence_count:
                 return cleaned_text
             
-            parser = PlaintextParser.from_string(cleaned_text, Tokenizer(self.language))
+            parser = PlaintextParser.from_string(cleaned_text, self.sentence_tokenizer)
             summary = self.lexrank_summarizer(parser.document, sentence_count)
             
             summary_text = ' '.join([str(sentence) for sentence in summary])
@@ -89,37 +129,120 @@ class TextSummarizer:
         if len(cleaned_text) <= max_length:
             return cleaned_text
         
-        # 문장 단위로 자르기
-        sentences = cleaned_text.split('.')
-        summary = ""
+        # 문장 단위로 자르기 (max_length 안에 들어가는 마지막 문장까지)
+        end = 0
+        for _, sentence_end in sentence_spans(cleaned_text):
+            if sentence_end > max_length:
+                break
+            end = sentence_end
+        
+        return cleaned_text[:end]
+    
+    def summarize_texts(self, texts, method='textrank', sentence_count=3, progress_callback=None):
+        """여러 텍스트 요약 → (요약 목록, 캐시 저장 가능 여부). progress_callback(처리한 개수)"""
+        # 그래프 엔진은 모든 텍스트의 문장 그래프를 한 번에 계산
+        if method in self.graph_rankers:
+            try:
+                summaries = self.summarize_graph_batch(texts, method, sentence_count, raise_errors=True)
+                cacheable = True
+            except Exception as e:
+                print(f"❌ {method} 일괄 요약 오류: {e}")
+                summaries = [self.clean_text(text)[:200] + "..." for text in texts]
+                cacheable = False  # 실패시 대체 요약은 저장하지 않음
+            if progress_callback:
+                progress_callback(len(texts))
+            return summaries, cacheable
         
-        for sentence in sentences:
-            if len(summary + sentence) <= max_length:
-                summary += sentence + "."
+        summaries = []
+        for text in texts:
+            if method == 'textrank':
+                summaries.append(self.summarize_textrank(text, sentence_count))
+            elif method == 'lexrank':
+                summaries.append(self.summarize_lexrank(text, sentence_count))
             else:
-                break
+                summaries.append(self.summarize_simple(text))
+            if progress_callback:
+                progress_callback(1)
+        return summaries, True
+    
+    def _get_pool(self):
+        """요약 작업자 프로세스 풀 (처음 사용할 때 생성)"""
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=init_worker,
+                                                 initargs=(self.language,))
+            return self._pool
+    
+    def _summarize_parallel(self, texts, method, sentence_count, progress_callback=None):
+        """텍스트를 묶음으로 나눠 작업자 프로세스에서 요약 (입력 순서 유지)"""
+        # 작업자당 4묶음 정도로 나눠 느린 묶음이 있어도 다른 작업자가 나머지를 처리
+        chunk_size = self.chunk_size or max(1, -(-len(texts) // (self.workers * 4)))
+        pool = self._get_pool()
+        futures = {
+            pool.submit(summarize_chunk_worker, texts[start:start + chunk_size], method, sentence_count): start
+            for start in range(0, len(texts), chunk_size)
+        }
         
-        return summary.strip()
+        summaries = [None] * len(texts)
+        cacheable = True
+        for future in as_completed(futures):
+            start = futures[future]
+            chunk_summaries, chunk_cacheable = future.result()
+            summaries[start:start + len(chunk_summaries)] = chunk_summaries
+            cacheable = cacheable and chunk_cacheable
+            if progress_callback:
+                progress_callback(len(chunk_summaries))
+        return summaries, cacheable
+    
+    def _article_text(self, article, blob_store=None):
+        """요약할 텍스트 (본문이 있으면 본문을, 없으면 요약을 사용)"""
+        content = blob_store.body(article) if blob_store else article.get('content', '')
+        return content or article.get('summary', '')
     
-    def summarize_articles(self, articles, method='textrank', sentence_count=3):
-        """여러 기사를 요약"""
+    def summarize_articles(self, articles, method='textrank', sentence_count=3, blob_store=None,
+                           progress_callback=None):
+        """여러 기사를 요약 (blob_store가 있으면 본문 저장소에서 전체 본문을 불러옴)
+        progress_callback(완료한 기사 수, 전체 기사 수)로 진행 상황 전달, workers가 2 이상이면 프로세스 풀 사용"""
         print(f"📝 {method} 방식으로 기사 요약 중...")
         
         summarized_articles = []
+        texts = [self._article_text(article, blob_store) for article in articles]
         
-        for i, article in enumerate(articles, 1):
-            print(f"📄 {i}/{len(articles)}: {article['title'][:30]}... 요약 중")
-            
-            # 본문이 있으면 본문을, 없으면 요약을 사용
-            text_to_summarize = article.get('content', '') or article.get('summary', '')
-            
-            if method == 'textrank':
-                summary = self.summarize_textrank(text_to_summarize, sentence_count)
-            elif method == 'lexrank':
-                summary = self.summarize_lexrank(text_to_summarize, sentence_count)
-            else:
-                summary = self.summarize_simple(text_to_summarize)
-            
+        # 전처리 결과가 같은 본문은 캐시된 요약 사용
+        summaries = [None] * len(articles)
+        keys = None
+        if self.cache is not None:
+            engine = self.engine_name(method)
+            keys = [self.cache.make_key(self.clean_text(text), engine, sentence_count) for text in texts]
+            cached = self.cache.get_many(keys)
+            for i, key in enumerate(keys):
+                summaries[i] = cached.get(key)
+            reused = sum(1 for summary in summaries if summary is not None)
+            if reused:
+                print(f"♻️ 캐시된 요약 {reused}개 재사용")
+        pending = [i for i, summary in enumerate(summaries) if summary is None]
+        
+        done = len(articles) - len(pending)
+        
+        def report(count):
+            nonlocal done
+            done += count
+            if progress_callback:
+                progress_callback(done, len(articles))
+        
+        report(0)
+        pending_texts = [texts[i] for i in pending]
+        if self.workers > 1 and len(pending) > 1:
+            pending_summaries, cacheable = self._summarize_parallel(pending_texts, method, sentence_count, report)
+        else:
+            pending_summaries, cacheable = self.summarize_texts(pending_texts, method, sentence_count, report)
+        for i, summary in zip(pending, pending_summaries):
+            summaries[i] = summary
+        
+        if keys is not None and cacheable:
+            self.cache.put_many({keys[i]: summaries[i] for i in pending})
+        
+        for article, summary in zip(articles, summaries):
             # 기사 정보에 요약 추가
             article_copy = article.copy()
             article_copy['ai_summary'] = summary
@@ -127,6 +250,83 @@ class TextSummarizer:
         
         print(f"✅ {len(summarized_articles)}개 기사 요약 완료!")
         return summarized_articles
+    
+    def summarize_stream(self, articles, method='textrank', sentence_count=3, blob_store=None):
+        """기사가 들어오는 대로 하나씩 요약해 바로 넘기는 제너레이터 (본문 수집 등 앞 단계와 연결해 사용)
+        결과는 summarize_articles와 같고 요약 캐시도 그대로 사용"""
+        engine = self.engine_name(method)
+        for article in articles:
+            text = self._article_text(article, blob_store)
+            key = None
+            summary = None
+            if self.cache is not None:
+                key = self.cache.make_key(self.clean_text(text), engine, sentence_count)
+                summary = self.cache.get_many([key]).get(key)
+            if summary is None:
+                summaries, cacheable = self.summarize_texts([text], method, sentence_count)
+                summary = summaries[0]
+                if key is not None and cacheable:
+                    self.cache.put_many({key: summary})
+            
+            article_copy = article.copy()
+            article_copy['ai_summary'] = summary
+            yield article_copy
+    
+    def summarize_corpus(self, articles, method='lexrank', sentence_count=5, blob_store=None):
+        """기사 전체를 하나의 문장 그래프로 묶어 종합 요약 (여러 언론사가 반복한 문장은 한 번만 포함)
+        반환: [{'sentence', 'title', 'link', 'source'}] (중요도 순)"""
+        if method not in self.graph_rankers:
+            print("⚠️ 그래프 요약 엔진(NumPy/SciPy)이 없어 종합 요약을 건너뜁니다.")
+            return []
+        
+        print(f"🧾 {len(articles)}개 기사 종합 요약 중...")
+        documents = []
+        for article in articles:
+            content = blob_store.body(article) if blob_store else article.get('content', '')
+            documents.append(split_sentences(self.clean_text(content or article.get('summary', ''))))
+        
+        try:
+            picks = self.graph_rankers[method].select_corpus(documents, sentence_count)
+        except Exception as e:
+            print(f"❌ 종합 요약 오류: {e}")
+            return []
+        
+        corpus_summary = []
+        for doc_index, sentence_index in picks:
+            article = articles[doc_index]
+            corpus_summary.append({
+                'sentence': documents[doc_index][sentence_index],
+                'title': article.get('title', ''),
+                'link': article.get('link', ''),
+                'source': article.get('source', '')
+            })
+        
+        print(f"✅ 종합 요약 {len(corpus_summary)}문장 완료!")
+        return corpus_summary
+    
+    def close(self):
+        """요약 작업자 프로세스 정리"""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+
+# 프로세스 풀 작업자용 함수 (작업자마다 자체 요약기를 한 번만 만들어 재사용)
+_worker_summarizer = None
+
+
+def init_worker(language='korean'):
+    """요약 작업자 프로세스 초기화"""
+    global _worker_summarizer
+    _worker_summarizer = TextSummarizer(language)
+
+
+def summarize_chunk_worker(texts, method, sentence_count):
+    """작업자 프로세스에서 텍스트 묶음 요약"""
+    if _worker_summarizer is None:
+        init_worker()
+    return _worker_summarizer.summarize_texts(texts, method, sentence_count)
 
 if __name__ == "__main__":
     # 개발용 테스트 코드
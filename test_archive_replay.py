@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+원본 HTML 보관소 테스트
+저장 → 다시 열기 → URL 조회 / 전체 재생이 같은 응답을 돌려주는지, 쓰다 끊긴 레코드는 건너뛰는지,
+재생 시간이 세그먼트 크기에 비례하는지 확인
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from crawler.archive import HtmlArchive
+
+print("🧪 보관소 저장/재생 테스트 시작...")
+failures = 0
+
+
+def check(condition, message):
+    global failures
+    print(f"{'✅' if condition else '❌'} {message}")
+    if not condition:
+        failures += 1
+
+
+def fill(archive, count, start=0):
+    for i in range(start, start + count):
+        kind = 'search' if i % 10 == 0 else 'article'
+        body = f"<html><body><p>기사 {i} 본문</p></body></html>".encode('utf-8') + os.urandom(800)
+        archive.store(f"https://news.example.com/{i}", None, kind, 200,
+                      {'Content-Type': 'text/html; charset=utf-8'}, body, reason='OK', truncated=(i == 3))
+
+
+with tempfile.TemporaryDirectory() as directory:
+    # 1. 저장 후 다시 열어 조회
+    archive = HtmlArchive(directory, segment_max_bytes=256 * 1024)  # 작은 세그먼트로 여러 파일에 나눠 저장
+    fill(archive, 500)
+    archive.close()
+
+    archive = HtmlArchive(directory, segment_max_bytes=256 * 1024)
+    stats = archive.get_stats()
+    check(stats['segments'] > 1 and stats['indexed'] == 500, f"세그먼트 {stats['segments']}개, 색인 {stats['indexed']}개")
+    record = archive.lookup("https://news.example.com/42")
+    check(record is not None and "기사 42 본문".encode('utf-8') in record['content'], "URL 조회로 원본 본문 복원")
+    check(record['headers']['Content-Type'] == 'text/html; charset=utf-8', "응답 헤더 복원")
+    check(archive.lookup("https://news.example.com/3")['truncated'], "잘린 응답 표시 유지")
+    check(archive.lookup("https://news.example.com/missing") is None, "없는 URL은 None")
+
+    # 2. 전체 재생: 저장 순서 그대로, 종류별 필터
+    urls = [record['url'] for record in archive.iter_records()]
+    check(urls == [f"https://news.example.com/{i}" for i in range(500)], "저장 순서대로 500개 재생")
+    check(len(list(archive.iter_records(kind='search'))) == 50, "검색 결과 레코드만 재생")
+
+    # 3. 쓰다 끊긴 마지막 레코드는 건너뜀
+    fill(archive, 1, start=500)
+    last = archive._segment_path(archive.segment)
+    archive.close()
+    with open(last, 'ab') as f:
+        f.write(b'\x1f\x8b\x08\x00broken')
+    archive = HtmlArchive(directory, segment_max_bytes=256 * 1024)
+    urls = [record['url'] for record in archive.iter_records()]
+    check(len(urls) == 501 and urls[-1] == "https://news.example.com/500", "끊긴 레코드 앞까지 재생")
+    archive.close()
+
+    # 4. 재생 시간이 레코드 수에 비례 (레코드 수를 4배로 늘려도 시간은 대략 4배)
+    timings = []
+    for count in (1500, 6000):
+        path = os.path.join(directory, f"scale-{count}")
+        archive = HtmlArchive(path)
+        fill(archive, count)
+        started = time.perf_counter()
+        replayed = sum(1 for _ in archive.iter_records())
+        timings.append(time.perf_counter() - started)
+        archive.close()
+        check(replayed == count, f"{count}개 재생 {timings[-1]:.2f}초")
+    check(timings[1] < timings[0] * 8, f"재생 시간 증가율 {timings[1] / timings[0]:.1f}배 (선형이면 약 4배)")
+
+print(f"\n🎉 테스트 완료! 실패 {failures}건")
+sys.exit(1 if failures else 0)
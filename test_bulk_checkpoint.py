@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+대량 수집 체크포인트 테스트
+검색 페이지 요청이 실패하면 완료로 기록하지 않고, 다시 실행하면 실패한 페이지부터 이어서 수집하는지 확인
+(네트워크 없이 검색/본문 수집 메서드를 가짜로 바꿔 실행)
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from crawler.bulk_sink import BulkCheckpoint
+from crawler.daum_crawler import DaumNewsCrawler
+
+print("🧪 대량 수집 체크포인트 테스트 시작...")
+failures = 0
+
+
+def check(condition, message):
+    global failures
+    print(f"{'✅' if condition else '❌'} {message}")
+    if not condition:
+        failures += 1
+
+
+def make_crawler(fail_pages, total_pages=3):
+    """fail_pages에 든 페이지는 요청 오류, total_pages 이후는 정상 응답에 결과 없음"""
+    crawler = DaumNewsCrawler()
+    requested = []
+
+    def fake_search_page(params, max_articles_for_page):
+        page = int(params.get('p', 1))
+        requested.append(page)
+        if page in fail_pages:
+            raise ConnectionError(f"{page}페이지 연결 끊김")
+        if page > total_pages:
+            return []
+        # 추적 파라미터가 붙은 링크 (저장할 때 정규화되어야 함)
+        return [{'title': f"{page}-{i}", 'link': f"https://v.daum.net/v/2024010{page}00000{i}?utm_source=test"}
+                for i in range(2)]
+
+    crawler._fetch_search_page = fake_search_page
+    crawler.get_article_contents = lambda urls: ["본문"] * len(urls)
+    return crawler, requested
+
+
+with tempfile.TemporaryDirectory() as directory:
+    sink_path = os.path.join(directory, "bulk.jsonl")
+
+    # 1. 2페이지가 계속 실패 → 재시도 후 완료 표시 없이 중단
+    crawler, requested = make_crawler(fail_pages={2})
+    result = crawler.crawl_bulk("테스트", sink_path=sink_path, page_retries=2, retry_delay=0)
+    crawler.close()
+    check(not result['complete'], "요청 실패 시 완료로 기록하지 않음")
+    check(result['error'] is not None, f"실패 원인 반환: {result['error']}")
+    check(requested.count(2) == 3, f"실패한 페이지 재시도 (요청 {requested.count(2)}회)")
+    state = BulkCheckpoint(sink_path + ".checkpoint").state
+    check(state['next_page'] == 2 and not state['complete'], f"체크포인트는 2페이지부터: {state}")
+
+    # 2. 다시 실행 → 2페이지부터 끝까지, 결과 없는 정상 응답에서만 완료
+    crawler, requested = make_crawler(fail_pages=set())
+    result = crawler.crawl_bulk("테스트", sink_path=sink_path, retry_delay=0)
+    crawler.close()
+    check(requested[0] == 2, f"실패한 페이지부터 이어서 수집 (요청 순서 {requested})")
+    check(result['complete'] and result['articles_written'] == 6, f"끝까지 수집: {result['articles_written']}개")
+
+    with open(sink_path, 'r', encoding='utf-8') as f:
+        links = [json.loads(line)['link'] for line in f]
+    check(len(links) == len(set(links)) == 6, "중복 없이 6개 기사 기록")
+    check(all('utm_source' not in link for link in links), "정규화된 링크로 기록")
+
+print(f"\n🎉 테스트 완료! 실패 {failures}건")
+sys.exit(1 if failures else 0)
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+문자셋 판별 순서 테스트
+HTTP 헤더 → <meta charset> → 호스트별 학습 결과 → UTF-8 검사(앞부분만) → 전체 감지 순으로 판별하는지,
+판별 중 디코딩한 결과를 다시 디코딩하지 않고 쓰는지 확인
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from crawler.charset import CharsetResolver
+
+print("🧪 문자셋 판별 순서 테스트 시작...")
+failures = 0
+
+
+def check(condition, message):
+    global failures
+    print(f"{'✅' if condition else '❌'} {message}")
+    if not condition:
+        failures += 1
+
+
+TEXT = "정부는 내년 경제성장률 전망치를 하향 조정했다고 밝혔다. " * 50
+UTF8_PAGE = f"<html><body><p>{TEXT}</p></body></html>".encode('utf-8')
+CP949_PAGE = f"<html><body><p>{TEXT}</p></body></html>".encode('cp949')
+META_CP949 = b'<html><head><meta charset="euc-kr"></head><body>' + TEXT.encode('cp949') + b'</body></html>'
+HEADER_UTF8 = {'Content-Type': 'text/html; charset=UTF-8'}
+
+# 1. 헤더가 meta보다, meta가 호스트 학습보다 우선
+resolver = CharsetResolver()
+check(resolver.resolve(HEADER_UTF8, META_CP949, 'a.example.com') == ('utf-8', 'header'), "헤더가 meta보다 우선")
+resolver.host_encodings['b.example.com'] = 'utf-8'
+check(resolver.resolve({}, META_CP949, 'b.example.com') == ('cp949', 'meta'), "meta가 호스트 학습보다 우선")
+
+# 2. 호스트 학습 결과는 UTF-8 검사보다 먼저 (학습한 호스트는 검사 없이 바로 사용)
+resolver = CharsetResolver()
+check(resolver.resolve({}, UTF8_PAGE, 'c.example.com') == ('utf-8', 'utf-8'), "처음 본 호스트는 UTF-8 검사")
+check(resolver.resolve({}, UTF8_PAGE, 'c.example.com') == ('utf-8', 'host'), "두 번째부터는 호스트 학습 결과")
+resolver.host_encodings['d.example.com'] = 'cp949'
+check(resolver.resolve({}, UTF8_PAGE, 'd.example.com') == ('cp949', 'host'), "호스트 학습 결과가 UTF-8 검사보다 우선")
+
+# 3. UTF-8 검사는 앞부분만: 검사 범위 뒤의 잘못된 바이트는 보지 않음, 범위 경계에 걸친 글자는 허용
+resolver = CharsetResolver(validate_bytes=1024)
+tail_broken = UTF8_PAGE[:4096] + b'\xff\xfe' + UTF8_PAGE[4096:]
+check(resolver.resolve({}, tail_broken) == ('utf-8', 'utf-8'), "검사 범위 밖의 바이트는 읽지 않음")
+split = next(size for size in range(1000, 1100) if (UTF8_PAGE[size] & 0xC0) == 0x80)
+check(CharsetResolver(validate_bytes=split).resolve({}, UTF8_PAGE)[0] == 'utf-8', "경계에서 잘린 글자는 실패로 보지 않음")
+check(resolver.resolve({}, b'\xff\xfe' + UTF8_PAGE)[1] != 'utf-8', "앞부분이 UTF-8이 아니면 감지로 넘어감")
+
+# 4. 레거시 인코딩은 감지 후 호스트에 학습
+resolver = CharsetResolver()
+encoding, source = resolver.resolve({}, CP949_PAGE, 'e.example.com')
+check(source == 'detect' and CP949_PAGE.decode(encoding, errors='replace') == CP949_PAGE.decode('cp949'),
+      f"UTF-8이 아니면 감지: {encoding}")
+check(resolver.resolve({}, CP949_PAGE, 'e.example.com')[1] == 'host', "감지 결과를 호스트에 학습")
+
+# 5. 디코딩 결과와 통계
+resolver = CharsetResolver()
+check(resolver.decode_content({}, UTF8_PAGE) == UTF8_PAGE.decode('utf-8'), "UTF-8 검사 중 디코딩한 결과 그대로 사용")
+check(resolver.decode_content({}, CP949_PAGE) == CP949_PAGE.decode('cp949'), "감지한 인코딩으로 디코딩")
+check(resolver.stats == {'header': 0, 'meta': 0, 'host': 0, 'utf-8': 1, 'detect': 1}, f"판별 방법별 통계: {resolver.stats}")
+
+print(f"\n🎉 테스트 완료! 실패 {failures}건")
+sys.exit(1 if failures else 0)
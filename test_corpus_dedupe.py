@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+기사 전체 종합 요약 중복 제거 테스트
+여러 언론사가 거의 그대로 실은 문장이 한 번만, 그리고 여러 기사의 지지를 받아 앞 순위로 뽑히는지 확인
+(기사 수가 적어 반복 문장의 단어가 흔한 단어 기준을 넘는 경우 포함)
+"""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from summarizer.graph_rank import GraphRanker
+
+print("🧪 종합 요약 중복 제거 테스트 시작...")
+failures = 0
+
+
+def check(condition, message):
+    global failures
+    print(f"{'✅' if condition else '❌'} {message}")
+    if not condition:
+        failures += 1
+
+
+SYLLABLES = '가나다라마바사아자차카타파하거너더러머버서어저처커터퍼허고노도로모보소오조초코토포호'
+SHARED = "정부는 내년 경제성장률 전망치를 2.1%로 하향 조정했다고 밝혔다."
+VARIANT = "정부는 내년 경제성장률 전망치를 2.1%로 하향 조정했다고 11일 밝혔다."
+
+random.seed(7)
+
+
+def filler():
+    return ' '.join(''.join(random.choice(SYLLABLES) for _ in range(3)) for _ in range(7)) + " 설명했다."
+
+
+# 기사 10개 × 5문장, 6개 기사에 같은 문장 (2개는 날짜만 붙은 변형)
+documents = []
+for index in range(10):
+    sentences = [filler() for _ in range(5)]
+    if index < 4:
+        sentences[2] = SHARED
+    elif index < 6:
+        sentences[3] = VARIANT
+    documents.append(sentences)
+
+for method in ('lexrank', 'textrank'):
+    ranker = GraphRanker(method=method)
+    picks = ranker.select_corpus(documents, sentence_count=5)
+    texts = [documents[doc][sentence] for doc, sentence in picks]
+    repeated = [text for text in texts if text in (SHARED, VARIANT)]
+
+    check(len(picks) == 5, f"{method}: 5문장 선택")
+    check(len(repeated) == 1, f"{method}: 반복 문장과 변형은 한 번만 포함 ({len(repeated)}회)")
+    check(bool(texts) and texts[0] in (SHARED, VARIANT), f"{method}: 6개 기사가 실은 문장이 1순위")
+    check(ranker.select_corpus(documents, sentence_count=5) == picks, f"{method}: 같은 입력에 같은 결과")
+
+print(f"\n🎉 테스트 완료! 실패 {failures}건")
+sys.exit(1 if failures else 0)